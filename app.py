@@ -103,7 +103,8 @@ _DEFAULT_EXCLUDE_CELEB = [
 ]
 
 from src.config import Config, get_config
-from src.fetcher import InstagramFetcher, validate_fetch_quality
+from src.fetcher import validate_fetch_quality
+from src.async_fetcher import fetch_instagram_data_async
 from src.analyzer import InstagramAnalyzer
 from src.sheets import SheetsReporter
 from src.mailer import GmailSender
@@ -452,8 +453,8 @@ if run_button:
         with st.status("리포트 생성 중...", expanded=True) as status:
             # 1. 데이터 수집
             st.write("📥 인스타그램 데이터 수집 중...")
-            fetcher = InstagramFetcher(config)
-            data = fetcher.fetch_all()
+            # 프로필/포스트 청크/데이터셋 페이지를 하나의 이벤트 루프에서 동시 수집
+            data = fetch_instagram_data_async(config)
             st.write(f"✅ {len(data['posts'])}개 콘텐츠 수집 완료")
 
             # 1-b. 데이터 품질 검증
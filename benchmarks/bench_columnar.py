@@ -0,0 +1,69 @@
+"""컬럼형 분석 백엔드 벤치마크
+
+합성 포스트(synthetic.py) 10만/100만 개로 InstagramAnalyzer.analyze를 파이썬 엔진과 numpy 엔진으로 실행해
+소요 시간과 결과 동일 여부를 비교합니다.
+
+사용법:
+    python benchmarks/bench_columnar.py
+    python benchmarks/bench_columnar.py --sizes 10000 100000
+"""
+import argparse
+import contextlib
+import dataclasses
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analyzer import InstagramAnalyzer  # noqa: E402
+from src.config import AnalysisConfig, Config, ScraperConfig  # noqa: E402
+from src.schema import PostRecord  # noqa: E402
+from synthetic import iter_posts  # noqa: E402
+
+
+def make_posts(n: int, seed: int = 42):
+    """합성 포스트 n개 (수집기처럼 PostRecord로 변환)"""
+    return [PostRecord.from_item(item) for item in iter_posts(n, seed)]
+
+
+def run(posts, engine: str, workers: int = 1):
+    config = Config(
+        apify_token="",
+        accounts=[],
+        analysis=AnalysisConfig(engine=engine, workers=workers),
+        scraper=ScraperConfig(),
+        email_recipients=[],
+        google_config_path="",
+        gmail_token_key="",
+        sheets_token_key="",
+    )
+    analyzer = InstagramAnalyzer(config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        result = analyzer.analyze({"posts": posts, "metadata": {}})
+        elapsed = time.perf_counter() - started
+    key = tuple(
+        [dataclasses.astuple(item) for item in getattr(result, name)]
+        for name in ("top_hashtags", "top_viral", "outliers", "tag_pairs", "tag_clusters")
+    )
+    return elapsed, key
+
+
+def main():
+    parser = argparse.ArgumentParser(description="컬럼형 분석 백엔드 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'포스트':>10} | {'python':>9} | {'numpy':>9} | {'배속':>6} | 결과 동일")
+    print("-" * 56)
+    for n in args.sizes:
+        posts = make_posts(n)
+        py_time, py_key = run(posts, "python")
+        np_time, np_key = run(posts, "numpy")
+        print(f"{n:>10,} | {py_time:>8.2f}s | {np_time:>8.2f}s | {py_time / np_time:>5.2f}x | {py_key == np_key}")
+
+
+if __name__ == "__main__":
+    main()
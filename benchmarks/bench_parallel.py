@@ -0,0 +1,42 @@
+"""병렬 분석 확장성 벤치마크
+
+합성 포스트로 InstagramAnalyzer.analyze 전체(해시태그/바이럴/아웃라이어/동시 출현/인사이트)를
+워커 1/2/4/8개로 실행해 소요 시간, 배속, 직렬(워커 1개) 결과와의 동일 여부를 비교합니다.
+배속은 CPU 코어 수를 넘지 않으며, 워커 수만큼 코어가 없으면 프로세스 비용 때문에 직렬보다 느립니다.
+
+사용법:
+    python benchmarks/bench_parallel.py
+    python benchmarks/bench_parallel.py --sizes 1000000 --workers 1 2 4
+"""
+import argparse
+import os
+
+from bench_columnar import make_posts, run
+
+
+def main():
+    parser = argparse.ArgumentParser(description="병렬 분석 확장성 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    print(f"CPU 코어: {cores}개")
+    if max(args.workers) > cores:
+        print(f"⚠️ 워커 {max(args.workers)}개를 측정하려면 코어가 {max(args.workers)}개 이상 필요합니다. "
+              f"코어 수를 넘는 워커의 배속은 의미가 없습니다.")
+    print(f"{'포스트':>10} | {'워커':>4} | {'시간':>9} | {'배속':>6} | 직렬 결과와 동일")
+    print("-" * 60)
+    for n in args.sizes:
+        posts = make_posts(n)
+        serial_time, serial_key = run(posts, "python")
+        for workers in args.workers:
+            if workers == 1:
+                elapsed, key = serial_time, serial_key
+            else:
+                elapsed, key = run(posts, "python", workers=workers)
+            print(f"{n:>10,} | {workers:>4} | {elapsed:>8.2f}s | {serial_time / elapsed:>5.2f}x | {key == serial_key}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""근사 해시태그 집계(Space-Saving) 정확도/메모리 벤치마크
+
+일회성 태그를 섞어 고유 태그가 계속 늘어나는 합성 포스트(synthetic.py, 1년 기간)를 누적기(스트리밍 분석과 같은 경로)로 정확 집계(exact)와
+근사 집계(approx, ε별)로 실행해 최대 메모리, 추적 태그 수, 소요 시간과 정확 집계 대비 정확도를 비교합니다.
+
+정확도:
+    재현율   - 정확 집계 Top N 해시태그 중 근사 집계 Top N에도 있는 비율
+    순위 일치 - 두 Top N의 태그 순서가 같은지
+    빈도 오차 - 두 Top N에 모두 있는 태그의 (정확 빈도 - 근사 빈도) / 정확 빈도 최댓값
+
+사용법:
+    python benchmarks/bench_sketch.py
+    python benchmarks/bench_sketch.py --sizes 1000000 --errors 0.001 0.0001
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analyzer import InstagramAnalyzer  # noqa: E402
+from src.config import AnalysisConfig, Config, ScraperConfig  # noqa: E402
+from synthetic import iter_posts  # noqa: E402
+
+
+# 일회성 태그가 붙는 포스트 비율
+ONE_OFF_TAGS = 0.5
+
+
+def run(posts: List[Dict[str, Any]], counting: str, error: float = 0.0005):
+    """(소요 시간, 최대 메모리 MB, 추적 태그 수, Top N 해시태그) - 포스트 생성은 측정에서 제외"""
+    config = Config(
+        apify_token="",
+        accounts=[],
+        analysis=AnalysisConfig(engine="python", hashtag_counting=counting, hashtag_error=error),
+        scraper=ScraperConfig(),
+        email_recipients=[],
+        google_config_path="",
+        gmail_token_key="",
+        sheets_token_key="",
+    )
+    analyzer = InstagramAnalyzer(config)
+    acc = analyzer.accumulator()
+    tracemalloc.start()
+    started = time.perf_counter()
+    for post in posts:
+        acc.add(post)
+    with contextlib.redirect_stdout(io.StringIO()):
+        hashtags, _ = acc.finalize()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    tracked = len(acc.sketch.entries) if acc.sketch is not None else len(acc.tags)
+    return elapsed, peak, tracked, hashtags
+
+
+def main():
+    parser = argparse.ArgumentParser(description="근사 해시태그 집계 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200_000])
+    parser.add_argument("--errors", type=float, nargs="+", default=[0.001, 0.0005, 0.0001])
+    args = parser.parse_args()
+
+    print(f"{'포스트':>10} | {'집계':>12} | {'시간':>8} | {'메모리':>9} | {'추적 태그':>10} | {'재현율':>6} | 순위 일치 | 빈도 오차")
+    print("-" * 96)
+    for n in args.sizes:
+        posts = list(iter_posts(n, days=365, one_off_tags=ONE_OFF_TAGS))
+        exact_time, exact_peak, exact_tags, exact = run(posts, "exact")
+        print(f"{n:>10,} | {'exact':>12} | {exact_time:>7.2f}s | {exact_peak:>7.1f}MB | {exact_tags:>10,} | {'-':>6} | {'-':>8} | -")
+        exact_counts = {h.tag: h.count for h in exact}
+        for error in args.errors:
+            elapsed, peak, tracked, approx = run(posts, "approx", error)
+            common = [h for h in approx if h.tag in exact_counts]
+            recall = len(common) / max(len(exact), 1)
+            same_order = [h.tag for h in approx] == [h.tag for h in exact]
+            count_error = max(((exact_counts[h.tag] - h.count) / exact_counts[h.tag] for h in common), default=0.0)
+            print(
+                f"{n:>10,} | {f'approx ε={error:g}':>12} | {elapsed:>7.2f}s | {peak:>7.1f}MB | {tracked:>10,} | "
+                f"{recall:>6.0%} | {str(same_order):>8} | {count_error:.2%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""분석/리포트 벤치마크 모음 + JSON 기준선 비교
+
+합성 포스트(synthetic.py)로 다음 항목을 포스트 수별로 측정하고, 결과를 JSON 기준선으로 저장해
+다른 커밋의 기준선과 비교합니다.
+
+측정 항목:
+    analyze[python] / analyze[numpy] - InstagramAnalyzer.analyze (포스트는 수집기처럼 PostRecord로 변환 후 전달)
+    categorize_hashtag              - 데이터셋 고유 해시태그 전체 분류
+    sheets_formatting               - SheetsReporter._build_formatting_requests (Google API 호출 없음)
+    email_charts                    - create_email_hashtag_chart + create_email_category_pie (PNG 렌더링)
+
+시트/차트 항목은 google-api-python-client / matplotlib이 없으면 건너뜁니다.
+각 항목은 --repeat회 실행해 최솟값(best)과 중앙값(median)을 기록합니다 (100만 개 이상은 1회).
+--sizes를 생략하면 기준선 저장(--save)은 1천/10만/100만, 비교(--compare)는 기준선과 같은 크기, 그 밖에는 1천/10만 포스트입니다.
+
+사용법:
+    python benchmarks/bench_suite.py                                  # 1천/10만 포스트, 결과 출력
+    python benchmarks/bench_suite.py --save                           # 1천/10만/100만 포스트 기준선 저장
+    python benchmarks/bench_suite.py --compare benchmarks/baselines/abc1234.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analyzer import AnalysisResult, InstagramAnalyzer  # noqa: E402
+from src.categories import categorize_hashtag  # noqa: E402
+from src.columnar import HAS_NUMPY  # noqa: E402
+from src.config import AnalysisConfig, Config, ScraperConfig  # noqa: E402
+from src.schema import PostRecord  # noqa: E402
+from synthetic import iter_posts  # noqa: E402
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+# 이 크기 이상은 반복 없이 1회만 측정
+SINGLE_RUN_SIZE = 1_000_000
+# --sizes 생략 시 포스트 수 (기준선 저장 / 그 밖)
+BASELINE_SIZES = [1_000, 100_000, 1_000_000]
+DEFAULT_SIZES = [1_000, 100_000]
+
+
+def make_config(engine: str) -> Config:
+    return Config(
+        apify_token="",
+        accounts=[],
+        analysis=AnalysisConfig(engine=engine),
+        scraper=ScraperConfig(),
+        email_recipients=[],
+        google_config_path="",
+        gmail_token_key="",
+        sheets_token_key="",
+    )
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """fn을 repeat회 실행한 소요 시간 (출력은 버림)"""
+    times = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - started)
+    return {"best": round(min(times), 6), "median": round(statistics.median(times), 6), "repeat": repeat}
+
+
+def analyze(posts: List[PostRecord], engine: str) -> AnalysisResult:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return InstagramAnalyzer(make_config(engine)).analyze({"posts": posts, "metadata": {}})
+
+
+def sheets_case(result: AnalysisResult) -> Optional[Callable[[], Any]]:
+    """시트 서식 요청 생성 (google 클라이언트 미설치 시 None)"""
+    try:
+        from src.sheets import SheetsReporter
+    except ImportError:
+        return None
+    reporter = SheetsReporter(make_config("python"))
+    reporter._hashtag_tab = f"Top{len(result.top_hashtags)}_해시태그"
+    reporter._viral_tab = f"Top{len(result.top_viral)}_바이럴콘텐츠"
+    tabs = [reporter._hashtag_tab, reporter._viral_tab, "아웃라이어", "인사이트", "부록_용어설명", "리포트정보"]
+    reporter._sheet_ids = {tab: i for i, tab in enumerate(tabs)}
+    return lambda: reporter._build_formatting_requests(result)
+
+
+def email_charts_case(result: AnalysisResult) -> Optional[Callable[[], Any]]:
+    """이메일 차트 PNG 렌더링 (matplotlib 미설치 시 None)"""
+    try:
+        from src.visualization.email_charts import create_email_category_pie, create_email_hashtag_chart
+    except ImportError:
+        return None
+
+    def render():
+        create_email_hashtag_chart(result.top_hashtags)
+        create_email_category_pie(result.top_hashtags)
+
+    return render
+
+
+def run_size(n: int, repeat: int, seed: int) -> Dict[str, Dict[str, Any]]:
+    """포스트 n개로 전체 항목 측정 → {항목: 결과}"""
+    started = time.perf_counter()
+    posts = []
+    tags = set()
+    for item in iter_posts(n, seed):
+        posts.append(PostRecord.from_item(item))
+        tags.update(item["hashtags"])
+    unique_tags = sorted(tags)
+    print(f"  합성 포스트 {n:,}개 생성: {time.perf_counter() - started:.1f}초")
+    if n >= SINGLE_RUN_SIZE:
+        repeat = 1
+
+    results: Dict[str, Dict[str, Any]] = {}
+    engines = ["python"] + (["numpy"] if HAS_NUMPY else [])
+    for engine in engines:
+        results[f"analyze[{engine}]"] = measure(lambda: analyze(posts, engine), repeat)
+        report(n, f"analyze[{engine}]", results[f"analyze[{engine}]"])
+
+    results["categorize_hashtag"] = measure(lambda: [categorize_hashtag(tag) for tag in unique_tags], repeat)
+    results["categorize_hashtag"]["items"] = len(unique_tags)
+    report(n, "categorize_hashtag", results["categorize_hashtag"])
+
+    result = analyze(posts, engines[-1])
+    for name, fn in (("sheets_formatting", sheets_case(result)), ("email_charts", email_charts_case(result))):
+        if fn is None:
+            print(f"  {name}: 건너뜀 (의존성 없음)")
+            continue
+        results[name] = measure(fn, repeat)
+        report(n, name, results[name])
+    return results
+
+
+def report(n: int, name: str, stat: Dict[str, Any]):
+    items = f" ({stat['items']:,}개)" if "items" in stat else ""
+    print(f"  {n:>10,} | {name:<20} | best {stat['best']:>9.4f}s | median {stat['median']:>9.4f}s{items}")
+
+
+def git_commit() -> str:
+    """현재 커밋 (작업 트리에 변경이 있으면 -dirty)"""
+    root = Path(__file__).resolve().parent.parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=root, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty else "")
+
+
+def environment() -> Dict[str, Any]:
+    info = {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+    if HAS_NUMPY:
+        import numpy
+        info["numpy"] = numpy.__version__
+    return info
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """기준선 대비 best 시간 비교 출력, threshold 이상 느려진 항목 수 반환"""
+    print(f"\n기준선 {baseline['commit']} ({baseline['created_at']}) → 현재 {current['commit']}")
+    if baseline.get("environment") != current["environment"]:
+        print("  ⚠️ 실행 환경(python/플랫폼/numpy)이 기준선과 다릅니다.")
+    if baseline.get("seed") != current["seed"]:
+        print("  ⚠️ 합성 데이터 시드가 기준선과 다릅니다.")
+    print(f"  {'포스트':>10} | {'항목':<20} | {'기준선':>9} | {'현재':>9} | 변화")
+    regressions = 0
+    for size, cases in current["results"].items():
+        for name, stat in cases.items():
+            base = baseline["results"].get(size, {}).get(name)
+            if base is None:
+                continue
+            change = stat["best"] / base["best"] - 1 if base["best"] > 0 else 0.0
+            flag = ""
+            if change >= threshold:
+                regressions += 1
+                flag = " ⚠️ 느려짐"
+            elif change <= -threshold:
+                flag = " ✅ 빨라짐"
+            print(f"  {int(size):>10,} | {name:<20} | {base['best']:>8.4f}s | {stat['best']:>8.4f}s | {change:+.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석/리포트 벤치마크 모음")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        help="포스트 수 (기본: --save면 1천/10만/100만, --compare면 기준선과 같은 크기, 그 밖에는 1천/10만)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save", nargs="?", const="", metavar="PATH",
+                        help="결과를 JSON 기준선으로 저장 (경로 생략 시 benchmarks/baselines/<커밋>.json)")
+    parser.add_argument("--compare", metavar="PATH", help="비교할 기준선 JSON")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="느려짐으로 판정할 best 시간 증가율 (기본 0.1 = 10%%)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    sizes = args.sizes
+    if sizes is None:
+        if args.save is not None:
+            sizes = BASELINE_SIZES
+        elif baseline is not None:
+            sizes = [int(size) for size in baseline["results"]]
+        else:
+            sizes = DEFAULT_SIZES
+
+    current = {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "seed": args.seed,
+        "results": {},
+    }
+    print(f"커밋 {current['commit']} | python {current['environment']['python']}")
+    for n in sizes:
+        current["results"][str(n)] = run_size(n, args.repeat, args.seed)
+
+    if args.save is not None:
+        path = Path(args.save) if args.save else BASELINE_DIR / f"{current['commit']}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"\n기준선 저장: {path}")
+
+    if baseline is not None:
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠️ {regressions}개 항목이 {args.threshold:.0%} 이상 느려졌습니다.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""합성 인스타그램 포스트 생성기 (벤치마크용)
+
+apify/instagram-scraper 데이터셋 아이템과 같은 모양의 포스트 딕셔너리를 시드로 재현 가능하게 생성합니다.
+
+분포:
+    해시태그   - categories.py 키워드(+ 파생 표기 "키워드코디", "키워드daily" 등)를 Zipf(s=1.1) 순위 빈도로 추출,
+                 포스트당 0~12개 (지수분포, 평균 약 4개), 일부는 대소문자 표기 변형
+    계정       - 팔로워 수 로그정규분포, 큰 계정일수록 좋아요 기준치가 큼
+    좋아요     - 팔로워 × 로그정규 참여율 × 파레토 바이럴 배수 (두꺼운 꼬리)
+    조회수     - 릴스(약 70%)만, 좋아요 × 로그정규 배수
+    캡션       - 한국어 65% / 영어 35% 템플릿, 5%는 캡션 없음, 일부 멘션 포함
+    일회성 태그 - one_off_tags 비율의 포스트에 한 번만 쓰이는 태그("event123")를 추가 (고유 태그 수가 포스트 수에 비례,
+                 근사 집계 벤치마크용, 기본 0)
+
+사용 예:
+    from synthetic import iter_posts, make_profiles
+    posts = list(iter_posts(100_000))
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.categories import _CATEGORY_ORDER  # noqa: E402
+
+
+# 카테고리 키워드에 붙여 롱테일 태그를 만드는 접미사
+TAG_SUFFIXES = ["", "", "", "코디", "룩", "추천", "스타그램", "daily", "style", "lover"]
+# 어느 카테고리에도 속하지 않는 일반 태그
+GENERAL_TAGS = ["ootd", "daily", "일상", "데일리", "좋아요", "소통", "팔로우", "instagood", "photooftheday", "reels"]
+
+KO_TEMPLATES = [
+    "오늘의 코디 기록 {emoji}",
+    "요즘 제일 자주 입는 조합이에요. 다들 어떠세요?",
+    "{keyword} 신상 드디어 입고! 사이즈 문의는 DM 주세요",
+    "주말엔 역시 {keyword} {emoji} 날씨가 너무 좋았던 하루",
+    "{keyword} 스타일링 3가지 추천 - 저장해두고 참고하세요",
+    "이번 시즌 가장 핫한 {keyword} 모아봤어요",
+]
+EN_TEMPLATES = [
+    "Today's fit {emoji}",
+    "Can't stop wearing this {keyword} combo lately",
+    "New {keyword} drop is finally here! Link in bio",
+    "Weekend mood with {keyword} {emoji}",
+    "3 ways to style {keyword} - save this for later",
+    "The {keyword} look everyone is talking about this season",
+]
+EMOJIS = ["✨", "🖤", "🔥", "💄", "👗", "🌿", "📸", "🤍"]
+
+TAG_ZIPF_S = 1.1
+DEFAULT_END = datetime(2026, 1, 15)
+
+
+def tag_vocabulary(seed: int = 7) -> List[str]:
+    """카테고리 키워드 + 파생 표기 + 일반 태그를 섞은 순위 목록 (앞쪽일수록 자주 등장)"""
+    keywords = []
+    for _, exact_set, substring_set in _CATEGORY_ORDER:
+        keywords.extend(sorted(exact_set | substring_set))
+    rng = random.Random(seed)
+    vocab = list(dict.fromkeys(
+        keyword.replace(" ", "") + suffix
+        for keyword in keywords
+        for suffix in TAG_SUFFIXES
+    ))
+    rng.shuffle(vocab)
+    # 일반 태그는 실제처럼 최상위 순위에 배치
+    return GENERAL_TAGS + [tag for tag in vocab if tag not in GENERAL_TAGS]
+
+
+def make_accounts(count: int = 50, seed: int = 42) -> List[Dict[str, Any]]:
+    """계정 목록 (username, followersCount - 로그정규분포, 중앙값 약 5만)"""
+    rng = random.Random(seed)
+    return [
+        {"username": f"account{i:03d}", "followersCount": int(rng.lognormvariate(10.8, 1.2)) + 100}
+        for i in range(count)
+    ]
+
+
+def make_profiles(accounts: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """apify/instagram-profile-scraper 결과 모양의 프로필 (username → 아이템)"""
+    return {
+        a["username"]: {"username": a["username"], "followersCount": a["followersCount"], "verified": False}
+        for a in accounts
+    }
+
+
+def iter_posts(
+    n: int,
+    seed: int = 42,
+    accounts: int = 50,
+    days: int = 30,
+    end: datetime = DEFAULT_END,
+    one_off_tags: float = 0.0,
+) -> Iterator[Dict[str, Any]]:
+    """Apify 데이터셋 아이템 모양의 합성 포스트 n개 (같은 인자면 항상 같은 결과)"""
+    rng = random.Random(seed)
+    vocab = tag_vocabulary()
+    cum_weights = list(accumulate(1 / (rank ** TAG_ZIPF_S) for rank in range(1, len(vocab) + 1)))
+    owners = make_accounts(accounts, seed)
+    span_secs = days * 86400
+
+    for i in range(n):
+        owner = owners[min(int(rng.paretovariate(1.0)) - 1, accounts - 1)] if rng.random() < 0.5 else rng.choice(owners)
+        tags = rng.choices(vocab, cum_weights=cum_weights, k=min(int(rng.expovariate(0.25)), 12))
+        if tags and rng.random() < 0.1:
+            # 표기 변형 (정규화 경로)
+            tags[0] = tags[0].upper() if rng.random() < 0.5 else tags[0].title()
+        if one_off_tags and rng.random() < one_off_tags:
+            tags.append(f"event{i}")
+
+        keyword = tags[0] if tags else rng.choice(GENERAL_TAGS)
+        emoji = rng.choice(EMOJIS)
+        mentions = []
+        if rng.random() < 0.05:
+            caption = None
+        else:
+            template = rng.choice(KO_TEMPLATES if rng.random() < 0.65 else EN_TEMPLATES)
+            caption = template.format(keyword=keyword, emoji=emoji)
+            if rng.random() < 0.2:
+                mentions.append(rng.choice(owners)["username"])
+                caption += f" @{mentions[0]}"
+            if tags:
+                caption += "\n\n" + " ".join(f"#{tag}" for tag in tags)
+
+        is_video = rng.random() < 0.7
+        rate = rng.lognormvariate(-3.9, 0.7)                    # 팔로워 대비 좋아요 비율 (중앙값 약 2%)
+        viral = rng.paretovariate(2.0) if rng.random() < 0.05 else 1.0
+        likes = int(owner["followersCount"] * rate * viral)
+        comments = int(likes * rng.lognormvariate(-3.5, 0.8))
+        short_code = f"C{seed:02d}{i:09d}"
+        post: Dict[str, Any] = {
+            "id": str(3_000_000_000_000_000_000 + seed * 10_000_000_000 + i),
+            "type": "Video" if is_video else rng.choice(["Image", "Sidecar"]),
+            "shortCode": short_code,
+            "url": f"https://www.instagram.com/p/{short_code}/",
+            "caption": caption,
+            "hashtags": [tag.lower() for tag in tags],
+            "mentions": mentions,
+            "commentsCount": comments,
+            "likesCount": likes,
+            "timestamp": (end - timedelta(seconds=rng.randrange(span_secs))).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "ownerUsername": owner["username"],
+            "productType": "clips" if is_video else "feed",
+        }
+        if is_video:
+            post["videoPlayCount"] = int(max(likes, 1) * rng.lognormvariate(3.0, 0.8))
+        yield post
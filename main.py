@@ -9,6 +9,13 @@ Usage:
     python main.py run --no-email         # 이메일 전송 제외
     python main.py run --days 14          # 분석 기간 변경
     python main.py run --email a@b.com    # 수신자 지정
+    python main.py run --no-cache         # 캐시 무시하고 새로 수집
+    python main.py run --raw              # 포스트 전체 필드 수집 (아카이브용)
+    python main.py run --workers 4        # 분석을 4개 프로세스로 병렬 실행
+    python main.py run --engagement-rate  # 팔로워 수로 정규화한 인게이지먼트로 순위 계산
+    python main.py run --stream --approx-hashtags   # 대용량: 해시태그를 고정 메모리로 근사 집계
+    python main.py run --incremental --rolling   # 매일 갱신: 새 포스트만 분석
+    python main.py run --resume 2026-01-15_090000   # 실패한 실행 재개
 """
 import argparse
 import sys
@@ -31,6 +38,13 @@ def main():
   python main.py run --no-email          이메일 전송 제외
   python main.py run --days 14           분석 기간 14일
   python main.py run --email a@b.com     수신자 지정 (여러 개 가능)
+  python main.py run --no-cache          캐시 무시하고 새로 수집
+  python main.py run --raw               포스트 전체 필드 수집 (아카이브용)
+  python main.py run --workers 4         분석을 4개 프로세스로 병렬 실행
+  python main.py run --engagement-rate   팔로워 수로 정규화한 인게이지먼트로 순위 계산
+  python main.py run --stream --approx-hashtags   해시태그를 고정 메모리로 근사 집계
+  python main.py run --incremental --rolling   새 포스트만 분석해 N일 윈도우 갱신
+  python main.py run --resume RUN_ID     실패한 실행 재개 (완료된 청크 건너뜀)
         """
     )
     
@@ -62,6 +76,52 @@ def main():
         action="store_true",
         help="원본 데이터 저장 제외",
     )
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="스트리밍 모드 (수집과 분석을 동시에 진행, 메모리 절약)",
+    )
+    run_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="증분 수집 (저장된 이력 이후 새 포스트만 수집)",
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="스크래퍼 결과 캐시/최근 실행 재사용 안 함 (항상 새로 수집)",
+    )
+    run_parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="이전 실행 ID로 재개 (완료된 청크 체크포인트는 다시 수집하지 않음)",
+    )
+    run_parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="포스트 전체 필드 수집 (아카이브용, 원본은 실행 디렉토리 raw_items.jsonl로 기록, 기본은 분석에 쓰는 필드만)",
+    )
+    run_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        metavar="N",
+        help="분석 프로세스 수 (대용량 분석 시 병렬 처리, 스트리밍 모드 제외)",
+    )
+    run_parser.add_argument(
+        "--rolling",
+        action="store_true",
+        help="롤링 윈도우 분석 (날짜별 집계를 저장해 새 포스트만 더하고 지난 날짜는 뺌)",
+    )
+    run_parser.add_argument(
+        "--engagement-rate",
+        action="store_true",
+        help="팔로워 수로 정규화한 인게이지먼트로 바이럴/해시태그 순위 계산 (프로필 followersCount 사용)",
+    )
+    run_parser.add_argument(
+        "--approx-hashtags",
+        action="store_true",
+        help="해시태그를 Space-Saving 근사 집계 (고유 태그 수와 무관한 고정 메모리, 오차 ε = analysis.hashtag_error)",
+    )
     
     # test 명령어 (설정 확인)
     test_parser = subparsers.add_parser("test", help="설정 테스트")
@@ -79,6 +139,28 @@ def main():
         # 명령줄 옵션으로 설정 오버라이드
         if args.days:
             config.analysis.days = args.days
+        if args.no_cache:
+            config.cache.enabled = False
+            config.scraper.reuse_run_secs = 0
+        if args.incremental:
+            config.store.incremental = True
+        if args.raw:
+            config.scraper.raw_items = True
+        if args.workers:
+            config.analysis.workers = args.workers
+        if args.rolling:
+            config.analysis.rolling = True
+        if args.engagement_rate:
+            config.analysis.engagement_basis = "followers"
+        if args.approx_hashtags:
+            config.analysis.hashtag_counting = "approx"
+        
+        if args.resume and args.stream:
+            parser.error("--resume은 스트리밍 모드(--stream)와 함께 사용할 수 없습니다.")
+        if args.resume and config.store.incremental:
+            parser.error("--resume은 증분 수집(--incremental 또는 store.incremental)과 함께 사용할 수 없습니다.")
+        if config.analysis.rolling and args.stream:
+            parser.error("--rolling은 스트리밍 모드(--stream)와 함께 사용할 수 없습니다.")
         
         # 리포터 실행
         reporter = InstagramTrendReporter(config)
@@ -86,6 +168,8 @@ def main():
             save_raw=not args.no_save,
             send_email=not args.no_email,
             recipients=args.email,
+            stream=args.stream,
+            resume=args.resume,
         )
         
         print("\n📋 실행 결과:")
@@ -1,11 +1,25 @@
 """인스타그램 데이터 분석 모듈"""
-import re
+import heapq
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from operator import itemgetter
+from typing import Callable, List, Dict, Any, Iterable, Optional, Tuple
 from .config import get_config, Config
 from .categories import categorize_hashtag, get_topic_emoji, CATEGORY_INFO
+from .canonical import HashtagCanonicalizer
+from .columnar import HAS_NUMPY, PostColumns
+from .cooccurrence import incidence_from_records, tag_cooccurrence
+from .followers import FollowerIndex
+from .metrics import get_metrics
+from .outliers import select_outliers
+from .parsing import CaptionRecord, hashtags_in_head, parse_post
+from .schema import PostRecord
+from .sketch import MIN_CAPACITY_FACTOR, SpaceSaving
+from .trends import (
+    FALLING_VELOCITY, MIN_RECENT_COUNT, RISING_VELOCITY,
+    TagTrend, TrendWindows, day_index, tag_trend,
+)
 
 
 @dataclass
@@ -19,6 +33,8 @@ class HashtagStats:
     category: str
     grade: str
     grade_reason: str
+    velocity: Optional[float] = None       # 직전 구간 대비 성장률 (추세 계산 불가 시 None)
+    acceleration: Optional[float] = None   # 성장률 변화
 
 
 @dataclass
@@ -32,6 +48,42 @@ class ViralContent:
     views: int
     engagement: float
     url: str
+    engagement_rate: Optional[float] = None   # 인게이지먼트 / 팔로워 × 100 (%, 프로필이 없으면 None)
+
+
+@dataclass
+class OutlierContent:
+    """아웃라이어 콘텐츠 (계정 평소 성과 대비)"""
+    rank: int
+    username: str
+    topic: str
+    likes: int
+    comments: int
+    views: int
+    engagement: float
+    account_median: float   # 계정 중앙값 인게이지먼트
+    multiple: float         # 인게이지먼트 / 계정 중앙값
+    score: float            # 로버스트 z-score
+    url: str
+
+
+@dataclass
+class TagPair:
+    """자주 함께 쓰인 해시태그 쌍"""
+    rank: int
+    tag_a: str
+    tag_b: str
+    count: int          # 두 태그가 함께 나온 포스트 수
+    similarity: float   # Jaccard (함께 나온 포스트 / 둘 중 하나라도 나온 포스트)
+
+
+@dataclass
+class TagCluster:
+    """함께 쓰이는 해시태그 묶음 (동시 출현 유사도 기준 연결 요소)"""
+    number: int
+    name: str           # 대표 태그 (출현 최다)
+    tags: List[str]     # 출현 포스트 수 내림차순
+    posts: int          # 태그별 출현 포스트 수 합계
 
 
 @dataclass
@@ -53,6 +105,436 @@ class AnalysisResult:
     top_viral: List[ViralContent]
     insights: List[Insight]
     generated_at: str
+    outliers: List[OutlierContent] = field(default_factory=list)
+    engagement_basis: str = "absolute"   # 순위 기준 (followers: 팔로워 수로 정규화한 인게이지먼트)
+    tag_pairs: List[TagPair] = field(default_factory=list)
+    tag_clusters: List[TagCluster] = field(default_factory=list)
+
+
+def _engagement_parts(post: Dict[str, Any]) -> Tuple[int, int, int]:
+    """포스트의 (좋아요, 댓글, 조회수) - 값이 없으면 0 (PostRecord는 슬롯에서 바로 읽음)"""
+    if type(post) is PostRecord:
+        return post.likesCount or 0, post.commentsCount or 0, post.videoPlayCount or 0
+    return (
+        post.get("likesCount", 0) or 0,
+        post.get("commentsCount", 0) or 0,
+        post.get("videoPlayCount", 0) or 0,
+    )
+
+
+class AnalysisAccumulator:
+    """해시태그/바이럴 분석 누적기 - add(post) / merge(other) / finalize()
+
+    원본 포스트 없이 부분 결과를 합치고 뺄 수 있도록 태그별 [출현 수, 인게이지먼트 합계 × 10, 첫 등장 순번],
+    Top N 바이럴 힙, 진단 카운터만 보관합니다. 청크/프로세스/저장 이력별로 따로 누적한 뒤
+    merge하면 전체 포스트를 한 번에 누적한 것과 같은 결과가 나옵니다.
+
+    - 태그별 인게이지먼트는 좋아요×10 + 댓글×30 + 조회수 정수로 누적하므로
+      합치는 순서와 무관하게 정확합니다 (finalize에서 10으로 나눔).
+    - start_seq는 이 누적기 첫 포스트의 전체 순번입니다. 바이럴/해시태그 동점은 먼저 나온
+      포스트가 우선하므로, 샤드마다 시작 위치를 주고 겹치지 않는 포스트끼리 merge합니다.
+    - 추세 등급용으로 (태그, 날짜) → [출현 수, 인게이지먼트 합계 × 10]도 누적합니다 (src/trends.py).
+    - 해시태그는 분석기의 정규화기(src/canonical.py)로 정규형으로 바꾼 뒤 누적합니다.
+    - 분석기의 engagement_basis가 followers면 태그/바이럴 인게이지먼트를 팔로워 수로 정규화해
+      누적합니다 (src/followers.py, 정규화 값도 ×10 정수).
+    - analysis.hashtag_counting이 approx면 태그별 항목 대신 카운터 수가 고정된 Space-Saving 요약에
+      누적합니다 (src/sketch.py). merge는 되지만 subtract는 안 되므로 롤링 윈도우는 exact로 만듭니다.
+    - 프로세스 간 전달(pickle) 시 분석기 참조는 빠지며, merge 대상 누적기의 분석기로 finalize합니다.
+    - 정확 집계 누적기는 to_state() / from_state()로 JSON 저장할 수 있습니다 (롤링 윈도우 저장소).
+    """
+
+    def __init__(
+        self,
+        analyzer: Optional["InstagramAnalyzer"],
+        start_seq: int = 0,
+        hashtags: bool = True,
+        top_viral: Optional[int] = None,
+        exact: bool = False,
+    ):
+        self._analyzer = analyzer
+        self._scale = analyzer.follower_scale if analyzer is not None else None
+        self._canonical = analyzer.canonicalizer.canonical if analyzer is not None else None
+        config = analyzer.config.analysis if analyzer is not None else None
+        self.exclude_set = analyzer.exclude_set if analyzer is not None else set()
+        self.track_hashtags = hashtags
+        self.top_viral = top_viral if top_viral is not None else (config.top_viral if config else 0)
+        self.start_seq = start_seq
+        self.end_seq = start_seq
+        # 태그 → [출현 수, 인게이지먼트 합계 × 10, 첫 등장 순번] (_ordered면 첫 등장 순서)
+        self.tags: Dict[str, List[int]] = {}
+        self._ordered = True
+        # (태그, 날짜 인덱스) → [출현 수, 인게이지먼트 합계 × 10]
+        self.tag_days: Dict[Tuple[str, int], List[int]] = {}
+        # 근사 집계면 tags/tag_days 대신 Space-Saving 요약
+        self.sketch: Optional[SpaceSaving] = None
+        if hashtags and not exact and config is not None and config.hashtag_counting == "approx":
+            self.sketch = SpaceSaving.for_epsilon(config.hashtag_error, config.top_hashtags * MIN_CAPACITY_FACTOR)
+        self.min_day: Optional[int] = None
+        self.max_day: Optional[int] = None
+        # (인게이지먼트, -순번, 순번, 포스트, 캡션 파싱 결과) 최소 힙
+        self.viral_heap: List[Tuple[float, int, int, Dict[str, Any], Optional[CaptionRecord]]] = []
+        self.total_posts = 0
+        self.posts_with_caption = 0
+        self.posts_with_hashtags = 0
+        self.total_hashtags_found = 0
+        self.excluded_count = 0
+        self.excluded_tags_detail: Dict[str, int] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_analyzer"] = None
+        state["_scale"] = None
+        state["_canonical"] = None
+        return state
+
+    def add(self, post: Dict[str, Any], record: Optional[CaptionRecord] = None):
+        """포스트 1개 누적 (record: 캡션 파싱 결과, 없으면 필요할 때 파싱)"""
+        seq = self.end_seq
+        self.end_seq += 1
+        self.total_posts += 1
+
+        likes, comments, views = _engagement_parts(post)
+        engagement_x10 = likes * 10 + comments * 30 + views
+        scale = self._scale
+        if scale is not None:
+            engagement_x10 = scale.scale_x10(post.get("ownerUsername"), engagement_x10)
+        if self.track_hashtags:
+            if record is None:
+                record = parse_post(post)
+            self._add_hashtags(record, engagement_x10, day_index(post.get("timestamp")), seq)
+
+        if self.top_viral > 0:
+            # InstagramAnalyzer.calc_engagement와 같은 식 (팔로워 정규화 시 정규화 인게이지먼트)
+            engagement = likes + (comments * 3) + (views * 0.1) if scale is None else engagement_x10 / 10
+            entry = (engagement, -seq, seq, post, record)
+            if len(self.viral_heap) < self.top_viral:
+                heapq.heappush(self.viral_heap, entry)
+            elif entry[:2] > self.viral_heap[0][:2]:
+                heapq.heapreplace(self.viral_heap, entry)
+
+    def _add_hashtags(self, record: CaptionRecord, engagement_x10: int, day: Optional[int], seq: int):
+        if day is not None:
+            if self.min_day is None or day < self.min_day:
+                self.min_day = day
+            if self.max_day is None or day > self.max_day:
+                self.max_day = day
+        if record.has_caption:
+            self.posts_with_caption += 1
+
+        # 해시태그 (파싱 단계에서 소문자로 통합, 여기서 정규형으로 통합)
+        hashtags = record.hashtags
+        if hashtags:
+            self.posts_with_hashtags += 1
+        self.total_hashtags_found += len(hashtags)
+        tags = self.tags
+        sketch = self.sketch
+        canonical = self._canonical
+        for raw_tag in hashtags:
+            tag_lower = canonical(raw_tag) if canonical is not None else raw_tag
+            if not tag_lower:
+                continue
+            if tag_lower in self.exclude_set:
+                self.excluded_count += 1
+                self.excluded_tags_detail[tag_lower] = self.excluded_tags_detail.get(tag_lower, 0) + 1
+                continue
+            if sketch is not None:
+                sketch.add(tag_lower, engagement_x10, day, seq)
+                continue
+            entry = tags.get(tag_lower)
+            if entry is None:
+                tags[tag_lower] = [1, engagement_x10, seq]
+            else:
+                entry[0] += 1
+                entry[1] += engagement_x10
+            if day is not None:
+                entry = self.tag_days.get((tag_lower, day))
+                if entry is None:
+                    self.tag_days[(tag_lower, day)] = [1, engagement_x10]
+                else:
+                    entry[0] += 1
+                    entry[1] += engagement_x10
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON으로 저장할 수 있는 상태 (정확 집계만, 바이럴 포스트는 POST_FIELDS 딕셔너리, 캡션 파싱 결과는 제외)"""
+        if self.sketch is not None:
+            raise ValueError("근사 집계(Space-Saving) 누적기는 저장할 수 없습니다. exact=True로 만든 누적기를 사용하세요.")
+        return {
+            "track_hashtags": self.track_hashtags,
+            "top_viral": self.top_viral,
+            "start_seq": self.start_seq,
+            "end_seq": self.end_seq,
+            "tags": self.tags,
+            "ordered": self._ordered,
+            "tag_days": [
+                [tag, day, count, engagement_x10] for (tag, day), (count, engagement_x10) in self.tag_days.items()
+            ],
+            "min_day": self.min_day,
+            "max_day": self.max_day,
+            "viral": [
+                [engagement, seq, PostRecord.from_item(post).to_dict()]
+                for engagement, _, seq, post, _ in self.viral_heap
+            ],
+            "total_posts": self.total_posts,
+            "posts_with_caption": self.posts_with_caption,
+            "posts_with_hashtags": self.posts_with_hashtags,
+            "total_hashtags_found": self.total_hashtags_found,
+            "excluded_count": self.excluded_count,
+            "excluded_tags_detail": self.excluded_tags_detail,
+        }
+
+    @classmethod
+    def from_state(cls, analyzer: "InstagramAnalyzer", state: Dict[str, Any]) -> "AnalysisAccumulator":
+        """to_state() 결과로 누적기 복원 (분석기 연결, 바이럴 캡션은 finalize에서 다시 파싱)"""
+        acc = cls(analyzer, state["start_seq"], state["track_hashtags"], state["top_viral"], exact=True)
+        acc.end_seq = state["end_seq"]
+        acc.tags = {tag: list(entry) for tag, entry in state["tags"].items()}
+        acc._ordered = state["ordered"]
+        acc.tag_days = {(tag, day): [count, engagement_x10] for tag, day, count, engagement_x10 in state["tag_days"]}
+        acc.min_day, acc.max_day = state["min_day"], state["max_day"]
+        # 저장 순서가 힙 순서이므로 그대로 복원
+        acc.viral_heap = [
+            (engagement, -seq, seq, PostRecord.from_item(post), None) for engagement, seq, post in state["viral"]
+        ]
+        acc.total_posts = state["total_posts"]
+        acc.posts_with_caption = state["posts_with_caption"]
+        acc.posts_with_hashtags = state["posts_with_hashtags"]
+        acc.total_hashtags_found = state["total_hashtags_found"]
+        acc.excluded_count = state["excluded_count"]
+        acc.excluded_tags_detail = dict(state["excluded_tags_detail"])
+        return acc
+
+    def bind(self, analyzer: "InstagramAnalyzer") -> "AnalysisAccumulator":
+        """분석기 연결 (pickle로 읽어 온 누적기를 finalize하기 전)"""
+        self._analyzer = analyzer
+        self._scale = analyzer.follower_scale
+        self._canonical = analyzer.canonicalizer.canonical
+        return self
+
+    def merge(self, other: "AnalysisAccumulator") -> "AnalysisAccumulator":
+        """다른 누적기를 합침 - self를 갱신해 반환
+
+        두 누적기는 같은 포스트를 포함하지 않아야 합니다. other가 self 뒤 순번 구간이면 태그 첫 등장
+        순서가 그대로 유지되고, 앞이거나 구간이 섞이면 finalize에서 첫 등장 순번으로 다시 정렬합니다.
+        """
+        if self._analyzer is None:
+            self._analyzer, self._scale, self._canonical = other._analyzer, other._scale, other._canonical
+        if (self.sketch is None) != (other.sketch is None):
+            raise ValueError("정확 집계 누적기와 근사 집계 누적기는 합칠 수 없습니다.")
+        if other.total_posts == 0:
+            return self
+        if self.total_posts == 0:
+            ordered = other._ordered
+            self.start_seq, self.end_seq = other.start_seq, other.end_seq
+        else:
+            ordered = self._ordered and other._ordered and self.end_seq <= other.start_seq
+            self.start_seq = min(self.start_seq, other.start_seq)
+            self.end_seq = max(self.end_seq, other.end_seq)
+
+        tags = self.tags
+        for tag, (count, engagement_x10, first_seq) in other.tags.items():
+            entry = tags.get(tag)
+            if entry is None:
+                tags[tag] = [count, engagement_x10, first_seq]
+            else:
+                entry[0] += count
+                entry[1] += engagement_x10
+                if first_seq < entry[2]:
+                    entry[2] = first_seq
+        if self.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+        tag_days = self.tag_days
+        for key, (count, engagement_x10) in other.tag_days.items():
+            entry = tag_days.get(key)
+            if entry is None:
+                tag_days[key] = [count, engagement_x10]
+            else:
+                entry[0] += count
+                entry[1] += engagement_x10
+        days = [d for d in (self.min_day, self.max_day, other.min_day, other.max_day) if d is not None]
+        if days:
+            self.min_day, self.max_day = min(days), max(days)
+
+        for tag, count in other.excluded_tags_detail.items():
+            self.excluded_tags_detail[tag] = self.excluded_tags_detail.get(tag, 0) + count
+
+        for entry in other.viral_heap:
+            if len(self.viral_heap) < self.top_viral:
+                heapq.heappush(self.viral_heap, entry)
+            elif self.top_viral and entry[:2] > self.viral_heap[0][:2]:
+                heapq.heapreplace(self.viral_heap, entry)
+
+        self.total_posts += other.total_posts
+        self.posts_with_caption += other.posts_with_caption
+        self.posts_with_hashtags += other.posts_with_hashtags
+        self.total_hashtags_found += other.total_hashtags_found
+        self.excluded_count += other.excluded_count
+        self._ordered = ordered
+        return self
+
+    def subtract(
+        self, other: "AnalysisAccumulator", remaining: List["AnalysisAccumulator"]
+    ) -> "AnalysisAccumulator":
+        """merge했던 누적기를 다시 뺌 - self를 갱신해 반환
+
+        remaining은 뺀 뒤 self를 이루는 누적기들입니다. 첫 등장이 빠진 태그의 첫 등장 순번,
+        바이럴 Top N, 날짜/순번 범위는 이 누적기들의 요약값에서 다시 계산합니다 (원본 포스트 불필요).
+        """
+        if self.sketch is not None:
+            raise ValueError("근사 집계(Space-Saving) 누적기는 뺄 수 없습니다. exact=True로 만든 누적기를 사용하세요.")
+        tags = self.tags
+        for tag, (count, engagement_x10, first_seq) in other.tags.items():
+            entry = tags[tag]
+            entry[0] -= count
+            entry[1] -= engagement_x10
+            if entry[0] == 0:
+                del tags[tag]
+            elif entry[2] == first_seq:
+                entry[2] = min(acc.tags[tag][2] for acc in remaining if tag in acc.tags)
+
+        tag_days = self.tag_days
+        for key, (count, engagement_x10) in other.tag_days.items():
+            entry = tag_days[key]
+            entry[0] -= count
+            entry[1] -= engagement_x10
+            if entry[0] == 0:
+                del tag_days[key]
+
+        for tag, count in other.excluded_tags_detail.items():
+            left = self.excluded_tags_detail[tag] - count
+            if left:
+                self.excluded_tags_detail[tag] = left
+            else:
+                del self.excluded_tags_detail[tag]
+
+        self.viral_heap = heapq.nlargest(
+            self.top_viral, (e for acc in remaining for e in acc.viral_heap), key=lambda e: e[:2]
+        )
+        heapq.heapify(self.viral_heap)
+
+        live = [acc for acc in remaining if acc.total_posts]
+        days = [d for acc in live for d in (acc.min_day, acc.max_day) if d is not None]
+        self.min_day, self.max_day = (min(days), max(days)) if days else (None, None)
+        if live:
+            self.start_seq = min(acc.start_seq for acc in live)
+            self.end_seq = max(acc.end_seq for acc in live)
+        else:
+            self.start_seq = self.end_seq = other.start_seq
+
+        self.total_posts -= other.total_posts
+        self.posts_with_caption -= other.posts_with_caption
+        self.posts_with_hashtags -= other.posts_with_hashtags
+        self.total_hashtags_found -= other.total_hashtags_found
+        self.excluded_count -= other.excluded_count
+        self._ordered = False
+        return self
+
+    def print_diagnostics(self):
+        sketch = self.sketch
+        _print_hashtag_diagnostics(
+            self,
+            len(sketch.entries) if sketch is not None else len(self.tags),
+            self._analyzer.canonicalizer if self._analyzer else None,
+            sketch,
+        )
+
+    def _trend_lookup(self, window_days: int) -> Optional[Callable[[str], TagTrend]]:
+        """태그 → TagTrend 계산 함수 (구간을 만들 수 없으면 None)"""
+        windows = TrendWindows.from_span(self.min_day, self.max_day, window_days)
+        if windows is None:
+            return None
+        if self.sketch is not None:
+            day_cell = self.sketch.day_cell
+        else:
+            tag_days = self.tag_days
+
+            def day_cell(tag: str, day: int) -> Optional[List[int]]:
+                return tag_days.get((tag, day))
+
+        def lookup(tag: str) -> TagTrend:
+            counts, totals = [], []
+            for k in range(windows.count):
+                count = engagement_x10 = 0
+                for day in windows.days(k):
+                    entry = day_cell(tag, day)
+                    if entry is not None:
+                        count += entry[0]
+                        engagement_x10 += entry[1]
+                counts.append(count)
+                totals.append(engagement_x10)
+            return tag_trend(counts, totals)
+
+        return lookup
+
+    def finalize(self) -> Tuple[List[HashtagStats], List[ViralContent]]:
+        """누적 결과 → (Top N 해시태그, Top N 바이럴 콘텐츠)"""
+        analyzer = self._analyzer
+        if analyzer is None:
+            raise ValueError("분석기가 연결되지 않은 누적기입니다. 분석기로 만든 누적기에 merge한 뒤 finalize하세요.")
+
+        hashtags: List[HashtagStats] = []
+        if self.track_hashtags:
+            if self.sketch is not None:
+                tags = ((tag, count, engagement_x10 / 10) for tag, count, engagement_x10, _ in self.sketch.items())
+            else:
+                if not self._ordered:
+                    self.tags = dict(sorted(self.tags.items(), key=lambda item: item[1][2]))
+                    self._ordered = True
+                tags = ((tag, count, engagement_x10 / 10) for tag, (count, engagement_x10, _) in self.tags.items())
+            self.print_diagnostics()
+            hashtags = analyzer._top_hashtag_stats(
+                tags, self._trend_lookup(analyzer.config.analysis.trend_window_days)
+            )
+
+        ranked = sorted(self.viral_heap, key=lambda e: e[:2], reverse=True)
+        viral = analyzer._build_viral([
+            (e[3], e[0], e[4] if e[4] is not None else parse_post(e[3])) for e in ranked
+        ])
+        return hashtags, viral
+
+
+def _print_hashtag_diagnostics(
+    tally: Any,
+    unique_tags: int,
+    canonicalizer: Optional[HashtagCanonicalizer] = None,
+    sketch: Optional[SpaceSaving] = None,
+):
+    """해시태그 진단 출력 + 게이지 기록 (AnalysisAccumulator / PostColumns 공통 카운터, sketch: 근사 집계 요약)"""
+    total = tally.total_posts
+    metrics = get_metrics()
+    metrics.set_gauge("hashtag_posts", total)
+    metrics.set_gauge("hashtag_posts_with_caption", tally.posts_with_caption)
+    metrics.set_gauge("hashtag_posts_with_hashtags", tally.posts_with_hashtags)
+    metrics.set_gauge("hashtags_found", tally.total_hashtags_found)
+    metrics.set_gauge("hashtags_excluded", tally.excluded_count)
+    metrics.set_gauge("hashtags_tracked", unique_tags)
+    if sketch is not None:
+        metrics.set_gauge("hashtag_sketch_evictions", sketch.evictions)
+        metrics.set_gauge("hashtag_sketch_max_error", sketch.max_error)
+    print(f"  📊 해시태그 진단: 전체 {total}개 포스트")
+    print(f"     캡션 있음: {tally.posts_with_caption}개 ({tally.posts_with_caption*100//max(total,1)}%)")
+    print(f"     해시태그 포함: {tally.posts_with_hashtags}개 ({tally.posts_with_hashtags*100//max(total,1)}%)")
+    if sketch is None:
+        print(f"     해시태그 총 발견: {tally.total_hashtags_found}개 → 제외 필터: {tally.excluded_count}개 → 고유 태그: {unique_tags}개")
+    else:
+        print(f"     해시태그 총 발견: {tally.total_hashtags_found}개 → 제외 필터: {tally.excluded_count}개 → 추적 태그: {unique_tags}개")
+        print(
+            f"     🧮 근사 집계(Space-Saving): 카운터 {sketch.capacity:,}개, 교체 {sketch.evictions:,}회 → "
+            f"빈도 오차 최대 {sketch.max_error:,}회 (보장 상한 ε {1 / sketch.capacity:.3%} × 출현 {sketch.total:,}회 "
+            f"= {sketch.total // sketch.capacity:,}회)"
+        )
+    if tally.excluded_tags_detail:
+        excluded_list = ", ".join(f"#{k}({v})" for k, v in sorted(tally.excluded_tags_detail.items(), key=lambda x: x[1], reverse=True))
+        print(f"     🚫 제외된 태그: {excluded_list}")
+    if canonicalizer is not None:
+        info = canonicalizer.cache_info()
+        metrics.set_gauge("hashtag_canonical_cache_hits", info.hits)
+        metrics.set_gauge("hashtag_canonical_cache_misses", info.misses)
+        if info.misses:
+            print(
+                f"     🔤 해시태그 정규화: 표기 {info.misses}종 정규화 → 캐시 적중 "
+                f"{info.hits * 100 // max(info.hits + info.misses, 1)}% (캐시 {info.currsize}/{info.maxsize})"
+            )
 
 
 class InstagramAnalyzer:
@@ -60,17 +542,58 @@ class InstagramAnalyzer:
     
     def __init__(self, config: Optional[Config] = None):
         self.config = config or get_config()
+        # 원본 태그 → 정규형 (LRU 캐시), 제외 태그도 정규형으로 비교
+        self.canonicalizer = HashtagCanonicalizer.from_config(self.config)
+        canonical = self.canonicalizer.canonical
+        self.exclude_set = {canonical(t.lower()) for t in self.config.analysis.exclude_hashtags}
+        canonical.cache_clear()  # 진단 출력의 캐시 통계는 포스트 태그 기준
+        # 정규형 태그 → 카테고리 (분석 중 같은 태그를 다시 분류하지 않음)
+        self._category_cache: Dict[str, str] = {}
+        # 계정 → 팔로워 수 (use_profiles로 설정)
+        self.followers: Optional[FollowerIndex] = None
+
+    def use_profiles(self, profiles: Optional[Dict[str, Any]]):
+        """수집한 프로필로 팔로워 인덱스 구성 (인게이지먼트율 표시, followers 기준이면 순위 정규화)"""
+        self.followers = FollowerIndex.from_profiles(profiles, self.config.analysis.reference_followers)
+        if self.config.analysis.engagement_basis == "followers" and not self.followers:
+            print("  ⚠️ 팔로워 수가 있는 프로필이 없어 절대 인게이지먼트 기준으로 분석합니다.")
+
+    @property
+    def follower_scale(self) -> Optional[FollowerIndex]:
+        """정규화에 쓸 팔로워 인덱스 (engagement_basis가 followers이고 프로필이 있을 때만)"""
+        if self.config.analysis.engagement_basis == "followers" and self.followers:
+            return self.followers
+        return None
+
+    def _print_follower_basis(self, owners: Optional[Iterable[Any]] = None):
+        """팔로워 기준 분석이면 기준 팔로워 수와 프로필 매칭 현황 출력"""
+        scale = self.follower_scale
+        if scale is None:
+            return
+        missing = scale.missing_owners(list(owners) if owners is not None else None)
+        print(
+            f"  👥 팔로워 기준 인게이지먼트: 팔로워 {scale.reference:,}명 기준 환산 (프로필 {len(scale)}개)"
+        )
+        if missing:
+            print(f"     팔로워 수가 없는 계정 {missing}개는 절대 인게이지먼트를 그대로 사용합니다.")
+
+    def _categorize(self, tag: str) -> str:
+        """categorize_hashtag 결과 메모이제이션 (tag는 정규형)"""
+        category = self._category_cache.get(tag)
+        if category is None:
+            category = self._category_cache[tag] = categorize_hashtag(tag)
+        return category
     
     @staticmethod
     def calc_engagement(post: Dict[str, Any]) -> float:
         """인게이지먼트 계산: 좋아요 + (댓글 × 3) + (조회수 × 0.1)"""
-        likes = post.get("likesCount", 0) or 0
-        comments = post.get("commentsCount", 0) or 0
-        views = post.get("videoPlayCount", 0) or 0
+        likes, comments, views = _engagement_parts(post)
         return likes + (comments * 3) + (views * 0.1)
     
-    def calc_grade(self, hot_score: float, count: int, avg_engagement: float) -> Tuple[str, str]:
-        """등급 계산"""
+    def calc_grade(
+        self, hot_score: float, count: int, avg_engagement: float, trend: Optional[TagTrend] = None
+    ) -> Tuple[str, str]:
+        """등급 계산 (trend: 구간 추세, 없으면 핫스코어 구간으로 Rising 판정)"""
         if hot_score >= 50:
             grade = "🔥 Hot"
             if count >= 3 and avg_engagement >= 100000:
@@ -81,88 +604,121 @@ class InstagramAnalyzer:
                 reason = "고빈도"
             else:
                 reason = "높은 핫스코어"
-        elif hot_score >= 25:
+        elif trend is None:
+            if hot_score >= 25:
+                grade = "📈 Rising"
+                reason = "상승세"
+            else:
+                grade = "⚪ Stable"
+                reason = "안정적"
+        elif trend.velocity >= RISING_VELOCITY and trend.recent_count >= MIN_RECENT_COUNT:
             grade = "📈 Rising"
-            reason = "상승세"
+            if trend.previous_count == 0:
+                reason = "신규 등장"
+            else:
+                reason = f"직전 구간 대비 +{trend.velocity:.0%}"
+                if trend.acceleration:
+                    reason += " (가속)" if trend.acceleration > 0 else " (감속)"
         else:
             grade = "⚪ Stable"
-            reason = "안정적"
+            reason = f"하락세 {trend.velocity:.0%}" if trend.velocity <= FALLING_VELOCITY else "안정적"
         return grade, reason
     
-    def analyze_hashtags(self, posts: List[Dict[str, Any]]) -> List[HashtagStats]:
-        """해시태그 분석 - Top N개 반환"""
-        hashtag_data = defaultdict(lambda: {"count": 0, "total_engagement": 0})
-        exclude_set = {t.lower() for t in self.config.analysis.exclude_hashtags}
-
-        posts_with_caption = 0
-        posts_with_hashtags = 0
-        total_hashtags_found = 0
-        excluded_count = 0
-        excluded_tags_detail = defaultdict(int)
-
-        for post in posts:
-            caption = post.get("caption", "") or ""
-            if caption.strip():
-                posts_with_caption += 1
-            engagement = self.calc_engagement(post)
-
-            # 해시태그 추출 (대소문자 통합)
-            hashtags = re.findall(r'#(\w+)', caption)
-            if hashtags:
-                posts_with_hashtags += 1
-            total_hashtags_found += len(hashtags)
-            for tag in hashtags:
-                tag_lower = tag.lower()
-                if tag_lower in exclude_set:
-                    excluded_count += 1
-                    excluded_tags_detail[tag_lower] += 1
-                    continue
-                hashtag_data[tag_lower]["count"] += 1
-                hashtag_data[tag_lower]["total_engagement"] += engagement
-
-        print(f"  📊 해시태그 진단: 전체 {len(posts)}개 포스트")
-        print(f"     캡션 있음: {posts_with_caption}개 ({posts_with_caption*100//max(len(posts),1)}%)")
-        print(f"     해시태그 포함: {posts_with_hashtags}개 ({posts_with_hashtags*100//max(len(posts),1)}%)")
-        print(f"     해시태그 총 발견: {total_hashtags_found}개 → 제외 필터: {excluded_count}개 → 고유 태그: {len(hashtag_data)}개")
-        if excluded_tags_detail:
-            excluded_list = ", ".join(f"#{k}({v})" for k, v in sorted(excluded_tags_detail.items(), key=lambda x: x[1], reverse=True))
-            print(f"     🚫 제외된 태그: {excluded_list}")
-        
-        # 핫스코어 계산 및 정렬
+    def accumulator(self, start_seq: int = 0, exact: bool = False) -> AnalysisAccumulator:
+        """이 분석기 설정으로 누적기 생성 (start_seq: 첫 포스트의 전체 순번, exact: 근사 집계 설정 무시)"""
+        return AnalysisAccumulator(self, start_seq, exact=exact)
+
+    def analyze_hashtags(
+        self,
+        posts: Iterable[Dict[str, Any]],
+        records: Optional[List[CaptionRecord]] = None,
+    ) -> List[HashtagStats]:
+        """해시태그 분석 - Top N개 반환 (records: 포스트별 캡션 파싱 결과, 없으면 여기서 파싱)"""
+        acc = AnalysisAccumulator(self, top_viral=0)
+        if records is None:
+            for post in posts:
+                acc.add(post)
+        else:
+            for post, record in zip(posts, records):
+                acc.add(post, record)
+        return acc.finalize()[0]
+
+    @staticmethod
+    def _hot_score(count: int, total_engagement: float) -> Tuple[float, float]:
+        """(평균 인게이지먼트, 핫스코어) - 핫스코어 = 출현 수 × 평균 인게이지먼트^0.3"""
+        avg_eng = total_engagement / count if count > 0 else 0
+        hot_score = count * (avg_eng ** 0.3) if avg_eng > 0 else 0
+        return avg_eng, hot_score
+
+    def _top_hashtag_stats(
+        self,
+        tags: Iterable[Tuple[str, int, float]],
+        trends: Optional[Callable[[str], TagTrend]] = None,
+    ) -> List[HashtagStats]:
+        """(태그, 출현 수, 인게이지먼트 합계) 목록 → 핫스코어 순 Top N HashtagStats
+
+        tags는 첫 등장 순서여야 합니다 (핫스코어 동점 시 먼저 나온 태그 우선).
+        크기 N 힙으로 Top N만 고른 뒤(heapq.nlargest는 안정 정렬 후 자른 결과와 동일)
+        살아남은 태그만 카테고리 분류/추세/등급 계산/HashtagStats 생성을 합니다.
+        """
+        scored = (
+            (round(self._hot_score(count, total_engagement)[1], 1), tag, count, total_engagement)
+            for tag, count, total_engagement in tags
+        )
+        top = heapq.nlargest(self.config.analysis.top_hashtags, scored, key=itemgetter(0))
+
         result = []
-        for tag, data in hashtag_data.items():
-            avg_eng = data["total_engagement"] / data["count"] if data["count"] > 0 else 0
-            hot_score = data["count"] * (avg_eng ** 0.3) if avg_eng > 0 else 0
-            category = categorize_hashtag(tag)
-            grade, reason = self.calc_grade(hot_score, data["count"], avg_eng)
-            
+        for rounded_score, tag, count, total_engagement in top:
+            avg_eng, hot_score = self._hot_score(count, total_engagement)
+            trend = trends(tag) if trends is not None else None
+            grade, reason = self.calc_grade(hot_score, count, avg_eng, trend)
             result.append(HashtagStats(
                 tag=f"#{tag}",
-                count=data["count"],
-                total_engagement=data["total_engagement"],
+                count=count,
+                total_engagement=total_engagement,
                 avg_engagement=int(avg_eng),
-                hot_score=round(hot_score, 1),
-                category=category,
+                hot_score=rounded_score,
+                category=self._categorize(tag),
                 grade=grade,
                 grade_reason=reason,
+                velocity=trend.velocity if trend else None,
+                acceleration=trend.acceleration if trend else None,
             ))
-        
-        # 핫스코어 기준 정렬
-        result.sort(key=lambda x: x.hot_score, reverse=True)
-        return result[:self.config.analysis.top_hashtags]
+        return result
     
-    def find_viral_content(self, posts: List[Dict[str, Any]]) -> List[ViralContent]:
-        """바이럴 콘텐츠 찾기 - Top N개 반환"""
-        posts_with_engagement = [
-            (post, self.calc_engagement(post)) for post in posts
-        ]
-        posts_with_engagement.sort(key=lambda x: x[1], reverse=True)
-        
+    def find_viral_content(
+        self,
+        posts: Iterable[Dict[str, Any]],
+        records: Optional[List[CaptionRecord]] = None,
+    ) -> List[ViralContent]:
+        """바이럴 콘텐츠 찾기 - Top N개 반환 (records: 포스트별 캡션 파싱 결과, 없으면 Top N만 파싱)
+
+        전체 정렬 대신 크기 N 힙으로 선택합니다 (동점은 먼저 나온 포스트 우선).
+        """
+        acc = AnalysisAccumulator(self, hashtags=False)
+        if records is None:
+            for post in posts:
+                acc.add(post)
+        else:
+            for post, record in zip(posts, records):
+                acc.add(post, record)
+        return acc.finalize()[1]
+
+    def _build_viral(
+        self, ranked: List[Tuple[Dict[str, Any], float, CaptionRecord]]
+    ) -> List[ViralContent]:
+        """(포스트, 인게이지먼트, 캡션 파싱 결과) 순위 목록 → ViralContent 목록
+
+        팔로워 기준 분석이면 순위 목록의 인게이지먼트는 정규화 값이므로, 표시용으로 절대 인게이지먼트를 다시 계산합니다.
+        """
+        normalized = self.follower_scale is not None
         result = []
-        for rank, (post, engagement) in enumerate(posts_with_engagement[:self.config.analysis.top_viral], 1):
-            caption = (post.get("caption") or "")[:50]
+        for rank, (post, engagement, record) in enumerate(ranked, 1):
             # 이모지 + 요약 주제 생성
-            topic = self._generate_topic(caption, post)
+            topic = self._generate_topic(post, record)
+            if normalized:
+                engagement = self.calc_engagement(post)
+            rate = self.followers.rate(post.get("ownerUsername"), engagement) if self.followers is not None else None
             
             result.append(ViralContent(
                 rank=rank,
@@ -173,24 +729,107 @@ class InstagramAnalyzer:
                 views=post.get("videoPlayCount", 0) or 0,
                 engagement=int(engagement),
                 url=post.get("url", ""),
+                engagement_rate=round(rate, 2) if rate is not None else None,
             ))
         
         return result
     
-    def _generate_topic(self, caption: str, post: Dict[str, Any]) -> str:
-        """캡션에서 주제 추출 (카테고리 기반)"""
+    def find_outliers(
+        self,
+        posts: List[Dict[str, Any]],
+        cols: Optional[PostColumns] = None,
+        owner_engagement: Optional[Tuple[Any, Any]] = None,
+    ) -> List[OutlierContent]:
+        """아웃라이어 찾기 - 계정별 로버스트 z-score가 outlier_threshold를 넘는 포스트 (점수 순 Top N)
+
+        cols가 있으면 이미 만든 계정 ID/인게이지먼트 배열을, owner_engagement가 있으면 병렬 워커가 만든
+        포스트별 (계정 ID, 인게이지먼트) 배열을 그대로 사용합니다.
+        """
+        if cols is not None:
+            owners, engagement = cols.owner_ids, cols.engagement
+        elif owner_engagement is not None:
+            owners, engagement = owner_engagement
+        else:
+            owners = [post.get("ownerUsername") or "N/A" for post in posts]
+            engagement = [self.calc_engagement(post) for post in posts]
+        flagged = select_outliers(
+            owners, engagement, self.config.analysis.outlier_threshold, self.config.analysis.top_outliers
+        )
+
+        result = []
+        for rank, (i, score, median) in enumerate(flagged, 1):
+            post = posts[i]
+            record = cols.records[i] if cols is not None else parse_post(post)
+            eng = float(engagement[i])
+            result.append(OutlierContent(
+                rank=rank,
+                username=f"@{post.get('ownerUsername', 'N/A')}",
+                topic=self._generate_topic(post, record),
+                likes=post.get("likesCount", 0) or 0,
+                comments=post.get("commentsCount", 0) or 0,
+                views=post.get("videoPlayCount", 0) or 0,
+                engagement=int(eng),
+                account_median=int(median),
+                multiple=round(eng / median, 1) if median > 0 else 0.0,
+                score=round(score, 1),
+                url=post.get("url", ""),
+            ))
+        return result
+
+    def find_tag_cooccurrence(
+        self,
+        posts: List[Dict[str, Any]],
+        cols: Optional[PostColumns] = None,
+        records: Optional[List[CaptionRecord]] = None,
+        incidence: Optional[Tuple[List[str], Any, Any]] = None,
+    ) -> Tuple[List[TagPair], List[TagCluster]]:
+        """해시태그 동시 출현 분석 - (자주 함께 쓰인 쌍 Top N, 클러스터 Top N)
+
+        cols가 있으면 이미 만든 (태그 ID, 포스트 인덱스) 배열을, incidence가 있으면 병렬 워커가 만든
+        같은 형태의 배열을, 둘 다 없으면 records(없으면 여기서 파싱)를 사용합니다.
+        """
+        analysis = self.config.analysis
+        if cols is not None:
+            vocab, tag_ids, post_ids = cols.vocab, cols.tag_ids, cols.tag_posts
+        elif incidence is not None:
+            vocab, tag_ids, post_ids = incidence
+        else:
+            if records is None:
+                records = [parse_post(post) for post in posts]
+            vocab, tag_ids, post_ids = incidence_from_records(records, self.exclude_set, self.canonicalizer.canonical)
+        matrix, pairs, clusters = tag_cooccurrence(
+            len(vocab), tag_ids, post_ids, analysis.top_tag_pairs, analysis.top_tag_clusters
+        )
+        print(f"  → 해시태그 동시 출현: 고유 태그 {len(vocab)}개, 태그 쌍 {matrix.nnz}개 (희소 행렬)")
+
+        tag_pairs = [
+            TagPair(rank=rank, tag_a=f"#{vocab[a]}", tag_b=f"#{vocab[b]}", count=count, similarity=round(similarity, 2))
+            for rank, (a, b, count, similarity) in enumerate(pairs, 1)
+        ]
+        tag_clusters = [
+            TagCluster(number=number, name=f"#{vocab[tags[0]]}", tags=[f"#{vocab[t]}" for t in tags], posts=total)
+            for number, (tags, total) in enumerate(clusters, 1)
+        ]
+        return tag_pairs, tag_clusters
+
+    def _generate_topic(self, post: Dict[str, Any], record: CaptionRecord) -> str:
+        """캡션 앞부분(50자)에서 주제 추출 (카테고리 기반, 파싱 결과 재사용)"""
+        full_caption = post.get("caption") or ""
+        caption = full_caption[:50]
         if not caption:
             return "📌 콘텐츠"
 
         # 캡션의 해시태그에서 카테고리 판별
-        hashtags = re.findall(r'#(\w+)', caption)
-        for tag in hashtags:
-            cat = categorize_hashtag(tag)
+        for tag in hashtags_in_head(record, full_caption, 50):
+            cat = self._categorize(self.canonicalizer.canonical(tag))
             if cat != "general":
                 return f"{get_topic_emoji(cat)} {caption[:30]}"
 
         # 해시태그 없으면 캡션 내 키워드 기반
-        caption_lower = caption.lower()
+        if len(record.caption_lower) == len(full_caption):
+            caption_lower = record.caption_lower[:50]
+        else:
+            caption_lower = caption.lower()
         keyword_map = [
             (["패션", "코디", "옷", "fashion", "outfit", "style"], "item"),
             (["뷰티", "메이크업", "beauty", "makeup", "skincare"], "beauty"),
@@ -292,58 +931,209 @@ class InstagramAnalyzer:
         print(f"분석 시작: {len(posts)}개 포스트")
 
         if not posts:
-            print("  ⚠️ 수집된 포스트가 없습니다. 빈 결과를 반환합니다.")
-            if self.config.analysis.start_date and self.config.analysis.end_date:
-                period = f"{self.config.analysis.start_date} ~ {self.config.analysis.end_date}"
+            return self._empty_result(metadata)
+
+        metrics = get_metrics()
+        metrics.incr("posts_analyzed", len(posts))
+        self.use_profiles(data.get("profiles"))
+        self._print_follower_basis(post.get("ownerUsername") for post in posts)
+
+        cols = None
+        records = None
+        incidence = None
+        owner_engagement = None
+        with metrics.span("analyze.hashtags"):
+            if self.config.analysis.workers > 1:
+                hashtags, viral, parallel = self._analyze_parallel(posts)
+                incidence = parallel.incidence
+                owner_engagement = (parallel.owner_ids, parallel.engagement)
+            elif self._use_columnar():
+                hashtags, viral, cols = self._analyze_columnar(posts)
             else:
-                days = metadata.get("days", self.config.analysis.days)
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=days)
-                period = f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"
-            return AnalysisResult(
-                total_posts=0,
-                analysis_period=period,
-                accounts=metadata.get("accounts", []),
-                top_hashtags=[],
-                top_viral=[],
-                insights=[Insight(
-                    number=1,
-                    title="데이터 수집 실패",
-                    description="인스타그램에서 데이터를 수집하지 못했습니다. 네트워크 상태나 API 토큰을 확인해주세요.",
-                    keywords="수집 실패",
-                )],
-                generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
-            )
+                # 해시태그 집계 + 바이럴 Top N을 한 번의 순회로 누적 (캡션은 포스트당 1회 파싱, 동시 출현 분석에서 재사용)
+                records = [parse_post(post) for post in posts]
+                acc = self.accumulator()
+                for post, record in zip(posts, records):
+                    acc.add(post, record)
+                hashtags, viral = acc.finalize()
+                print(f"  → Top {len(hashtags)} 해시태그 추출")
+                print(f"  → Top {len(viral)} 바이럴 콘텐츠 추출")
+
+        # 계정별 아웃라이어
+        with metrics.span("analyze.outliers"):
+            outliers = self.find_outliers(posts, cols, owner_engagement)
+        print(f"  → 아웃라이어 {len(outliers)}개 (임계값 z > {self.config.analysis.outlier_threshold})")
+
+        # 해시태그 동시 출현 (함께 쓰인 쌍, 클러스터)
+        with metrics.span("analyze.cooccurrence"):
+            tag_pairs, tag_clusters = self.find_tag_cooccurrence(posts, cols, records, incidence)
+
+        return self._build_result(len(posts), metadata, hashtags, viral, outliers, tag_pairs, tag_clusters)
+
+    def _analyze_parallel(
+        self, posts: List[Dict[str, Any]]
+    ) -> Tuple[List[HashtagStats], List[ViralContent], Any]:
+        """프로세스 풀 분석 - 구간별 누적기를 순서대로 병합 (직렬 분석과 같은 결과)
+
+        워커가 만든 아웃라이어/동시 출현 입력 배열(ParallelResult)도 함께 반환합니다.
+        """
+        from .parallel import accumulate_parallel
+
+        parallel = accumulate_parallel(self, posts, self.config.analysis.workers)
+        hashtags, viral = parallel.acc.finalize()
+        print(f"  → Top {len(hashtags)} 해시태그 추출")
+        print(f"  → Top {len(viral)} 바이럴 콘텐츠 추출")
+        return hashtags, viral, parallel
 
-        # 해시태그 분석
-        hashtags = self.analyze_hashtags(posts)
+    def _use_columnar(self) -> bool:
+        """analysis.engine 설정에 따라 컬럼형 백엔드 사용 여부 결정"""
+        engine = self.config.analysis.engine
+        if engine == "python":
+            return False
+        if self.config.analysis.hashtag_counting == "approx":
+            # 근사 집계는 포스트를 배열로 보관하지 않는 누적기 경로에서만 의미가 있음
+            if engine == "numpy":
+                print("  ℹ️ 근사 해시태그 집계(approx)는 파이썬 분석 엔진으로 실행합니다.")
+            return False
+        if engine == "numpy" and not HAS_NUMPY:
+            print("  ⚠️ numpy가 설치되지 않아 파이썬 분석 엔진을 사용합니다.")
+        return HAS_NUMPY
+
+    def _analyze_columnar(
+        self, posts: List[Dict[str, Any]]
+    ) -> Tuple[List[HashtagStats], List[ViralContent], PostColumns]:
+        """컬럼형 백엔드 분석 - analyze_hashtags + find_viral_content와 같은 결과 (+ 아웃라이어용 컬럼)
+
+        포스트를 한 번만 배열로 변환하고 인게이지먼트/태그 집계/Top N 후보 선택을 벡터 연산으로 처리합니다.
+        """
+        cols = PostColumns(
+            posts,
+            self.config.analysis.exclude_hashtags,
+            followers=self.follower_scale,
+            canonical=self.canonicalizer.canonical,
+        )
+        _print_hashtag_diagnostics(cols, len(cols.vocab), self.canonicalizer)
+
+        counts, totals = cols.tag_totals()
+        candidates = cols.hashtag_candidates(counts, totals, self.config.analysis.top_hashtags)
+
+        trends: Optional[Callable[[str], TagTrend]] = None
+        windows = cols.trend_windows(self.config.analysis.trend_window_days)
+        if windows is not None:
+            window_counts, window_totals = cols.tag_window_totals(windows)
+            tag_ids = {cols.vocab[i]: i for i in candidates}
+
+            def lookup(tag: str) -> TagTrend:
+                i = tag_ids[tag]
+                return tag_trend(
+                    [int(c) for c in window_counts[i]],
+                    [int(t) for t in window_totals[i]],
+                )
+
+            trends = lookup
+
+        hashtags = self._top_hashtag_stats(
+            ((cols.vocab[i], int(counts[i]), float(totals[i])) for i in candidates),
+            trends,
+        )
         print(f"  → Top {len(hashtags)} 해시태그 추출")
 
-        # 바이럴 콘텐츠
-        viral = self.find_viral_content(posts)
+        engagement = cols.rank_engagement
+        viral = self._build_viral([
+            (posts[i], float(engagement[i]), cols.records[i])
+            for i in cols.top_engagement(self.config.analysis.top_viral)
+        ])
+        print(f"  → Top {len(viral)} 바이럴 콘텐츠 추출")
+        return hashtags, viral, cols
+
+    def analyze_stream(self, data: Dict[str, Any]) -> AnalysisResult:
+        """스트리밍 분석 - data["posts"]가 이터레이터여도 한 번만 순회
+
+        포스트를 보관하지 않고 해시태그 집계와 Top N 바이럴 힙만 유지하므로,
+        InstagramFetcher.fetch_all_iter와 함께 쓰면 메모리가 포스트 수와 무관하게 유지되고
+        분석이 다운로드와 동시에 진행됩니다.
+        """
+        metadata = data.get("metadata", {})
+
+        print("분석 시작: 스트리밍 모드")
+
+        self.use_profiles(data.get("profiles"))
+        acc = self.accumulator()
+        for post in data.get("posts", []):
+            acc.add(post)
+
+        if acc.total_posts == 0:
+            return self._empty_result(metadata)
+
+        self._print_follower_basis()
+        metrics = get_metrics()
+        metrics.incr("posts_analyzed", acc.total_posts)
+        # 누적은 다운로드와 겹쳐 진행되므로 스팬은 집계 마무리(Top N 선택)만 포함
+        with metrics.span("analyze.hashtags"):
+            hashtags, viral = acc.finalize()
+        print(f"  → Top {len(hashtags)} 해시태그 추출")
         print(f"  → Top {len(viral)} 바이럴 콘텐츠 추출")
 
+        return self._build_result(acc.total_posts, metadata, hashtags, viral)
+
+    def _analysis_period(self, metadata: Dict[str, Any]) -> str:
+        """분석 기간 문자열"""
+        if self.config.analysis.start_date and self.config.analysis.end_date:
+            return f"{self.config.analysis.start_date} ~ {self.config.analysis.end_date}"
+        days = metadata.get("days", self.config.analysis.days)
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        return f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"
+
+    def _empty_result(self, metadata: Dict[str, Any]) -> AnalysisResult:
+        """수집된 포스트가 없을 때의 결과"""
+        print("  ⚠️ 수집된 포스트가 없습니다. 빈 결과를 반환합니다.")
+        return AnalysisResult(
+            total_posts=0,
+            analysis_period=self._analysis_period(metadata),
+            accounts=metadata.get("accounts", []),
+            top_hashtags=[],
+            top_viral=[],
+            insights=[Insight(
+                number=1,
+                title="데이터 수집 실패",
+                description="인스타그램에서 데이터를 수집하지 못했습니다. 네트워크 상태나 API 토큰을 확인해주세요.",
+                keywords="수집 실패",
+            )],
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        )
+
+    def _build_result(
+        self,
+        total_posts: int,
+        metadata: Dict[str, Any],
+        hashtags: List[HashtagStats],
+        viral: List[ViralContent],
+        outliers: Optional[List[OutlierContent]] = None,
+        tag_pairs: Optional[List[TagPair]] = None,
+        tag_clusters: Optional[List[TagCluster]] = None,
+    ) -> AnalysisResult:
+        """집계 결과로 인사이트 생성 후 AnalysisResult 구성
+
+        outliers / tag_pairs / tag_clusters는 포스트 목록이 필요하므로 포스트를 보관하지 않는 스트리밍 분석에서는 없습니다.
+        """
         # 인사이트 생성
-        insights = self.generate_insights(hashtags, viral)
+        with get_metrics().span("analyze.insights"):
+            insights = self.generate_insights(hashtags, viral)
         print(f"  → {len(insights)}개 인사이트 생성")
 
-        # 분석 기간 문자열
-        if self.config.analysis.start_date and self.config.analysis.end_date:
-            period = f"{self.config.analysis.start_date} ~ {self.config.analysis.end_date}"
-        else:
-            days = metadata.get("days", self.config.analysis.days)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            period = f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"
-        
         return AnalysisResult(
-            total_posts=len(posts),
-            analysis_period=period,
+            total_posts=total_posts,
+            analysis_period=self._analysis_period(metadata),
             accounts=metadata.get("accounts", []),
             top_hashtags=hashtags,
             top_viral=viral,
             insights=insights,
             generated_at=datetime.now().isoformat(),
+            outliers=outliers or [],
+            engagement_basis="followers" if self.follower_scale is not None else "absolute",
+            tag_pairs=tag_pairs or [],
+            tag_clusters=tag_clusters or [],
         )
 
 
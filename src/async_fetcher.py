@@ -0,0 +1,323 @@
+"""asyncio 기반 인스타그램 데이터 수집 모듈
+
+ApifyClientAsync로 프로필 액터, 모든 포스트 청크, 데이터셋 페이지 다운로드를
+하나의 이벤트 루프에서 동시에 실행합니다. 동시 실행 수는 scraper.max_concurrency로 제한됩니다.
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from apify_client import ApifyClientAsync
+
+from .cache import ScraperCache
+from .config import Config
+from .fetcher import (
+    EMPTY_DATASET_MESSAGE, BaseInstagramFetcher, EmptyDatasetError, FetchTask, FetcherError,
+    InstagramFetcher, RawItemSpill, dedup_posts,
+)
+from .metrics import get_metrics
+from .planner import ChunkObservation
+from .schema import PostRecord
+from .store import parse_post_time
+
+
+class AsyncInstagramFetcher(BaseInstagramFetcher):
+    """비동기 인스타그램 데이터 수집기
+
+    InstagramFetcher와 같은 {"profiles", "posts", "metadata"} 구조를 반환합니다.
+
+    사용 예:
+        data = asyncio.run(AsyncInstagramFetcher(config).fetch_all())
+    """
+
+    # 데이터셋 페이지 크기 (list_items limit)
+    PAGE_SIZE = 1000
+
+    def __init__(self, config: Optional[Config] = None, raw_spill: Optional[RawItemSpill] = None):
+        super().__init__(config, raw_spill)
+        self.client = ApifyClientAsync(self.apify_token)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # 이벤트 루프 안에서 생성해야 하므로 지연 초기화
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.config.scraper.max_concurrency))
+        return self._semaphore
+
+    async def _actor_items(
+        self,
+        actor_id: str,
+        run_input: Dict[str, Any],
+        timeout_secs: int,
+        error_prefix: str,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """액터 실행 후 데이터셋 전체를 페이지 단위로 동시 다운로드
+
+        캐시 적중 시 호출을 생략하고, 같은 입력의 최근 성공 run이 있으면 그 데이터셋을 읽습니다.
+
+        fields를 지정하면 해당 필드만 다운로드합니다 (None이면 전체 필드).
+        """
+        metrics = get_metrics()
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ScraperCache.make_key(actor_id, run_input, fields)
+            # 캐시 파일 읽기/JSON 디코딩은 이벤트 루프를 막지 않도록 스레드에서 실행
+            items = await asyncio.to_thread(self._read_cache, cache_key)
+            if items is not None:
+                print(f"    💾 캐시 적중: {actor_id}")
+                metrics.incr("dataset_items", len(items), source="cache")
+                return items
+
+        run = await self._find_reusable_run(actor_id, run_input)
+        if run is not None:
+            self._print_reuse(actor_id, run, self._run_age_secs(run))
+            metrics.incr("run_reuses")
+        else:
+            try:
+                async with self.semaphore:
+                    metrics.incr("api_calls", api="apify", op="actor.call")
+                    with metrics.span("fetch.actor_call", actor=actor_id):
+                        run = await self.client.actor(actor_id).call(
+                            run_input=run_input,
+                            timeout_secs=timeout_secs,
+                            max_total_charge_usd=self.config.scraper.max_cost_usd,
+                        )
+            except Exception as e:
+                raise FetcherError(f"{error_prefix}: {e}")
+
+        with metrics.span("fetch.dataset_download", actor=actor_id):
+            items = await self._download_dataset(run["defaultDatasetId"], fields)
+        metrics.incr("dataset_items", len(items), source="apify")
+
+        if cache_key is not None and items:
+            await asyncio.to_thread(self.cache.put, cache_key, items, actor_id)
+        return items
+
+    def _read_cache(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """캐시 항목 전체 읽기 (없으면 None)"""
+        cached = self.cache.get(cache_key)
+        return list(cached) if cached is not None else None
+
+    async def _find_reusable_run(
+        self, actor_id: str, run_input: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """같은 입력으로 최근 성공한 run 조회 (InstagramFetcher._find_reusable_run과 동일 기준)"""
+        if self.config.scraper.reuse_run_secs <= 0:
+            return None
+        target = ScraperCache.make_key(actor_id, run_input)
+        metrics = get_metrics()
+        try:
+            async with self.semaphore:
+                metrics.incr("api_calls", api="apify", op="runs.list")
+                page = await self.client.actor(actor_id).runs().list(
+                    status="SUCCEEDED", desc=True, limit=self.REUSE_LOOKBACK_RUNS
+                )
+            for run in self._reuse_candidates(page.items):
+                if run["id"] not in self._run_input_keys:
+                    async with self.semaphore:
+                        metrics.incr("api_calls", api="apify", op="key_value_store.get_record")
+                        record = await self.client.key_value_store(
+                            run["defaultKeyValueStoreId"]
+                        ).get_record("INPUT")
+                    value = (record or {}).get("value")
+                    self._run_input_keys[run["id"]] = (
+                        ScraperCache.make_key(actor_id, value) if isinstance(value, dict) else None
+                    )
+                if self._run_input_keys[run["id"]] == target:
+                    return run
+        except Exception as e:
+            print(f"    ⚠️ 최근 실행 조회 실패, 새로 실행합니다: {e}")
+        return None
+
+    async def _download_dataset(
+        self, dataset_id: str, fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """데이터셋 아이템 수를 조회한 뒤 모든 페이지를 동시에 요청 (순서 유지)"""
+        dataset = self.client.dataset(dataset_id)
+        metrics = get_metrics()
+        async with self.semaphore:
+            metrics.incr("api_calls", api="apify", op="dataset.get")
+            info = await dataset.get()
+        item_count = (info or {}).get("itemCount", 0)
+
+        async def fetch_page(offset: int) -> List[Dict[str, Any]]:
+            async with self.semaphore:
+                metrics.incr("api_calls", api="apify", op="dataset.list_items")
+                page = await dataset.list_items(
+                    offset=offset, limit=self.PAGE_SIZE, fields=fields
+                )
+            return page.items
+
+        pages = await asyncio.gather(*[
+            fetch_page(offset) for offset in range(0, item_count, self.PAGE_SIZE)
+        ])
+        return [item for page in pages for item in page]
+
+    async def fetch_profiles(self, usernames: List[str]) -> Dict[str, Any]:
+        """프로필 데이터 수집"""
+        print(f"프로필 데이터 수집 중: {', '.join(usernames)}")
+
+        items = await self._actor_items(
+            "apify/instagram-profile-scraper",
+            {"usernames": usernames},
+            self.config.scraper.timeout_secs,
+            "프로필 스크래퍼 실행 실패",
+        )
+
+        profiles = {}
+        for item in items:
+            username = item.get("username", "").lower()
+            profiles[username] = item
+
+        print(f"  → {len(profiles)}개 프로필 수집 완료")
+        return profiles
+
+    async def fetch_posts(
+        self,
+        usernames: List[str],
+        days: int = 7,
+        content_type: str = "reels",
+        limit_per_account: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """포스트/릴스 데이터 수집 - 모든 청크 × 샤드를 동시에 실행
+
+        증분 모드(store.incremental)는 저장소 갱신 순서가 중요하므로
+        동기 수집기를 별도 스레드에서 실행합니다.
+        """
+        if self.store is not None:
+            sync_fetcher = InstagramFetcher(self.config, raw_spill=self.raw_spill)
+            return await asyncio.to_thread(
+                sync_fetcher.fetch_posts,
+                usernames, days, content_type, limit_per_account, start_date, end_date,
+            )
+
+        since_date, until_date = self._resolve_range(days, start_date, end_date)
+        tasks = self._plan_tasks(usernames, since_date, until_date)
+        print(f"콘텐츠 비동기 수집 중: {content_type}, {(until_date - since_date).days}일 ({len(tasks)}회 실행)")
+
+        results = await asyncio.gather(*[
+            self._fetch_task_with_retry(task, content_type, limit_per_account)
+            for task in tasks
+        ], return_exceptions=True)
+
+        if all(isinstance(result, EmptyDatasetError) for result in results):
+            raise EmptyDatasetError(EMPTY_DATASET_MESSAGE)
+
+        all_posts = []
+        errors: List[Tuple[FetchTask, BaseException]] = []
+        for task, result in zip(tasks, results):
+            if isinstance(result, EmptyDatasetError):
+                # 조용한 계정/기간 - 빈 결과
+                continue
+            if isinstance(result, FetcherError):
+                errors.append((task, result))
+                print(f"  ⚠️ {task.label} 실패 ({task.describe()}): {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                all_posts.extend(result)
+
+        if errors and not all_posts:
+            raise FetcherError(
+                f"모든 청크 수집 실패 ({len(errors)}/{len(tasks)}). 첫 오류: {errors[0][1]}"
+            )
+        if errors:
+            print(f"  ⚠️ {len(errors)}/{len(tasks)} 청크 실패 (수집된 데이터로 계속 진행)")
+
+        metrics = get_metrics()
+        with metrics.span("fetch.dedup"):
+            unique_posts = dedup_posts(all_posts)
+        if len(all_posts) != len(unique_posts):
+            metrics.incr("duplicates_removed", len(all_posts) - len(unique_posts))
+            print(f"  → 중복 제거: {len(all_posts)}개 → {len(unique_posts)}개")
+
+        print(f"✅ 전체 수집 완료: {len(unique_posts)}개 ({len(tasks)}회 실행)")
+        return unique_posts
+
+    async def _fetch_task_with_retry(
+        self, task: FetchTask, content_type: str, limit_per_account: int
+    ) -> List[Dict[str, Any]]:
+        """작업 1개 수집 (실패 시 지수 백오프로 scraper.chunk_retries회까지 재시도, 빈 데이터셋은 재시도 안 함)"""
+        retries = self.config.scraper.chunk_retries
+        for attempt in range(retries + 1):
+            try:
+                return await self._fetch_posts_chunk(
+                    task.usernames, content_type, limit_per_account, task.start, task.end
+                )
+            except EmptyDatasetError:
+                raise
+            except FetcherError as e:
+                if attempt == retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                get_metrics().incr("chunk_retries")
+                print(f"  🔁 {task.label} 재시도 {attempt + 1}/{retries} ({delay:.0f}초 후): {e}")
+                await asyncio.sleep(delay)
+
+    async def _fetch_posts_chunk(
+        self,
+        usernames: List[str],
+        content_type: str,
+        limit_per_account: int,
+        since_date: datetime,
+        until_date: datetime,
+    ) -> List[PostRecord]:
+        """단일 기간 포스트 수집"""
+        plan = self._plan_limit(usernames, limit_per_account, since_date, until_date)
+        run_input, timeout = self._build_posts_run_input(
+            usernames, content_type, plan.limit, since_date
+        )
+        items = await self._actor_items(
+            "apify/instagram-scraper", run_input, timeout, "Apify 스크래퍼 실행 실패",
+            fields=self._post_fields(),
+        )
+
+        # 원본 기록(raw_items)과 게시 빈도 이력 저장은 파일 쓰기이므로 스레드에서 실행
+        obs = ChunkObservation(usernames, since_date, until_date, plan)
+        return await asyncio.to_thread(self._filter_chunk, items, obs)
+
+    def _filter_chunk(self, items: List[Dict[str, Any]], obs: ChunkObservation) -> List[PostRecord]:
+        """기간 내 아이템만 PostRecord로 변환 + 청크 결과 검증"""
+        posts = []
+        for item in items:
+            post_date = parse_post_time(item)
+            in_range = post_date is None or obs.since_date <= post_date <= obs.until_date
+            obs.add(item, post_date, in_range)
+            if in_range:
+                posts.append(self._ingest(item))
+
+        self._check_chunk_counts(obs)
+        return posts
+
+    async def fetch_all(self) -> Dict[str, Any]:
+        """전체 데이터 수집 (프로필 + 포스트 동시 실행)"""
+        usernames = [a.username for a in self.config.accounts]
+
+        profiles, posts = await asyncio.gather(
+            self.fetch_profiles(usernames),
+            self.fetch_posts(
+                usernames=usernames,
+                days=self.config.analysis.days,
+                content_type=self.config.analysis.content_type,
+                limit_per_account=self.config.analysis.limit_per_account,
+                start_date=self.config.analysis.start_date,
+                end_date=self.config.analysis.end_date,
+            ),
+        )
+
+        return {
+            "profiles": profiles,
+            "posts": posts,
+            "metadata": self._build_metadata(usernames, len(posts)),
+        }
+
+
+def fetch_instagram_data_async(
+    config: Optional[Config] = None, raw_spill: Optional[RawItemSpill] = None
+) -> Dict[str, Any]:
+    """인스타그램 데이터 비동기 수집 (동기 코드에서 호출하는 편의 함수)"""
+    return asyncio.run(AsyncInstagramFetcher(config, raw_spill).fetch_all())
@@ -0,0 +1,159 @@
+"""Apify 스크래퍼 결과 로컬 캐시 모듈
+
+액터 ID + 실행 입력(run_input)의 해시를 키로 데이터셋 아이템을 디스크에 저장합니다.
+같은 계정/기간을 짧은 시간 안에 다시 수집하면 Apify 호출 없이 캐시에서 반환합니다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from .config import CacheConfig
+from .metrics import get_metrics
+
+
+# 결과에 영향을 주지 않는 운영용 입력값 (캐시 키에서 제외)
+_NON_RESULT_KEYS = frozenset({"maxRequestRetries", "maxConcurrency"})
+
+
+class ScraperCache:
+    """TTL/용량 기반으로 만료되는 디스크 캐시"""
+
+    def __init__(self, cache_dir: str, ttl_secs: int, max_size_mb: float):
+        self.cache_dir = Path(os.path.expanduser(cache_dir))
+        self.ttl_secs = ttl_secs
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cache_cfg: CacheConfig) -> Optional["ScraperCache"]:
+        """설정에서 캐시 생성 (비활성화 시 None)"""
+        if not cache_cfg.enabled:
+            return None
+        return cls(cache_cfg.dir, cache_cfg.ttl_secs, cache_cfg.max_size_mb)
+
+    @staticmethod
+    def make_key(
+        actor_id: str,
+        run_input: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+    ) -> str:
+        """액터 ID + 실행 입력 (+ 필드 프로젝션)으로 캐시 키 생성 (sha256)"""
+        relevant = {k: v for k, v in run_input.items() if k not in _NON_RESULT_KEYS}
+        key_data: Dict[str, Any] = {"actor": actor_id, "input": relevant}
+        if fields is not None:
+            key_data["fields"] = sorted(fields)
+        payload = json.dumps(
+            key_data,
+            sort_keys=True, ensure_ascii=False, separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.jsonl"
+
+    def get(self, key: str) -> Optional[Iterator[Dict[str, Any]]]:
+        """캐시 조회 (만료/없음 시 None). 아이템은 파일에서 한 줄씩 읽어 반환
+
+        다른 실행의 evict/만료 삭제와 겹쳐도 읽기가 실패하지 않도록 적중 판정 전에 파일을 열어 둡니다.
+        """
+        path = self._path(key)
+        try:
+            f = open(path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+
+        age = time.time() - os.fstat(f.fileno()).st_mtime
+        if age > self.ttl_secs:
+            f.close()
+            path.unlink(missing_ok=True)
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return self._read_items(f)
+
+    @staticmethod
+    def _read_items(f: TextIO) -> Iterator[Dict[str, Any]]:
+        with f:
+            next(f, None)  # 헤더 (actor, created_at)
+            for line in f:
+                yield json.loads(line)
+
+    def writer(self, key: str, actor_id: str = "") -> "CacheWriter":
+        """아이템을 한 줄씩 기록하는 캐시 writer (commit 시 반영)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return CacheWriter(self, self._path(key), actor_id)
+
+    def put(self, key: str, items: List[Dict[str, Any]], actor_id: str = ""):
+        """캐시 저장 후 용량 초과분 정리"""
+        writer = self.writer(key, actor_id)
+        for item in items:
+            writer.write(item)
+        writer.commit()
+
+    def evict(self):
+        """만료 항목 삭제 후, 총 용량이 상한을 넘으면 오래된 항목부터 삭제"""
+        if not self.cache_dir.exists():
+            return
+        now = time.time()
+        entries = []
+        with self._lock:
+            for path in self.cache_dir.glob("*.jsonl"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if now - stat.st_mtime > self.ttl_secs:
+                    path.unlink(missing_ok=True)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        get_metrics().incr("cache_hits" if hit else "cache_misses")
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스 카운터"""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class CacheWriter:
+    """캐시 항목 스트리밍 기록기 (임시 파일에 쓰고 commit 시 교체)"""
+
+    def __init__(self, cache: ScraperCache, path: Path, actor_id: str):
+        self._cache = cache
+        self._path = path
+        self._tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        self._file = open(self._tmp_path, "w", encoding="utf-8")
+        self._file.write(json.dumps({"actor": actor_id, "created_at": time.time()}) + "\n")
+
+    def write(self, item: Dict[str, Any]):
+        self._file.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    def commit(self):
+        self._file.close()
+        get_metrics().incr("bytes_written", self._tmp_path.stat().st_size, file="cache")
+        os.replace(self._tmp_path, self._path)
+        self._cache.evict()
+
+    def discard(self):
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
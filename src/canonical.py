@@ -0,0 +1,65 @@
+"""해시태그 정규화(canonicalization) 모듈
+
+같은 태그의 표기 변형이 서로 다른 태그로 집계·분류되지 않도록, 캡션에서 추출한 태그를
+정규형으로 바꾼 뒤 집계/카테고리 분류/동시 출현 분석을 합니다.
+
+정규화 규칙 (순서대로):
+    1. NFKC 정규화 - NFD로 풀린 한글 자모를 음절로 합치고(NFC), 전각 문자(ｏｏｔｄ)를 반각으로 바꿈
+    2. casefold - 대소문자 통합 (lower보다 넓은 규칙, 예: ß → ss)
+    3. 끝에 붙은 이모지/기호/결합 문자/제로폭 문자와 앞뒤 밑줄 제거 (#ootd_ → ootd)
+    4. 별칭 표 - 철자 변형을 대표 표기로 통합 (DEFAULT_HASHTAG_ALIASES + analysis.hashtag_aliases)
+
+원본 태그(파싱 단계에서 소문자화된 태그)를 키로 크기가 제한된 LRU 캐시에 기억하므로,
+같은 표기는 포스트가 아무리 많아도 한 번만 정규화합니다.
+"""
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Optional
+
+from .config import Config
+
+
+# 기본 별칭 (변형 → 대표 표기, 정규화 규칙 1~3을 적용한 뒤 비교)
+DEFAULT_HASHTAG_ALIASES: Dict[str, str] = {
+    "오오티디": "ootd",
+    "블핑": "블랙핑크",
+    "옷스타": "옷스타그램",
+}
+
+# 원본 태그 → 정규형 캐시 최대 크기
+DEFAULT_CACHE_SIZE = 65536
+
+# 태그 끝에서 떼어낼 유니코드 분류 (기호, 결합/둘러싸기 문자, 서식 문자)
+_TRAILING_CATEGORIES = frozenset({"So", "Sk", "Sm", "Sc", "Mn", "Me", "Cf"})
+
+
+def fold_hashtag(tag: str) -> str:
+    """정규화 규칙 1~3 적용 (별칭 제외) - 남는 글자가 없으면 빈 문자열"""
+    folded = unicodedata.normalize("NFKC", tag).casefold()
+    end = len(folded)
+    while end and unicodedata.category(folded[end - 1]) in _TRAILING_CATEGORIES:
+        end -= 1
+    return folded[:end].strip("_")
+
+
+class HashtagCanonicalizer:
+    """원본 태그 → 정규형 (canonical을 태그마다 호출, 결과는 LRU 캐시)"""
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None, cache_size: int = DEFAULT_CACHE_SIZE):
+        merged = dict(DEFAULT_HASHTAG_ALIASES)
+        merged.update(aliases or {})
+        self.aliases = {fold_hashtag(k.lstrip("#")): fold_hashtag(v.lstrip("#")) for k, v in merged.items()}
+        self.canonical = lru_cache(maxsize=cache_size)(self._canonical)
+
+    @classmethod
+    def from_config(cls, config: Config) -> "HashtagCanonicalizer":
+        analysis = config.analysis
+        return cls(analysis.hashtag_aliases, analysis.hashtag_cache_size)
+
+    def _canonical(self, tag: str) -> str:
+        folded = fold_hashtag(tag)
+        return self.aliases.get(folded, folded)
+
+    def cache_info(self):
+        """LRU 캐시 통계 (hits, misses, maxsize, currsize)"""
+        return self.canonical.cache_info()
@@ -0,0 +1,95 @@
+"""청크 수집 체크포인트 모듈
+
+긴 기간 백필 중 일부 청크가 실패해도, 완료된 청크 결과는 실행 디렉토리에 남겨
+`--resume <run_id>`로 다시 실행할 때 해당 청크를 건너뜁니다.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from .schema import PostRecord, post_to_json
+
+
+class ChunkCheckpoint:
+    """실행 디렉토리 아래 청크(기간 × 샤드)별 수집 결과 저장소
+
+    파일 구조: <run_dir>/checkpoints/
+        manifest.json      {"content_type", "usernames", "since", "until"}
+        chunk_<key>.json   [포스트, ...] (PostRecord 필드, 읽을 때 PostRecord로 복원)
+
+    "최근 N일" 기간은 실행 시각에 따라 움직이므로, 처음 실행한 기간을 manifest에 고정하고
+    재개 시 같은 기간·같은 청크 경계로 다시 분할합니다.
+    """
+
+    def __init__(self, checkpoint_dir: Path):
+        self.dir = Path(os.path.expanduser(str(checkpoint_dir)))
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.dir / "manifest.json"
+
+    def pin_range(
+        self,
+        usernames: List[str],
+        content_type: str,
+        since_date: datetime,
+        until_date: datetime,
+    ) -> Tuple[datetime, datetime]:
+        """재개 중이면 처음 실행한 수집 기간 반환, 아니면 현재 기간을 manifest에 기록"""
+        if self._manifest_path.exists():
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("content_type") == content_type and manifest.get("usernames") == usernames:
+                since = datetime.fromisoformat(manifest["since"])
+                until = datetime.fromisoformat(manifest["until"])
+                print(f"  ♻️ 체크포인트 기간으로 재개: {since.strftime('%Y-%m-%d')} ~ {until.strftime('%Y-%m-%d')}")
+                return since, until
+            print("  ⚠️ 체크포인트와 계정/콘텐츠 유형이 달라 새로 수집합니다.")
+
+        self._write_json(self._manifest_path, {
+            "content_type": content_type,
+            "usernames": usernames,
+            "since": since_date.isoformat(),
+            "until": until_date.isoformat(),
+        })
+        return since_date, until_date
+
+    @staticmethod
+    def chunk_key(
+        content_type: str, usernames: List[str], start: datetime, end: datetime
+    ) -> str:
+        """청크 식별 키 (콘텐츠 유형 + 계정 + 기간)"""
+        payload = json.dumps(
+            [content_type, sorted(u.lower() for u in usernames), start.isoformat(), end.isoformat()],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def resumable(self) -> bool:
+        """재개할 수 있는 체크포인트가 있는지 (수집 기간이 고정되고 완료된 청크가 1개 이상)"""
+        return self._manifest_path.exists() and any(self.dir.glob("chunk_*.json"))
+
+    def _chunk_path(self, key: str) -> Path:
+        return self.dir / f"chunk_{key}.json"
+
+    def load(self, key: str) -> Optional[List[PostRecord]]:
+        """완료된 청크 결과 (없으면 None)"""
+        path = self._chunk_path(key)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return [PostRecord.from_item(post) for post in json.load(f)]
+
+    def save(self, key: str, posts: List[PostRecord]):
+        """청크 결과 저장 (임시 파일에 쓰고 교체)"""
+        self._write_json(self._chunk_path(key), posts)
+
+    def _write_json(self, path: Path, data: Any):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, default=post_to_json)
+        os.replace(tmp_path, path)
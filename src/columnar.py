@@ -0,0 +1,249 @@
+"""컬럼형(NumPy) 분석 백엔드 모듈
+
+포스트를 한 번만 순회해 좋아요/댓글/조회수/계정/시각과 해시태그 출현(태그 ID, 포스트 인덱스)을
+배열로 변환한 뒤, 인게이지먼트·태그별 집계·핫스코어·Top N 후보 선택을 벡터 연산으로 계산합니다.
+
+결과는 InstagramAnalyzer의 파이썬 경로와 동일합니다:
+- 태그별 인게이지먼트 합계는 AnalysisAccumulator처럼 ×10 정수(좋아요×10 + 댓글×30 + 조회수)로
+  np.bincount 누적 후 10으로 나눔 (2^53 미만 정수는 float64로 정확히 표현)
+- 반올림된 핫스코어 정렬과 등급은 벡터 연산으로 고른 후보 태그에 대해서만 파이썬 float로 계산
+- 팔로워 기준 분석이면 ×10 정수를 FollowerIndex.scale_x10과 같은 정수 연산으로 정규화
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from .followers import FollowerIndex
+from .parsing import CaptionRecord, parse_caption
+from .schema import PostRecord
+from .trends import TrendWindows, day_index
+
+# 핫스코어 반올림(소수 첫째 자리) 오차를 덮는 후보 선택 여유폭
+_HOT_SCORE_MARGIN = 0.1
+
+
+class PostColumns:
+    """포스트 목록의 컬럼형 표현
+
+    - likes / comments / views: int64 배열 (None → 0)
+    - owner_ids: int32 배열 (owners[owner_ids[i]] = i번째 포스트 계정)
+    - tag_ids / tag_posts: 해시태그 출현마다 (태그 ID, 포스트 인덱스), 태그 ID는 첫 등장 순서
+    - vocab: 태그 ID → 소문자 태그
+    - timestamps: 포스트 시각 (epoch 초, 없으면 NaN) - 처음 접근할 때 계산
+    - days: 포스트 날짜 인덱스 (trends.day_index, 없으면 -1) - 처음 접근할 때 계산
+    - records: 포스트별 캡션 파싱 결과 (바이럴 주제 생성 등에서 재사용)
+    - followers: 있으면 태그 집계/바이럴 순위를 팔로워 수로 정규화한 인게이지먼트로 계산
+    - canonical: 있으면 태그를 정규형으로 바꿔 집계 (exclude_hashtags도 정규형으로 비교)
+    """
+
+    def __init__(
+        self,
+        posts: Iterable[Dict[str, Any]],
+        exclude_hashtags: List[str],
+        records: Optional[List[CaptionRecord]] = None,
+        followers: Optional[FollowerIndex] = None,
+        canonical: Optional[Callable[[str], str]] = None,
+    ):
+        if not HAS_NUMPY:
+            raise ImportError("컬럼형 분석 백엔드에는 numpy가 필요합니다: pip install numpy")
+
+        if canonical is None:
+            exclude_set = {t.lower() for t in exclude_hashtags}
+        else:
+            exclude_set = {canonical(t.lower()) for t in exclude_hashtags}
+        likes, comments, views, owner_ids, raw_timestamps = [], [], [], [], []
+        tag_ids, tag_posts = [], []
+        tag_index: Dict[str, int] = {}
+        owner_index: Dict[str, int] = {}
+        self.vocab: List[str] = []
+        self.owners: List[str] = []
+
+        # 해시태그 진단 카운터 (AnalysisAccumulator와 같은 이름)
+        self.posts_with_caption = 0
+        self.posts_with_hashtags = 0
+        self.total_hashtags_found = 0
+        self.excluded_count = 0
+        self.excluded_tags_detail: Dict[str, int] = {}
+
+        self.records: List[CaptionRecord] = records if records is not None else []
+        n = 0
+        for n, post in enumerate(posts, 1):
+            if type(post) is PostRecord:
+                like, comment, view = post.likesCount, post.commentsCount, post.videoPlayCount
+                timestamp, owner, caption = post.timestamp, post.ownerUsername, post.caption
+                if owner is None:
+                    owner = "N/A"
+            else:
+                like, comment, view = post.get("likesCount"), post.get("commentsCount"), post.get("videoPlayCount")
+                timestamp, owner, caption = post.get("timestamp"), post.get("ownerUsername", "N/A"), post.get("caption")
+            likes.append(like or 0)
+            comments.append(comment or 0)
+            views.append(view or 0)
+            raw_timestamps.append(timestamp)
+
+            owner_id = owner_index.get(owner)
+            if owner_id is None:
+                owner_id = owner_index[owner] = len(self.owners)
+                self.owners.append(owner)
+            owner_ids.append(owner_id)
+
+            if records is None:
+                record = parse_caption(caption)
+                self.records.append(record)
+            else:
+                record = records[n - 1]
+            if record.has_caption:
+                self.posts_with_caption += 1
+            hashtags = record.hashtags
+            if hashtags:
+                self.posts_with_hashtags += 1
+            self.total_hashtags_found += len(hashtags)
+            for tag_lower in hashtags:
+                if canonical is not None:
+                    tag_lower = canonical(tag_lower)
+                    if not tag_lower:
+                        continue
+                if tag_lower in exclude_set:
+                    self.excluded_count += 1
+                    self.excluded_tags_detail[tag_lower] = self.excluded_tags_detail.get(tag_lower, 0) + 1
+                    continue
+                tag_id = tag_index.get(tag_lower)
+                if tag_id is None:
+                    tag_id = tag_index[tag_lower] = len(self.vocab)
+                    self.vocab.append(tag_lower)
+                tag_ids.append(tag_id)
+                tag_posts.append(n - 1)
+
+        self.total_posts = n
+        self.likes = np.array(likes, dtype=np.int64)
+        self.comments = np.array(comments, dtype=np.int64)
+        self.views = np.array(views, dtype=np.int64)
+        self.owner_ids = np.array(owner_ids, dtype=np.int32)
+        self.tag_ids = np.array(tag_ids, dtype=np.int32)
+        self.tag_posts = np.array(tag_posts, dtype=np.int64)
+        self._raw_timestamps = raw_timestamps
+        self._timestamps: Optional["np.ndarray"] = None
+        self._days: Optional["np.ndarray"] = None
+        self._engagement: Optional["np.ndarray"] = None
+        self._engagement_x10: Optional["np.ndarray"] = None
+        self._followers = followers
+
+    @property
+    def engagement(self) -> "np.ndarray":
+        """인게이지먼트 = 좋아요 + (댓글 × 3) + (조회수 × 0.1) (InstagramAnalyzer.calc_engagement와 동일)"""
+        if self._engagement is None:
+            self._engagement = (self.likes + self.comments * 3) + self.views * 0.1
+        return self._engagement
+
+    @property
+    def engagement_x10(self) -> "np.ndarray":
+        """태그 집계용 인게이지먼트 × 10 정수 (좋아요×10 + 댓글×30 + 조회수, 팔로워 기준이면 정규화)"""
+        if self._engagement_x10 is None:
+            values = self.likes * 10 + self.comments * 30 + self.views
+            if self._followers is not None:
+                values = self._followers.scale_x10_array(self.owners, self.owner_ids, values)
+            self._engagement_x10 = values
+        return self._engagement_x10
+
+    @property
+    def rank_engagement(self) -> "np.ndarray":
+        """바이럴 순위 기준 인게이지먼트 (팔로워 기준이면 정규화 값 = engagement_x10 / 10)"""
+        if self._followers is None:
+            return self.engagement
+        return self.engagement_x10 / 10
+
+    @property
+    def timestamps(self) -> "np.ndarray":
+        """포스트 시각 (epoch 초, 파싱 불가 시 NaN)"""
+        if self._timestamps is None:
+            values = np.full(self.total_posts, np.nan)
+            for i, timestamp in enumerate(self._raw_timestamps):
+                if not timestamp:
+                    continue
+                try:
+                    values[i] = datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+                except (ValueError, TypeError, AttributeError):
+                    continue
+            self._timestamps = values
+        return self._timestamps
+
+    @property
+    def days(self) -> "np.ndarray":
+        """포스트 날짜 인덱스 (date.toordinal, 파싱 불가 시 -1)"""
+        if self._days is None:
+            values = [day_index(timestamp) for timestamp in self._raw_timestamps]
+            self._days = np.array([-1 if d is None else d for d in values], dtype=np.int64)
+        return self._days
+
+    def trend_windows(self, window_days: int) -> Optional[TrendWindows]:
+        """관찰한 날짜 범위로 추세 구간 구성 (AnalysisAccumulator와 같은 기준)"""
+        valid = self.days[self.days >= 0]
+        if len(valid) == 0:
+            return None
+        return TrendWindows.from_span(int(valid.min()), int(valid.max()), window_days)
+
+    def tag_window_totals(self, windows: TrendWindows) -> Tuple["np.ndarray", "np.ndarray"]:
+        """(태그, 구간)별 (출현 수, 인게이지먼트 합계 × 10) - (태그 수 × 구간 수) 배열
+
+        해시태그 출현마다 날짜 → 구간 번호를 벡터 연산으로 구해 태그 ID × 구간 수 + 구간 번호로 bincount합니다.
+        """
+        size = len(self.vocab) * windows.count
+        days = self.days[self.tag_posts]
+        k = (windows.end_day - days) // windows.window
+        valid = (days >= 0) & (days <= windows.end_day) & (k < windows.count)
+        cells = self.tag_ids[valid].astype(np.int64) * windows.count + k[valid]
+        engagement_x10 = self.engagement_x10[self.tag_posts[valid]]
+        counts = np.bincount(cells, minlength=size)
+        totals_x10 = np.bincount(cells, weights=engagement_x10, minlength=size)
+        shape = (len(self.vocab), windows.count)
+        return counts.reshape(shape), totals_x10.reshape(shape)
+
+    def tag_totals(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """태그별 (출현 수, 인게이지먼트 합계) - 태그 ID 순서"""
+        size = len(self.vocab)
+        counts = np.bincount(self.tag_ids, minlength=size)
+        totals_x10 = np.bincount(self.tag_ids, weights=self.engagement_x10[self.tag_posts], minlength=size)
+        return counts, totals_x10 / 10
+
+    @staticmethod
+    def hot_scores(counts: "np.ndarray", totals: "np.ndarray") -> "np.ndarray":
+        """태그별 핫스코어 = 출현 수 × 평균 인게이지먼트^0.3 (평균이 0 이하면 0)"""
+        avg = totals / np.maximum(counts, 1)
+        positive = avg > 0
+        scores = np.zeros(len(avg))
+        scores[positive] = counts[positive] * np.power(avg[positive], 0.3)
+        return scores
+
+    def hashtag_candidates(self, counts: "np.ndarray", totals: "np.ndarray", top_n: int) -> "np.ndarray":
+        """Top N 해시태그가 될 수 있는 태그 ID (첫 등장 순서)
+
+        N번째 핫스코어에서 반올림 오차 여유폭 이내인 태그를 모두 포함하므로,
+        후보를 파이썬 경로와 같은 방식으로 정렬하면 전체 정렬과 같은 Top N이 나옵니다.
+        """
+        size = len(self.vocab)
+        if size <= top_n:
+            return np.arange(size)
+        if top_n <= 0:
+            return np.arange(0)
+        scores = self.hot_scores(counts, totals)
+        threshold = np.partition(scores, size - top_n)[size - top_n]
+        return np.nonzero(scores >= threshold - _HOT_SCORE_MARGIN)[0]
+
+    def top_engagement(self, k: int) -> "np.ndarray":
+        """순위 기준 인게이지먼트 상위 k개 포스트 인덱스 (내림차순, 동점은 먼저 나온 포스트 우선)"""
+        engagement = self.rank_engagement
+        n = len(engagement)
+        if k <= 0 or n == 0:
+            return np.arange(0)
+        if n > k:
+            kth = np.partition(engagement, n - k)[n - k]
+            candidates = np.nonzero(engagement >= kth)[0]
+        else:
+            candidates = np.arange(n)
+        order = np.argsort(-engagement[candidates], kind="stable")
+        return candidates[order][:k]
@@ -3,7 +3,7 @@ import os
 import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # 기본 계정 목록 (Streamlit Cloud용)
 DEFAULT_ACCOUNTS = [
@@ -37,6 +37,39 @@ class ScraperConfig:
     timeout_per_account_secs: int = 60  # 계정당 추가 타임아웃
     max_cost_usd: float = 2.0           # 실행당 비용 상한선 ($)
     min_results_threshold: int = 3      # 최소 결과 수 (이하면 경고)
+    max_parallel_runs: int = 3          # 청크/샤드 분할 시 동시에 실행할 액터 run 수 (1이면 순차)
+    shard_size: int = 8                 # 액터 run 1회당 최대 계정 수 (0이면 분할 안 함)
+    raw_items: bool = False             # True면 포스트 전체 필드 수집 (아카이브용, 기본은 분석 필드만)
+    adaptive_limit: bool = True         # 계정별 게시 빈도 이력으로 resultsLimit 계산 (False면 days_ago*5 휴리스틱)
+    limit_margin: float = 1.3           # 게시 빈도 기반 limit 여유 배수
+    reuse_run_secs: int = 6 * 3600      # 같은 입력의 최근 성공 run 재사용 유효 시간 (0이면 항상 새로 실행)
+    chunk_retries: int = 2              # 청크 실패 시 재시도 횟수
+    retry_backoff_secs: float = 30.0    # 재시도 대기 기본값 (지수 백오프: 30초 → 60초 → ...)
+
+
+@dataclass
+class CacheConfig:
+    """스크래퍼 결과 로컬 캐시 설정"""
+    enabled: bool = True
+    ttl_secs: int = 3 * 3600                        # 캐시 유효 시간 (3시간)
+    max_size_mb: float = 200.0                      # 캐시 디렉토리 용량 상한
+    dir: str = "~/instagram-research/.cache/apify"  # 캐시 저장 위치
+
+
+@dataclass
+class StoreConfig:
+    """증분 수집용 포스트 저장소 설정"""
+    incremental: bool = False                  # True면 계정별 워터마크 이후 포스트만 수집
+    dir: str = "~/instagram-research/.store"   # 저장소 위치
+    retention_days: int = 180                  # 저장소 보관 기간 (일)
+
+
+@dataclass
+class MetricsConfig:
+    """실행 메트릭/트레이싱 내보내기 설정"""
+    enabled: bool = True                        # 실행 디렉토리에 metrics.json 기록 (단계별 소요 시간, 카운터)
+    prometheus_textfile: Optional[str] = None   # 지정 시 node_exporter textfile collector용 .prom 파일도 기록
+    max_trace_spans: int = 10000                # metrics.json trace에 남길 개별 스팬 수 상한 (집계는 전부 포함)
 
 
 @dataclass
@@ -47,9 +80,22 @@ class AnalysisConfig:
     outlier_threshold: float = 2.0
     top_hashtags: int = 50
     top_viral: int = 7
+    top_outliers: int = 20            # 계정별 아웃라이어 최대 개수 (outlier_threshold: 로버스트 z-score 임계값)
+    top_tag_pairs: int = 10           # 자주 함께 쓰인 해시태그 쌍 개수
+    top_tag_clusters: int = 5         # 해시태그 클러스터 개수
     start_date: Optional[str] = None  # "YYYY-MM-DD" 형식, 직접 기간 지정 시
     end_date: Optional[str] = None    # "YYYY-MM-DD" 형식, 직접 기간 지정 시
     exclude_hashtags: List[str] = field(default_factory=list)
+    hashtag_aliases: Dict[str, str] = field(default_factory=dict)  # 해시태그 별칭 (변형 → 대표 표기)
+    hashtag_cache_size: int = 65536   # 해시태그 정규화 LRU 캐시 크기 (원본 표기 수)
+    hashtag_counting: str = "exact"   # 해시태그 집계: exact(태그별 정확 집계) / approx(Space-Saving 근사, 메모리 고정)
+    hashtag_error: float = 0.0005     # approx일 때 빈도 오차 상한 ε (태그 출현 수 × ε, 카운터 ⌈1/ε⌉개)
+    engine: str = "auto"              # 분석 엔진: auto(numpy 있으면 컬럼형) / numpy / python
+    workers: int = 1                  # 분석 프로세스 수 (2 이상이면 포스트를 나눠 병렬 누적 후 병합)
+    trend_window_days: int = 0        # 추세 비교 구간 길이 (일, 0이면 기간 ÷ 3)
+    rolling: bool = False             # True면 날짜별 누적기를 저장해 새 포스트만 분석 (롤링 윈도우)
+    engagement_basis: str = "absolute"  # 순위 기준: absolute(인게이지먼트) / followers(팔로워 수로 정규화)
+    reference_followers: int = 10000  # followers 기준일 때 환산할 기준 팔로워 수
 
 
 @dataclass
@@ -62,6 +108,9 @@ class Config:
     google_config_path: str
     gmail_token_key: str
     sheets_token_key: str
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    store: StoreConfig = field(default_factory=StoreConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
     
     @classmethod
     def load_from_secrets(cls) -> "Config":
@@ -114,9 +163,22 @@ class Config:
             outlier_threshold=analysis_data.get("outlier_threshold", 2.0),
             top_hashtags=analysis_data.get("top_hashtags", 50),
             top_viral=analysis_data.get("top_viral", 7),
+            top_outliers=analysis_data.get("top_outliers", 20),
+            top_tag_pairs=analysis_data.get("top_tag_pairs", 10),
+            top_tag_clusters=analysis_data.get("top_tag_clusters", 5),
             start_date=analysis_data.get("start_date"),
             end_date=analysis_data.get("end_date"),
             exclude_hashtags=analysis_data.get("exclude_hashtags", []),
+            hashtag_aliases=analysis_data.get("hashtag_aliases") or {},
+            hashtag_cache_size=analysis_data.get("hashtag_cache_size", 65536),
+            hashtag_counting=analysis_data.get("hashtag_counting", "exact"),
+            hashtag_error=analysis_data.get("hashtag_error", 0.0005),
+            engine=analysis_data.get("engine", "auto"),
+            workers=analysis_data.get("workers", 1),
+            trend_window_days=analysis_data.get("trend_window_days", 0),
+            rolling=analysis_data.get("rolling", False),
+            engagement_basis=analysis_data.get("engagement_basis", "absolute"),
+            reference_followers=analysis_data.get("reference_followers", 10000),
         )
         
         google = data.get("google", {})
@@ -129,6 +191,36 @@ class Config:
             timeout_per_account_secs=scraper_data.get("timeout_per_account_secs", 60),
             max_cost_usd=scraper_data.get("max_cost_usd", 2.0),
             min_results_threshold=scraper_data.get("min_results_threshold", 3),
+            max_parallel_runs=scraper_data.get("max_parallel_runs", 3),
+            shard_size=scraper_data.get("shard_size", 8),
+            raw_items=scraper_data.get("raw_items", False),
+            adaptive_limit=scraper_data.get("adaptive_limit", True),
+            limit_margin=scraper_data.get("limit_margin", 1.3),
+            reuse_run_secs=scraper_data.get("reuse_run_secs", 6 * 3600),
+            chunk_retries=scraper_data.get("chunk_retries", 2),
+            retry_backoff_secs=scraper_data.get("retry_backoff_secs", 30.0),
+        )
+
+        cache_data = data.get("cache", {})
+        cache = CacheConfig(
+            enabled=cache_data.get("enabled", True),
+            ttl_secs=cache_data.get("ttl_secs", 3 * 3600),
+            max_size_mb=cache_data.get("max_size_mb", 200.0),
+            dir=cache_data.get("dir", "~/instagram-research/.cache/apify"),
+        )
+
+        store_data = data.get("store", {})
+        store = StoreConfig(
+            incremental=store_data.get("incremental", False),
+            dir=store_data.get("dir", "~/instagram-research/.store"),
+            retention_days=store_data.get("retention_days", 180),
+        )
+
+        metrics_data = data.get("metrics", {})
+        metrics = MetricsConfig(
+            enabled=metrics_data.get("enabled", True),
+            prometheus_textfile=metrics_data.get("prometheus_textfile"),
+            max_trace_spans=metrics_data.get("max_trace_spans", 10000),
         )
 
         return cls(
@@ -140,6 +232,9 @@ class Config:
             google_config_path=os.path.expanduser(google.get("config_path", "~/.config/agent-skills/google.yaml")),
             gmail_token_key=google.get("gmail_token_key", "gmail-token-json"),
             sheets_token_key=google.get("sheets_token_key", "google-sheets-token-json"),
+            cache=cache,
+            store=store,
+            metrics=metrics,
         )
 
 
@@ -0,0 +1,294 @@
+"""해시태그 동시 출현(co-occurrence) 모듈
+
+포스트별 해시태그 집합으로 태그 × 태그 동시 출현 행렬을 희소(CSR) 배열로 만들고,
+"자주 함께 쓰인" 태그 쌍과 태그 클러스터를 뽑습니다.
+
+- 행렬은 상삼각(a < b)만 저장합니다. indices[indptr[a]:indptr[a+1]]가 태그 a와 함께 쓰인 태그 b,
+  data가 두 태그가 함께 나온 포스트 수입니다.
+- 포스트마다 (a, b) 쌍을 정수 키 a × V + b로 만들어 정렬·집계하므로, 메모리는 고유 태그 수 V의
+  제곱이 아니라 실제로 나온 쌍 수에 비례합니다 (5만 태그도 V × V 행렬을 만들지 않음).
+- 2개 이상 포스트에 나온 태그만, 포스트당 최대 MAX_TAGS_PER_POST개(먼저 등장한 태그 순)까지 쌍을 만듭니다.
+- 유사도는 Jaccard = 동시 출현 / (a 출현 + b 출현 - 동시 출현) 입니다 (출현 = 태그가 포함된 포스트 수).
+- 클러스터는 유사도가 CLUSTER_JACCARD 이상인 쌍을 간선으로 본 연결 요소입니다.
+
+NumPy가 없으면 같은 결과를 파이썬 딕셔너리(쌍 키 → 포스트 수)로 계산합니다.
+"""
+from itertools import combinations
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from .parsing import CaptionRecord
+
+
+# 쌍을 만들 태그의 최소 출현 포스트 수 (한 번만 나온 태그는 함께 쓰였다고 보기 어려움)
+MIN_TAG_POSTS = 2
+# 포스트당 쌍을 만들 최대 태그 수 (태그를 수십 개 다는 포스트의 쌍 폭증 방지)
+MAX_TAGS_PER_POST = 30
+# 자주 함께 쓰인 쌍/클러스터 간선이 되기 위한 최소 동시 출현 포스트 수
+MIN_PAIR_POSTS = 3
+# 클러스터 간선 최소 유사도 (Jaccard)
+CLUSTER_JACCARD = 0.2
+# 클러스터 최소 태그 수
+MIN_CLUSTER_SIZE = 3
+
+
+class CooccurrenceMatrix:
+    """상삼각 태그 × 태그 동시 출현 행렬 (CSR)
+
+    - indptr: 길이 V + 1, indices / data: 길이 nnz (NumPy가 없으면 리스트)
+    - doc_freq: 태그별 출현 포스트 수 (포스트 안 중복 태그는 1회)
+    """
+
+    def __init__(self, indptr: Any, indices: Any, data: Any, doc_freq: Any):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.doc_freq = doc_freq
+
+    @property
+    def nnz(self) -> int:
+        """저장된 (a, b) 쌍 수"""
+        return len(self.data)
+
+    @classmethod
+    def from_incidence(
+        cls, tag_ids: Sequence[int], post_ids: Sequence[int], vocab_size: int
+    ) -> "CooccurrenceMatrix":
+        """해시태그 출현마다 (태그 ID, 포스트 인덱스) → 행렬 (post_ids는 오름차순)"""
+        if not HAS_NUMPY:
+            return cls._from_incidence_python(tag_ids, post_ids, vocab_size)
+
+        size = max(vocab_size, 1)
+        keys = np.unique(np.asarray(post_ids, dtype=np.int64) * size + np.asarray(tag_ids, dtype=np.int64))
+        posts, tags = keys // size, keys % size
+        del keys
+        doc_freq = np.bincount(tags, minlength=vocab_size)
+
+        keep = doc_freq[tags] >= MIN_TAG_POSTS
+        posts, tags = posts[keep], tags[keep]
+        lengths = np.zeros(0, dtype=np.int64)
+        if len(posts):
+            # 포스트 안 순위 (태그 ID 오름차순 = 먼저 등장한 태그 순)
+            starts = np.flatnonzero(np.r_[True, posts[1:] != posts[:-1]])
+            lengths = np.diff(starts, append=len(posts))
+            rank = np.arange(len(posts)) - np.repeat(starts, lengths)
+            keep = rank < MAX_TAGS_PER_POST
+            posts, tags = posts[keep], tags[keep]
+            lengths = np.minimum(lengths, MAX_TAGS_PER_POST)
+            del starts, rank, keep
+
+        # 같은 포스트 안에서 d칸 떨어진 태그끼리 쌍 (d = 1 .. 포스트당 태그 수 - 1)
+        # 쌍 수를 먼저 세어 키 배열을 한 번만 할당하고 제자리 정렬 (임시 배열 최소화)
+        pair_keys = np.empty(int((lengths * (lengths - 1) // 2).sum()), dtype=np.int64)
+        filled = 0
+        for d in range(1, MAX_TAGS_PER_POST):
+            if d >= len(posts):
+                break
+            same = np.flatnonzero(posts[d:] == posts[:-d])
+            if len(same) == 0:
+                break
+            chunk = pair_keys[filled:filled + len(same)]
+            np.multiply(tags[same], size, out=chunk)
+            chunk += tags[same + d]
+            filled += len(same)
+        del posts, tags
+        pair_keys.sort()
+        first = np.ones(len(pair_keys), dtype=bool)
+        np.not_equal(pair_keys[1:], pair_keys[:-1], out=first[1:])
+        starts = np.flatnonzero(first)
+        del first
+        counts = np.diff(starts, append=len(pair_keys))
+        pair_keys = pair_keys[starts]
+
+        indptr = np.zeros(vocab_size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pair_keys // size, minlength=vocab_size), out=indptr[1:])
+        return cls(indptr, (pair_keys % size).astype(np.int32), counts, doc_freq)
+
+    @classmethod
+    def _from_incidence_python(
+        cls, tag_ids: Sequence[int], post_ids: Sequence[int], vocab_size: int
+    ) -> "CooccurrenceMatrix":
+        groups: List[List[int]] = []
+        previous = None
+        for tag, post in zip(tag_ids, post_ids):
+            if post != previous:
+                groups.append([])
+                previous = post
+            groups[-1].append(tag)
+        post_tags = [sorted(set(group)) for group in groups]
+
+        doc_freq = [0] * vocab_size
+        for tags in post_tags:
+            for tag in tags:
+                doc_freq[tag] += 1
+
+        size = max(vocab_size, 1)
+        pair_counts: Dict[int, int] = {}
+        for tags in post_tags:
+            tags = [tag for tag in tags if doc_freq[tag] >= MIN_TAG_POSTS][:MAX_TAGS_PER_POST]
+            for a, b in combinations(tags, 2):
+                key = a * size + b
+                pair_counts[key] = pair_counts.get(key, 0) + 1
+
+        indptr = [0] * (vocab_size + 1)
+        indices, data = [], []
+        for key in sorted(pair_counts):
+            indptr[key // size + 1] += 1
+            indices.append(key % size)
+            data.append(pair_counts[key])
+        for i in range(vocab_size):
+            indptr[i + 1] += indptr[i]
+        return cls(indptr, indices, data, doc_freq)
+
+    def edges(self, min_posts: int = MIN_PAIR_POSTS) -> Tuple[Any, Any, Any, Any]:
+        """동시 출현이 min_posts 이상인 쌍의 (a, b, 동시 출현 포스트 수, Jaccard) 배열 - (a, b) 순"""
+        if not HAS_NUMPY:
+            a, b, counts, jaccard = [], [], [], []
+            for row in range(len(self.indptr) - 1):
+                for k in range(self.indptr[row], self.indptr[row + 1]):
+                    count = self.data[k]
+                    if count >= min_posts:
+                        col = self.indices[k]
+                        a.append(row)
+                        b.append(col)
+                        counts.append(count)
+                        jaccard.append(count / (self.doc_freq[row] + self.doc_freq[col] - count))
+            return a, b, counts, jaccard
+
+        rows = np.repeat(np.arange(len(self.indptr) - 1), np.diff(self.indptr))
+        keep = self.data >= min_posts
+        a, b, counts = rows[keep], self.indices[keep].astype(np.int64), self.data[keep]
+        return a, b, counts, counts / (self.doc_freq[a] + self.doc_freq[b] - counts)
+
+
+def incidence_from_records(
+    records: Sequence[CaptionRecord],
+    exclude_set: AbstractSet[str],
+    canonical: Optional[Callable[[str], str]] = None,
+    offset: int = 0,
+) -> Tuple[List[str], List[int], List[int]]:
+    """캡션 파싱 결과 → (태그 ID → 태그, 출현별 태그 ID, 출현별 포스트 인덱스) - PostColumns와 같은 ID 순서
+
+    canonical이 있으면 정규형 태그 기준이며, exclude_set도 같은 형태(정규형)여야 합니다.
+    offset은 records[0]의 전체 포스트 인덱스입니다 (병렬 분석 구간).
+    """
+    tag_index: Dict[str, int] = {}
+    vocab: List[str] = []
+    tag_ids: List[int] = []
+    post_ids: List[int] = []
+    for i, record in enumerate(records, offset):
+        for tag in record.hashtags:
+            if canonical is not None:
+                tag = canonical(tag)
+                if not tag:
+                    continue
+            if tag in exclude_set:
+                continue
+            tag_id = tag_index.get(tag)
+            if tag_id is None:
+                tag_id = tag_index[tag] = len(vocab)
+                vocab.append(tag)
+            tag_ids.append(tag_id)
+            post_ids.append(i)
+    return vocab, tag_ids, post_ids
+
+
+def concat_incidence(
+    parts: Sequence[Tuple[List[str], Sequence[int], Sequence[int]]]
+) -> Tuple[List[str], Any, Any]:
+    """구간별 incidence_from_records 결과(포스트 인덱스 순)를 이어 붙여 전체 결과로 합침
+
+    구간마다 태그 ID가 따로 매겨져 있으므로 전체 첫 등장 순서로 다시 매깁니다.
+    결과는 전체 records로 한 번에 만든 것과 같습니다 (NumPy가 있으면 ID/인덱스는 배열).
+    """
+    tag_index: Dict[str, int] = {}
+    tag_ids: List[Any] = []
+    post_ids: List[Any] = []
+    for vocab, part_tags, part_posts in parts:
+        remap = [tag_index.setdefault(tag, len(tag_index)) for tag in vocab]
+        if HAS_NUMPY:
+            tag_ids.append(np.asarray(remap, dtype=np.int64)[np.asarray(part_tags, dtype=np.int64)])
+            post_ids.append(np.asarray(part_posts, dtype=np.int64))
+        else:
+            tag_ids.extend(remap[t] for t in part_tags)
+            post_ids.extend(part_posts)
+    if HAS_NUMPY:
+        if not tag_ids:
+            return [], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return list(tag_index), np.concatenate(tag_ids), np.concatenate(post_ids)
+    return list(tag_index), tag_ids, post_ids
+
+
+def select_pairs(edges: Tuple[Any, Any, Any, Any], limit: int) -> List[Tuple[int, int, int, float]]:
+    """유사도(Jaccard) 순 상위 limit개 쌍 (a, b, 동시 출현 수, Jaccard) - 동점은 동시 출현 수, 먼저 등장한 태그 순"""
+    a, b, counts, jaccard = edges
+    if limit <= 0 or len(counts) == 0:
+        return []
+    if not HAS_NUMPY:
+        order = sorted(range(len(counts)), key=lambda i: (-jaccard[i], -counts[i], a[i], b[i]))[:limit]
+    else:
+        order = np.lexsort((b, a, -counts, -jaccard))[:limit].tolist()
+    return [(int(a[i]), int(b[i]), int(counts[i]), float(jaccard[i])) for i in order]
+
+
+def find_clusters(
+    edges: Tuple[Any, Any, Any, Any],
+    doc_freq: Sequence[int],
+    limit: int,
+    min_similarity: float = CLUSTER_JACCARD,
+) -> List[Tuple[List[int], int]]:
+    """유사도 min_similarity 이상 간선의 연결 요소 → [(태그 ID 목록, 출현 합계)] (출현 합계 순 상위 limit개)
+
+    태그 ID 목록은 출현 포스트 수 내림차순이며, MIN_CLUSTER_SIZE개 미만인 요소는 제외합니다.
+    """
+    a, b, _, jaccard = edges
+    if HAS_NUMPY:
+        strong = np.flatnonzero(jaccard >= min_similarity)
+        links = zip(a[strong].tolist(), b[strong].tolist())
+    else:
+        links = ((a[i], b[i]) for i in range(len(a)) if jaccard[i] >= min_similarity)
+
+    parent: Dict[int, int] = {}
+
+    def root(x: int) -> int:
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for x, y in links:
+        rx, ry = root(x), root(y)
+        if rx != ry:
+            parent[max(rx, ry)] = min(rx, ry)
+
+    components: Dict[int, List[int]] = {}
+    for tag in parent:
+        components.setdefault(root(tag), []).append(tag)
+
+    clusters = []
+    for tags in components.values():
+        if len(tags) < MIN_CLUSTER_SIZE:
+            continue
+        tags.sort(key=lambda t: (-int(doc_freq[t]), t))
+        clusters.append((tags, sum(int(doc_freq[t]) for t in tags)))
+    clusters.sort(key=lambda c: (-c[1], min(c[0])))
+    return clusters[:max(limit, 0)]
+
+
+def tag_cooccurrence(
+    vocab_size: int,
+    tag_ids: Sequence[int],
+    post_ids: Sequence[int],
+    top_pairs: int,
+    top_clusters: int,
+) -> Tuple[CooccurrenceMatrix, List[Tuple[int, int, int, float]], List[Tuple[List[int], int]]]:
+    """(행렬, 자주 함께 쓰인 쌍, 클러스터) - 쌍/클러스터는 태그 ID 기준"""
+    matrix = CooccurrenceMatrix.from_incidence(tag_ids, post_ids, vocab_size)
+    edges = matrix.edges()
+    return matrix, select_pairs(edges, top_pairs), find_clusters(edges, matrix.doc_freq, top_clusters)
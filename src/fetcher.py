@@ -1,10 +1,23 @@
 """Apify를 사용한 인스타그램 데이터 수집 모듈"""
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import json
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from apify_client import ApifyClient
 
+from .cache import ScraperCache
+from .checkpoint import ChunkCheckpoint
 from .config import get_config, Config
+from .store import PostStore, parse_post_time
+from .schema import PostRecord, post_fields
+from .planner import ChunkObservation, LimitPlan, LimitPlanner, heuristic_limit
 from .credentials import get_apify_token
+from .metrics import get_metrics
 
 
 class FetcherError(Exception):
@@ -12,16 +25,431 @@ class FetcherError(Exception):
     pass
 
 
-class InstagramFetcher:
-    """인스타그램 데이터 수집기"""
-    
-    def __init__(self, config: Optional[Config] = None):
+class EmptyDatasetError(FetcherError):
+    """액터 실행은 끝났지만 데이터셋이 비어 있음
+
+    조용한 계정/기간이면 다시 실행해도 같으므로 청크 재시도 대상이 아니며, 여러 청크 중 일부가
+    비어 있으면 빈 결과로 처리합니다. 수집 전체가 비었을 때만 오류로 올립니다 (토큰/계정명 확인용).
+    """
+
+
+EMPTY_DATASET_MESSAGE = (
+    "수집 완전 실패: 스크래퍼에서 데이터를 가져오지 못했습니다. "
+    "API 토큰 또는 계정명을 확인해주세요."
+)
+
+
+@dataclass
+class FetchTask:
+    """액터 run 1회 단위 수집 작업 (기간 청크 × 계정 샤드)"""
+    index: int
+    total: int
+    usernames: List[str]
+    start: datetime
+    end: datetime
+    shard_no: int = 1
+    shard_count: int = 1
+
+    @property
+    def label(self) -> str:
+        return f"[{self.index}/{self.total}]"
+
+    def describe(self) -> str:
+        text = f"{self.start.strftime('%Y-%m-%d')} ~ {self.end.strftime('%Y-%m-%d')}"
+        if self.shard_count > 1:
+            text += f", 샤드 {self.shard_no}/{self.shard_count} ({len(self.usernames)}개 계정)"
+        return text
+
+
+@dataclass
+class ChunkResult:
+    """작업(청크 × 샤드) 단위 수집 결과"""
+    task: FetchTask
+    posts: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    resumed: bool = False       # 체크포인트에서 복원된 결과
+    empty: bool = False         # 데이터셋이 비어 있었음 (EmptyDatasetError, 정상 결과)
+
+
+@dataclass
+class _ChunkDone:
+    """스트리밍 수집에서 청크 종료를 알리는 표식"""
+    index: int
+    error: Optional[str] = None
+    empty: bool = False
+
+
+class RawItemSpill:
+    """원본 Apify 아이템을 JSON Lines 파일로 흘려보내는 기록기 (수집 스레드 간 공유)
+
+    scraper.raw_items로 전체 필드를 받을 때, 분석에는 PostRecord만 메모리에 두고
+    원본은 도착하는 대로 디스크에 씁니다. 기간 필터 후·중복 제거 전 아이템이며,
+    청크 재시도/재개 시 같은 아이템이 다시 기록될 수 있습니다 (url로 중복 제거해 사용).
+    파일은 첫 아이템이 올 때 이어쓰기 모드로 엽니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.count = 0
+        self._file = None
+        self._start_offset = 0
+        self._lock = threading.Lock()
+
+    def write(self, item: Dict[str, Any]):
+        line = json.dumps(item, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+                self._start_offset = self._file.tell()
+            self._file.write(line)
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                get_metrics().incr("bytes_written", self._file.tell() - self._start_offset, file="raw_items")
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "RawItemSpill":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def dedup_posts(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """URL 기준 중복 제거 (먼저 등장한 포스트 유지)"""
+    seen_urls = set()
+    unique_posts = []
+    for post in posts:
+        url = post.get("url", post.get("id", id(post)))
+        if url not in seen_urls:
+            seen_urls.add(url)
+            unique_posts.append(post)
+    return unique_posts
+
+
+class BaseInstagramFetcher:
+    """동기/비동기 수집기 공통 로직 (기간 분할, 액터 입력 구성, 결과 검증)"""
+
+    # 30일 초과 기간은 자동 분할
+    MAX_CHUNK_DAYS = 30
+    # 재사용 후보로 조회할 최근 성공 run 수 (액터당)
+    REUSE_LOOKBACK_RUNS = 25
+
+    def __init__(self, config: Optional[Config] = None, raw_spill: Optional[RawItemSpill] = None):
         self.config = config or get_config()
         # 환경변수/Secrets에서 토큰 우선 확인
-        apify_token = get_apify_token() or self.config.apify_token
-        if not apify_token:
+        self.apify_token = get_apify_token() or self.config.apify_token
+        if not self.apify_token:
             raise ValueError("APIFY_TOKEN이 설정되지 않았습니다.")
-        self.client = ApifyClient(apify_token)
+        self.cache = ScraperCache.from_config(self.config.cache)
+        self.store = PostStore.from_config(self.config.store)
+        self.planner = LimitPlanner.from_config(self.config)
+        # run 재사용 조회 결과 메모 (run id → 입력 키)
+        self._run_input_keys: Dict[str, Optional[str]] = {}
+        # 지정 시 기간 내 원본 아이템을 디스크에 기록 (메모리에는 PostRecord만)
+        self.raw_spill = raw_spill
+
+    @staticmethod
+    def _resolve_range(
+        days: int, start_date: Optional[str], end_date: Optional[str]
+    ) -> Tuple[datetime, datetime]:
+        """수집 기간 계산 (start/end 지정 시 해당 일자 전체, 아니면 최근 days일)"""
+        if start_date and end_date:
+            since_date = datetime.strptime(start_date, "%Y-%m-%d")
+            until_date = datetime.strptime(end_date, "%Y-%m-%d").replace(hour=23, minute=59, second=59)
+        else:
+            since_date = datetime.now() - timedelta(days=days)
+            until_date = datetime.now()
+        return since_date, until_date
+
+    def _split_chunks(self, since_date: datetime, until_date: datetime) -> List[Tuple[datetime, datetime]]:
+        """기간을 MAX_CHUNK_DAYS 단위로 분할"""
+        chunks = []
+        chunk_start = since_date
+        while chunk_start < until_date:
+            chunk_end = min(chunk_start + timedelta(days=self.MAX_CHUNK_DAYS), until_date)
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end + timedelta(seconds=1)
+        return chunks
+
+    def _split_shards(self, usernames: List[str]) -> List[List[str]]:
+        """계정 목록을 scraper.shard_size개씩 분할 (0이면 분할 안 함)"""
+        size = self.config.scraper.shard_size
+        if size <= 0 or len(usernames) <= size:
+            return [list(usernames)]
+        return [usernames[i:i + size] for i in range(0, len(usernames), size)]
+
+    def _plan_tasks(
+        self, usernames: List[str], since_date: datetime, until_date: datetime
+    ) -> List[FetchTask]:
+        """기간 청크 × 계정 샤드 조합으로 액터 run 작업 목록 구성 (기간 → 샤드 순)"""
+        chunks = self._split_chunks(since_date, until_date)
+        shards = self._split_shards(usernames)
+        total = len(chunks) * len(shards)
+        tasks = []
+        for c_start, c_end in chunks:
+            for shard_no, shard in enumerate(shards, 1):
+                tasks.append(FetchTask(
+                    index=len(tasks) + 1,
+                    total=total,
+                    usernames=shard,
+                    start=c_start,
+                    end=c_end,
+                    shard_no=shard_no,
+                    shard_count=len(shards),
+                ))
+        return tasks
+
+    def _plan_limit(
+        self,
+        usernames: List[str],
+        limit_per_account: int,
+        since_date: datetime,
+        until_date: datetime,
+    ) -> LimitPlan:
+        """run 1회의 resultsLimit 결정 (게시 빈도 이력이 있으면 planner, 없으면 휴리스틱)"""
+        if self.planner is not None:
+            plan = self.planner.plan(usernames, limit_per_account, since_date, until_date)
+        else:
+            days_ago = (datetime.now() - since_date).days
+            plan = LimitPlan(limit=heuristic_limit(limit_per_account, days_ago), source="heuristic")
+
+        if plan.limit != limit_per_account:
+            reason = "게시 빈도 기반" if plan.source != "heuristic" else "과거 기간 자동 조정"
+            print(f"    ℹ️ resultsLimit {limit_per_account} → {plan.limit} ({reason})")
+        return plan
+
+    def _build_posts_run_input(
+        self,
+        usernames: List[str],
+        content_type: str,
+        results_limit: int,
+        since_date: datetime,
+    ) -> Tuple[Dict[str, Any], int]:
+        """instagram-scraper 실행 입력과 동적 타임아웃(초) 구성"""
+        # 콘텐츠 타입에 따른 URL 생성
+        direct_urls = []
+        for username in usernames:
+            if content_type == "reels":
+                direct_urls.append(f"https://www.instagram.com/{username}/reels/")
+            else:
+                direct_urls.append(f"https://www.instagram.com/{username}/")
+
+        scraper_cfg = self.config.scraper
+
+        run_input = {
+            "directUrls": direct_urls,
+            "resultsLimit": results_limit,
+            "resultsType": "posts" if content_type != "stories" else "stories",
+            "searchType": "user",
+            "onlyPostsNewerThan": since_date.strftime("%Y-%m-%d"),
+            # NOTE: apify/instagram-scraper는 maxRequestRetries를 공식 input으로
+            # 노출하지 않아 무시될 수 있음. 실질적 방어는 timeout_secs와 max_total_charge_usd.
+            "maxRequestRetries": scraper_cfg.max_request_retries,
+            "maxConcurrency": scraper_cfg.max_concurrency,
+        }
+
+        # 동적 타임아웃: 기본 + 계정 수 비례
+        timeout = scraper_cfg.timeout_secs + (len(usernames) * scraper_cfg.timeout_per_account_secs)
+        timeout = min(timeout, 900)  # 최대 15분
+        return run_input, timeout
+
+    @staticmethod
+    def _run_age_secs(run: Dict[str, Any]) -> Optional[float]:
+        """run 종료 후 경과 시간 (초, 알 수 없으면 None)"""
+        finished = run.get("finishedAt")
+        if isinstance(finished, str):
+            try:
+                finished = datetime.fromisoformat(finished.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+        if not isinstance(finished, datetime):
+            return None
+        if finished.tzinfo is None:
+            finished = finished.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - finished).total_seconds()
+
+    def _reuse_candidates(self, runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """최근 성공 run 중 scraper.reuse_run_secs 이내에 끝난 것만 (최신순)"""
+        window = self.config.scraper.reuse_run_secs
+        candidates = []
+        for run in runs:
+            age = self._run_age_secs(run)
+            if age is not None and age <= window and run.get("defaultDatasetId"):
+                candidates.append(run)
+        return candidates
+
+    @staticmethod
+    def _print_reuse(actor_id: str, run: Dict[str, Any], age_secs: Optional[float]):
+        minutes = int((age_secs or 0) // 60)
+        print(f"    ♻️ 최근 실행 재사용: {actor_id} run {run.get('id')} ({minutes}분 전 완료)")
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """청크 재시도 대기 시간 (지수 백오프: base * 2^attempt, 최대 10분)"""
+        return min(self.config.scraper.retry_backoff_secs * (2 ** attempt), 600.0)
+
+    def _post_fields(self) -> Optional[List[str]]:
+        """포스트 데이터셋 다운로드 시 요청할 필드 (scraper.raw_items면 전체)"""
+        return post_fields(raw=self.config.scraper.raw_items)
+
+    def _ingest(self, item: Dict[str, Any]) -> PostRecord:
+        """기간 내 아이템 → PostRecord (원본 기록기가 있으면 원본은 디스크로)"""
+        if self.raw_spill is not None:
+            self.raw_spill.write(item)
+        return PostRecord.from_item(item)
+
+    def _check_chunk_counts(self, obs: ChunkObservation):
+        """Circuit Breaker: 청크 수집 결과 검증 + 게시 빈도 이력 갱신"""
+        total_items, in_range = obs.total_items, obs.in_range
+        print(f"    → {in_range}개 콘텐츠 (전체 {total_items}개 중 기간 내 필터)")
+        if self.planner is not None:
+            self.planner.observe(obs)
+
+        min_threshold = self.config.scraper.min_results_threshold
+        if total_items == 0:
+            raise EmptyDatasetError(EMPTY_DATASET_MESSAGE)
+        if total_items > 0 and in_range == 0:
+            print("    ⚠️ 수집된 콘텐츠가 모두 지정 기간 밖입니다.")
+        elif in_range < min_threshold:
+            print(f"    ⚠️ 수집량이 최소 기준({min_threshold}개) 미만입니다 ({in_range}개).")
+
+    def _build_metadata(self, usernames: List[str], total_posts: Optional[int] = None) -> Dict[str, Any]:
+        """fetch_all 결과의 metadata 구성"""
+        metadata = {
+            "fetched_at": datetime.now().isoformat(),
+            "days": self.config.analysis.days,
+            "content_type": self.config.analysis.content_type,
+            "accounts": usernames,
+        }
+        if total_posts is None:
+            # 스트리밍 수집은 아직 진행 전이라 포스트 수/캐시 통계를 확정할 수 없음
+            return metadata
+        metadata["total_posts"] = total_posts
+        if self.cache is not None:
+            metadata["cache"] = self.cache.stats()
+            print(f"  💾 캐시: 적중 {self.cache.hits}회 / 미스 {self.cache.misses}회")
+        return metadata
+
+
+class InstagramFetcher(BaseInstagramFetcher):
+    """인스타그램 데이터 수집기"""
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        checkpoint_dir: Optional[Path] = None,
+        raw_spill: Optional[RawItemSpill] = None,
+    ):
+        super().__init__(config, raw_spill)
+        self.client = ApifyClient(self.apify_token)
+        self._reuse_lock = threading.Lock()
+        # 지정 시 완료된 청크를 저장하고, 같은 디렉토리로 다시 실행하면 건너뜀 (--resume)
+        self.checkpoint = ChunkCheckpoint(checkpoint_dir) if checkpoint_dir is not None else None
+
+    def _find_reusable_run(self, actor_id: str, run_input: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """같은 입력으로 최근 성공한 run 조회 (없거나 조회 실패 시 None)
+
+        run 입력은 각 run의 기본 key-value store INPUT 레코드에서 읽고, 캐시 키와 같은
+        기준(결과에 영향 없는 운영용 입력 제외)으로 비교합니다.
+        """
+        if self.config.scraper.reuse_run_secs <= 0:
+            return None
+        target = ScraperCache.make_key(actor_id, run_input)
+        metrics = get_metrics()
+        try:
+            metrics.incr("api_calls", api="apify", op="runs.list")
+            runs = self.client.actor(actor_id).runs().list(
+                status="SUCCEEDED", desc=True, limit=self.REUSE_LOOKBACK_RUNS
+            ).items
+            for run in self._reuse_candidates(runs):
+                with self._reuse_lock:
+                    if run["id"] not in self._run_input_keys:
+                        metrics.incr("api_calls", api="apify", op="key_value_store.get_record")
+                        record = self.client.key_value_store(
+                            run["defaultKeyValueStoreId"]
+                        ).get_record("INPUT")
+                        value = (record or {}).get("value")
+                        self._run_input_keys[run["id"]] = (
+                            ScraperCache.make_key(actor_id, value) if isinstance(value, dict) else None
+                        )
+                    if self._run_input_keys[run["id"]] == target:
+                        return run
+        except Exception as e:
+            print(f"    ⚠️ 최근 실행 조회 실패, 새로 실행합니다: {e}")
+        return None
+
+    def _iter_actor_items(
+        self,
+        actor_id: str,
+        run_input: Dict[str, Any],
+        timeout_secs: int,
+        error_prefix: str,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """액터 실행 후 데이터셋 아이템 순회
+
+        캐시 적중 시 Apify 호출을 생략하고, 같은 입력의 최근 성공 run이 있으면
+        새로 실행하지 않고 그 데이터셋을 읽습니다. fields를 지정하면 해당 필드만 다운로드합니다 (None이면 전체 필드).
+        데이터셋 다운로드 스팬은 순회 전체 시간입니다 (아이템을 받아 처리하는 시간 포함).
+        """
+        metrics = get_metrics()
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ScraperCache.make_key(actor_id, run_input, fields)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print(f"    💾 캐시 적중: {actor_id}")
+                count = 0
+                for item in cached:
+                    count += 1
+                    yield item
+                metrics.incr("dataset_items", count, source="cache")
+                return
+
+        run = self._find_reusable_run(actor_id, run_input)
+        if run is not None:
+            self._print_reuse(actor_id, run, self._run_age_secs(run))
+            metrics.incr("run_reuses")
+        else:
+            try:
+                metrics.incr("api_calls", api="apify", op="actor.call")
+                with metrics.span("fetch.actor_call", actor=actor_id):
+                    run = self.client.actor(actor_id).call(
+                        run_input=run_input,
+                        timeout_secs=timeout_secs,
+                        max_total_charge_usd=self.config.scraper.max_cost_usd,
+                    )
+            except Exception as e:
+                raise FetcherError(f"{error_prefix}: {e}")
+
+        writer = self.cache.writer(cache_key, actor_id) if cache_key is not None else None
+        count = 0
+        completed = False
+        started = time.perf_counter()
+        try:
+            metrics.incr("api_calls", api="apify", op="dataset.iterate_items")
+            for item in self.client.dataset(run["defaultDatasetId"]).iterate_items(fields=fields):
+                if writer is not None:
+                    writer.write(item)
+                count += 1
+                yield item
+            completed = True
+        finally:
+            metrics.record(
+                "fetch.dataset_download", time.perf_counter() - started, {"actor": actor_id}, error=not completed
+            )
+            metrics.incr("dataset_items", count, source="apify")
+            if writer is not None:
+                # 빈 결과/중단된 순회는 캐시하지 않음 (일시적 실패가 TTL 동안 고착되는 것 방지)
+                if completed and count:
+                    writer.commit()
+                else:
+                    writer.discard()
     
     def fetch_profiles(self, usernames: List[str]) -> Dict[str, Any]:
         """프로필 데이터 수집"""
@@ -33,26 +461,19 @@ class InstagramFetcher:
             "usernames": usernames,
         }
 
-        try:
-            run = self.client.actor("apify/instagram-profile-scraper").call(
-                run_input=run_input,
-                timeout_secs=scraper_cfg.timeout_secs,
-                max_total_charge_usd=scraper_cfg.max_cost_usd,
-            )
-        except Exception as e:
-            raise FetcherError(f"프로필 스크래퍼 실행 실패: {e}")
-        
         profiles = {}
-        for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
+        for item in self._iter_actor_items(
+            "apify/instagram-profile-scraper",
+            run_input,
+            scraper_cfg.timeout_secs,
+            "프로필 스크래퍼 실행 실패",
+        ):
             username = item.get("username", "").lower()
             profiles[username] = item
         
         print(f"  → {len(profiles)}개 프로필 수집 완료")
         return profiles
     
-    # 30일 초과 기간은 자동 분할
-    MAX_CHUNK_DAYS = 30
-
     def fetch_posts(
         self,
         usernames: List[str],
@@ -65,73 +486,147 @@ class InstagramFetcher:
         """포스트/릴스 데이터 수집
 
         start_date/end_date가 지정되면 해당 기간, 아니면 최근 days일 기준.
-        30일 초과 기간은 자동으로 30일 단위로 분할 수집합니다.
+        30일 초과 기간은 자동으로 30일 단위로, 계정 목록은 scraper.shard_size개씩 분할하고,
+        scraper.max_parallel_runs개까지 액터 run을 동시에 실행합니다.
+        실패한 청크는 지수 백오프로 scraper.chunk_retries회까지 재시도하고,
+        checkpoint_dir가 지정되어 있으면 완료된 청크는 다음 실행(재개)에서 건너뜁니다.
+        store.incremental이 켜져 있으면 계정별 워터마크 이후만 수집해 저장된 이력과 병합합니다.
         """
-        if start_date and end_date:
-            since_date = datetime.strptime(start_date, "%Y-%m-%d")
-            until_date = datetime.strptime(end_date, "%Y-%m-%d").replace(hour=23, minute=59, second=59)
-        else:
-            since_date = datetime.now() - timedelta(days=days)
-            until_date = datetime.now()
+        since_date, until_date = self._resolve_range(days, start_date, end_date)
 
-        total_days = (until_date - since_date).days
-
-        # 30일 이하면 단일 실행
-        if total_days <= self.MAX_CHUNK_DAYS:
-            print(f"콘텐츠 수집 중: {content_type}, {total_days}일 ({since_date.strftime('%Y-%m-%d')} ~ {until_date.strftime('%Y-%m-%d')})")
-            return self._fetch_posts_chunk(
+        if self.store is not None:
+            return self._fetch_incremental(
                 usernames, content_type, limit_per_account, since_date, until_date
             )
 
-        # 30일 초과면 청크 분할
-        chunks = []
-        chunk_start = since_date
-        while chunk_start < until_date:
-            chunk_end = min(chunk_start + timedelta(days=self.MAX_CHUNK_DAYS), until_date)
-            chunks.append((chunk_start, chunk_end))
-            chunk_start = chunk_end + timedelta(seconds=1)
+        if self.checkpoint is not None:
+            since_date, until_date = self.checkpoint.pin_range(
+                usernames, content_type, since_date, until_date
+            )
 
-        print(f"콘텐츠 수집 중: {content_type}, {total_days}일 → {len(chunks)}회 분할 수집")
+        posts, _ = self._fetch_range(
+            usernames, content_type, limit_per_account, since_date, until_date
+        )
+        return posts
 
-        all_posts = []
-        failed_chunks = []
-        for i, (c_start, c_end) in enumerate(chunks, 1):
-            chunk_days = (c_end - c_start).days
-            print(f"\n  📦 [{i}/{len(chunks)}] {c_start.strftime('%Y-%m-%d')} ~ {c_end.strftime('%Y-%m-%d')} ({chunk_days}일)")
-            try:
-                chunk_posts = self._fetch_posts_chunk(
-                    usernames, content_type, limit_per_account, c_start, c_end
-                )
-                all_posts.extend(chunk_posts)
-                print(f"  📦 [{i}/{len(chunks)}] 누적: {len(all_posts)}개")
-            except FetcherError as e:
-                failed_chunks.append((i, c_start, c_end, str(e)))
-                print(f"  ⚠️ [{i}/{len(chunks)}] 청크 실패: {e}")
+    # 스트리밍 수집 시 청크 스레드 → 소비자 사이 버퍼 크기 (아이템 수)
+    STREAM_BUFFER_SIZE = 1000
 
-        if failed_chunks and not all_posts:
-            raise FetcherError(
-                f"모든 청크 수집 실패 ({len(failed_chunks)}/{len(chunks)}). "
-                f"첫 오류: {failed_chunks[0][3]}"
+    def fetch_posts_iter(
+        self,
+        usernames: List[str],
+        days: int = 7,
+        content_type: str = "reels",
+        limit_per_account: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """포스트/릴스 스트리밍 수집
+
+        fetch_posts와 같은 기간/분할 규칙을 따르되, 데이터셋 페이지가 도착하는 대로
+        기간 필터 + URL 중복 제거를 거친 포스트를 하나씩 반환합니다.
+        여러 청크는 동시에 실행되며 도착 순서대로 섞여 나옵니다.
+        """
+        since_date, until_date = self._resolve_range(days, start_date, end_date)
+
+        if self.store is not None:
+            # 증분 모드는 저장소 병합이 끝나야 기간 전체가 확정되므로 일괄 수집 후 반환
+            yield from self._fetch_incremental(
+                usernames, content_type, limit_per_account, since_date, until_date
             )
-        if failed_chunks:
-            print(f"\n  ⚠️ {len(failed_chunks)}/{len(chunks)} 청크 실패 (수집된 데이터로 계속 진행)")
+            return
+
+        tasks = self._plan_tasks(usernames, since_date, until_date)
+        print(f"콘텐츠 스트리밍 수집 중: {content_type}, {(until_date - since_date).days}일 ({len(tasks)}회 실행)")
 
-        # 중복 제거 (URL 기준)
         seen_urls = set()
-        unique_posts = []
-        for post in all_posts:
+        duplicates = 0
+        for post in self._stream_tasks(tasks, content_type, limit_per_account):
             url = post.get("url", post.get("id", id(post)))
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_posts.append(post)
+            if url in seen_urls:
+                duplicates += 1
+                continue
+            seen_urls.add(url)
+            yield post
+
+        if duplicates:
+            get_metrics().incr("duplicates_removed", duplicates)
+            print(f"  → 중복 제거: {duplicates}개 제외")
+        print(f"✅ 스트리밍 수집 완료: {len(seen_urls)}개")
+
+    def _stream_tasks(
+        self,
+        tasks: List[FetchTask],
+        content_type: str,
+        limit_per_account: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """작업별 액터 run을 동시에 실행하고, 도착하는 아이템을 bounded 큐로 흘려보냄
 
-        if len(all_posts) != len(unique_posts):
-            print(f"  → 중복 제거: {len(all_posts)}개 → {len(unique_posts)}개")
+        작업 실패는 fetch_posts와 동일하게 격리되며, 모든 작업이 실패하고
+        아무 포스트도 받지 못했을 때만 FetcherError를 발생시킵니다.
+        """
+        workers = max(1, min(self.config.scraper.max_parallel_runs, len(tasks)))
+        buffer: "queue.Queue[Any]" = queue.Queue(maxsize=self.STREAM_BUFFER_SIZE)
+        stop = threading.Event()
 
-        print(f"\n✅ 전체 수집 완료: {len(unique_posts)}개 ({len(chunks)}회 분할)")
-        return unique_posts
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(task: FetchTask):
+            error = None
+            empty = False
+            try:
+                for post in self._iter_posts_chunk(
+                    task.usernames, content_type, limit_per_account, task.start, task.end
+                ):
+                    if not put(post):
+                        return
+            except EmptyDatasetError:
+                empty = True
+            except Exception as e:
+                error = str(e)
+            put(_ChunkDone(task.index, error, empty))
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stream")
+        try:
+            for task in tasks:
+                executor.submit(produce, task)
+
+            remaining = len(tasks)
+            errors = []
+            empty = 0
+            received = 0
+            while remaining:
+                item = buffer.get()
+                if isinstance(item, _ChunkDone):
+                    remaining -= 1
+                    empty += item.empty
+                    if item.error is not None:
+                        errors.append(item.error)
+                        print(f"  ⚠️ [{item.index}/{len(tasks)}] 실패: {item.error}")
+                    continue
+                received += 1
+                yield item
+
+            if empty == len(tasks):
+                raise EmptyDatasetError(EMPTY_DATASET_MESSAGE)
+            if errors and not received:
+                raise FetcherError(
+                    f"모든 청크 수집 실패 ({len(errors)}/{len(tasks)}). 첫 오류: {errors[0]}"
+                )
+            if errors:
+                print(f"  ⚠️ {len(errors)}/{len(tasks)} 청크 실패 (수집된 데이터로 계속 진행)")
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
 
-    def _fetch_posts_chunk(
+    def _fetch_incremental(
         self,
         usernames: List[str],
         content_type: str,
@@ -139,99 +634,293 @@ class InstagramFetcher:
         since_date: datetime,
         until_date: datetime,
     ) -> List[Dict[str, Any]]:
-        """단일 기간 포스트 수집 (내부 메서드)"""
-        # 콘텐츠 타입에 따른 URL 생성
-        direct_urls = []
+        """증분 수집: 계정별 워터마크 이후만 요청하고 저장된 이력과 병합
+
+        같은 시작 시각을 갖는 계정끼리 묶어 한 번에 요청합니다.
+        청크 실패가 있었던 그룹은 빈틈이 생길 수 있으므로 저장소를 갱신하지 않고,
+        성공한 청크의 포스트는 이번 결과에만 포함합니다.
+        """
+        groups: Dict[datetime, List[str]] = {}
         for username in usernames:
-            if content_type == "reels":
-                direct_urls.append(f"https://www.instagram.com/{username}/reels/")
-            else:
-                direct_urls.append(f"https://www.instagram.com/{username}/")
+            fetch_from = self.store.fetch_from(username, content_type, since_date)
+            groups.setdefault(fetch_from, []).append(username)
+
+        print(f"증분 수집: {len(usernames)}개 계정 → {len(groups)}개 그룹")
+        unsaved: List[PostRecord] = []
+        for fetch_from, group in sorted(groups.items()):
+            if fetch_from >= until_date:
+                print(f"  ⏭️ {', '.join(group)}: 저장된 이력으로 충분 (요청 생략)")
+                continue
+            print(f"  🔄 {', '.join(group)}: {fetch_from.strftime('%Y-%m-%d %H:%M')} 이후만 요청")
+            try:
+                posts, failed_chunks = self._fetch_range(
+                    group, content_type, limit_per_account, fetch_from, until_date
+                )
+            except FetcherError as e:
+                # 새 포스트가 없어 0건인 경우도 여기로 옴 → 저장된 이력으로 계속 진행
+                print(f"  ⚠️ 증분 요청 실패 (저장된 이력 사용): {e}")
+                continue
+            if failed_chunks:
+                print(f"  ⚠️ 청크 실패로 저장소 갱신 생략 (수집된 {len(posts)}개는 이번 분석에만 사용): {', '.join(group)}")
+                unsaved.extend(posts)
+                continue
+            by_owner: Dict[str, List[Dict[str, Any]]] = {u.lower(): [] for u in group}
+            for post in posts:
+                owner = (post.get("ownerUsername") or "").lower()
+                if owner in by_owner:
+                    by_owner[owner].append(post)
+            added = sum(
+                self.store.merge(username, content_type, by_owner[username.lower()], fetch_from)
+                for username in group
+            )
+            print(f"  → 신규 {added}개 저장")
 
-        scraper_cfg = self.config.scraper
+        merged = self.store.posts_between(usernames, content_type, since_date, until_date)
+        if unsaved:
+            merged = dedup_posts(merged + unsaved)
+        print(f"✅ 증분 수집 완료: 저장소 포함 기간 내 {len(merged)}개")
+        return merged
 
-        # 과거 기간 요청 시 limit 자동 증가
-        # resultsLimit은 날짜 필터보다 먼저 적용되므로, 현재~since_date 사이
-        # 포스트를 모두 포함할 만큼 충분히 높여야 함
-        days_ago = (datetime.now() - since_date).days
-        if days_ago > 14:
-            adjusted_limit = max(limit_per_account, days_ago * 5)
-            adjusted_limit = min(adjusted_limit, 500)  # 비용 상한
-        else:
-            adjusted_limit = limit_per_account
+    def _fetch_range(
+        self,
+        usernames: List[str],
+        content_type: str,
+        limit_per_account: int,
+        since_date: datetime,
+        until_date: datetime,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """기간 수집 (30일 초과 시 청크 분할). (포스트, 실패 청크 수) 반환"""
+        total_days = (until_date - since_date).days
+        tasks = self._plan_tasks(usernames, since_date, until_date)
 
-        run_input = {
-            "directUrls": direct_urls,
-            "resultsLimit": adjusted_limit,
-            "resultsType": "posts" if content_type != "stories" else "stories",
-            "searchType": "user",
-            "onlyPostsNewerThan": since_date.strftime("%Y-%m-%d"),
-            # NOTE: apify/instagram-scraper는 maxRequestRetries를 공식 input으로
-            # 노출하지 않아 무시될 수 있음. 실질적 방어는 timeout_secs와 max_total_charge_usd.
-            "maxRequestRetries": scraper_cfg.max_request_retries,
-            "maxConcurrency": scraper_cfg.max_concurrency,
-        }
+        # 30일 이하 + 샤드 1개면 단일 실행
+        if len(tasks) == 1:
+            print(f"콘텐츠 수집 중: {content_type}, {total_days}일 ({since_date.strftime('%Y-%m-%d')} ~ {until_date.strftime('%Y-%m-%d')})")
+            posts, _ = self._run_task(tasks[0], content_type, limit_per_account)
+            return posts, 0
 
-        if adjusted_limit != limit_per_account:
-            print(f"    ℹ️ 과거 기간({days_ago}일 전) → resultsLimit {limit_per_account} → {adjusted_limit} 자동 조정")
+        # 30일 초과 또는 계정 수가 shard_size 초과면 분할
+        chunk_count = len({(t.start, t.end) for t in tasks})
+        shard_count = tasks[0].shard_count
+        workers = max(1, min(self.config.scraper.max_parallel_runs, len(tasks)))
 
-        # 동적 타임아웃: 기본 + 계정 수 비례
-        timeout = scraper_cfg.timeout_secs + (len(usernames) * scraper_cfg.timeout_per_account_secs)
-        timeout = min(timeout, 900)  # 최대 15분
+        print(
+            f"콘텐츠 수집 중: {content_type}, {total_days}일 → "
+            f"{chunk_count}개 기간 × {shard_count}개 샤드 = {len(tasks)}회 실행 (동시 {workers}개)"
+        )
 
-        try:
-            run = self.client.actor("apify/instagram-scraper").call(
-                run_input=run_input,
-                timeout_secs=timeout,
-                max_total_charge_usd=scraper_cfg.max_cost_usd,
+        wall_start = time.monotonic()
+        results = self._run_tasks(tasks, content_type, limit_per_account, workers)
+        wall_elapsed = time.monotonic() - wall_start
+
+        failed = [r for r in results if r.error is not None]
+        all_posts = [post for r in results for post in r.posts]
+
+        if all(r.empty for r in results):
+            raise EmptyDatasetError(EMPTY_DATASET_MESSAGE)
+
+        if failed and not all_posts:
+            raise FetcherError(
+                f"모든 청크 수집 실패 ({len(failed)}/{len(tasks)}). "
+                f"첫 오류: {failed[0].error}"
             )
-        except Exception as e:
-            raise FetcherError(f"Apify 스크래퍼 실행 실패: {e}")
+        if failed:
+            print(f"\n  ⚠️ {len(failed)}/{len(tasks)} 청크 실패 (수집된 데이터로 계속 진행)")
+            failed_accounts = sorted({u for r in failed for u in r.task.usernames})
+            print(f"     영향받은 계정: {', '.join(failed_accounts)}")
+            if self.checkpoint is not None and self.checkpoint.resumable():
+                print(f"     완료된 청크는 체크포인트에 저장됨 → 재개: --resume {self.checkpoint.dir.parent.name}")
 
-        posts = []
-        total_items = 0
-        for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
-            total_items += 1
-            # 날짜 필터링
-            timestamp = item.get("timestamp")
-            if timestamp:
-                try:
-                    post_date = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                    post_date_naive = post_date.replace(tzinfo=None)
-                    if post_date_naive < since_date:
-                        continue
-                    if post_date_naive > until_date:
-                        continue
-                except (ValueError, TypeError):
-                    pass
+        self._print_chunk_timings(results, wall_elapsed)
 
-            posts.append(item)
+        # 중복 제거 (URL 기준)
+        metrics = get_metrics()
+        with metrics.span("fetch.dedup"):
+            unique_posts = dedup_posts(all_posts)
 
-        print(f"    → {len(posts)}개 콘텐츠 (전체 {total_items}개 중 기간 내 필터)")
+        if len(all_posts) != len(unique_posts):
+            metrics.incr("duplicates_removed", len(all_posts) - len(unique_posts))
+            print(f"  → 중복 제거: {len(all_posts)}개 → {len(unique_posts)}개")
 
-        # Circuit Breaker: 수집 결과 검증
-        min_threshold = self.config.scraper.min_results_threshold
-        if total_items == 0:
-            raise FetcherError(
-                "수집 완전 실패: 스크래퍼에서 데이터를 가져오지 못했습니다. "
-                "API 토큰 또는 계정명을 확인해주세요."
+        print(f"\n✅ 전체 수집 완료: {len(unique_posts)}개 ({len(tasks)}회 실행)")
+        return unique_posts, len(failed)
+
+    def _run_tasks(
+        self,
+        tasks: List[FetchTask],
+        content_type: str,
+        limit_per_account: int,
+        workers: int,
+    ) -> List[ChunkResult]:
+        """작업별 액터 run을 최대 workers개까지 동시에 실행
+
+        완료되는 순서대로 진행 상황을 출력하고, 결과는 작업 순서(기간 → 샤드)대로 반환합니다.
+        개별 작업 실패(FetcherError)는 해당 결과의 error로 기록되고 나머지는 계속 진행됩니다.
+        """
+        def run_one(task: FetchTask) -> ChunkResult:
+            started = time.monotonic()
+            try:
+                posts, resumed = self._run_task(task, content_type, limit_per_account)
+                result = ChunkResult(task, posts, time.monotonic() - started, resumed=resumed)
+            except EmptyDatasetError:
+                result = ChunkResult(task, [], time.monotonic() - started, empty=True)
+            except FetcherError as e:
+                result = ChunkResult(task, [], time.monotonic() - started, str(e))
+            get_metrics().record(
+                "fetch.chunk", result.elapsed, {"source": "checkpoint" if result.resumed else "apify"},
+                error=result.error is not None,
             )
-        if total_items > 0 and len(posts) == 0:
-            print("    ⚠️ 수집된 콘텐츠가 모두 지정 기간 밖입니다.")
-        elif len(posts) < min_threshold:
-            print(f"    ⚠️ 수집량이 최소 기준({min_threshold}개) 미만입니다 ({len(posts)}개).")
+            return result
+
+        results: List[Optional[ChunkResult]] = [None] * len(tasks)
+        collected = 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk") as executor:
+            futures = [executor.submit(run_one, task) for task in tasks]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.task.index - 1] = result
+                label = result.task.label
+                if result.error is not None:
+                    print(f"  ⚠️ {label} 실패 ({result.elapsed:.1f}초): {result.error}")
+                else:
+                    collected += len(result.posts)
+                    source = "체크포인트" if result.resumed else f"{result.elapsed:.1f}초"
+                    print(f"  📦 {label} 완료 ({source}): {len(result.posts)}개, 누적 {collected}개")
+
+        return results
+
+    def _run_task(
+        self, task: FetchTask, content_type: str, limit_per_account: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """작업 1개 실행: 체크포인트 확인 → 수집 (실패 시 지수 백오프 재시도) → 체크포인트 저장
+
+        (포스트, 체크포인트 복원 여부) 반환. 재시도를 모두 소진하면 FetcherError.
+        데이터셋이 비어 있으면 재시도 없이 빈 결과를 체크포인트에 기록하고 EmptyDatasetError.
+        """
+        key = None
+        if self.checkpoint is not None:
+            key = ChunkCheckpoint.chunk_key(content_type, task.usernames, task.start, task.end)
+            posts = self.checkpoint.load(key)
+            if posts is not None:
+                get_metrics().incr("checkpoint_hits")
+                return posts, True
+
+        print(f"  📦 {task.label} 시작: {task.describe()}")
+        retries = self.config.scraper.chunk_retries
+        for attempt in range(retries + 1):
+            try:
+                posts = self._fetch_posts_chunk(
+                    task.usernames, content_type, limit_per_account, task.start, task.end
+                )
+                break
+            except EmptyDatasetError:
+                # 조용한 계정/기간은 다시 실행해도 비어 있으므로 재시도하지 않음
+                if key is not None:
+                    self.checkpoint.save(key, [])
+                raise
+            except FetcherError as e:
+                if attempt == retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                get_metrics().incr("chunk_retries")
+                print(f"  🔁 {task.label} 재시도 {attempt + 1}/{retries} ({delay:.0f}초 후): {e}")
+                time.sleep(delay)
+
+        if key is not None:
+            self.checkpoint.save(key, posts)
+        return posts, False
+
+    @staticmethod
+    def _print_chunk_timings(results: List[ChunkResult], wall_elapsed: float):
+        """작업별 소요 시간 요약 출력"""
+        print("\n  ⏱️ 청크별 소요 시간:")
+        for r in results:
+            status = f"{len(r.posts)}개" if r.error is None else "실패"
+            elapsed = "체크포인트" if r.resumed else f"{r.elapsed:.1f}초"
+            print(f"     {r.task.label} {r.task.describe()}: {elapsed}, {status}")
+        serial = sum(r.elapsed for r in results)
+        speedup = serial / wall_elapsed if wall_elapsed > 0 else 1.0
+        print(f"     합계 {serial:.1f}초 → 실제 {wall_elapsed:.1f}초 ({speedup:.1f}x)")
 
-        return posts
+    def _fetch_posts_chunk(
+        self,
+        usernames: List[str],
+        content_type: str,
+        limit_per_account: int,
+        since_date: datetime,
+        until_date: datetime,
+    ) -> List[PostRecord]:
+        """단일 기간 포스트 수집 (내부 메서드)"""
+        return list(self._iter_posts_chunk(
+            usernames, content_type, limit_per_account, since_date, until_date
+        ))
+
+    def _iter_posts_chunk(
+        self,
+        usernames: List[str],
+        content_type: str,
+        limit_per_account: int,
+        since_date: datetime,
+        until_date: datetime,
+    ) -> Iterator[PostRecord]:
+        """단일 기간 포스트 스트리밍 수집 - 기간 내 아이템을 데이터셋 순회 중 바로 PostRecord로 반환"""
+        plan = self._plan_limit(usernames, limit_per_account, since_date, until_date)
+        run_input, timeout = self._build_posts_run_input(
+            usernames, content_type, plan.limit, since_date
+        )
+
+        obs = ChunkObservation(usernames, since_date, until_date, plan)
+        for item in self._iter_actor_items(
+            "apify/instagram-scraper", run_input, timeout, "Apify 스크래퍼 실행 실패",
+            fields=self._post_fields(),
+        ):
+            # 날짜 필터링
+            post_date = parse_post_time(item)
+            in_range = post_date is None or since_date <= post_date <= until_date
+            obs.add(item, post_date, in_range)
+            if in_range:
+                yield self._ingest(item)
+
+        self._check_chunk_counts(obs)
     
     def fetch_all(self) -> Dict[str, Any]:
         """전체 데이터 수집 (프로필 + 포스트)"""
         usernames = [a.username for a in self.config.accounts]
+        metrics = get_metrics()
         
         # 프로필 수집
-        profiles = self.fetch_profiles(usernames)
+        with metrics.span("fetch.profiles"):
+            profiles = self.fetch_profiles(usernames)
         
         # 포스트 수집
-        posts = self.fetch_posts(
+        with metrics.span("fetch.posts"):
+            posts = self.fetch_posts(
+                usernames=usernames,
+                days=self.config.analysis.days,
+                content_type=self.config.analysis.content_type,
+                limit_per_account=self.config.analysis.limit_per_account,
+                start_date=self.config.analysis.start_date,
+                end_date=self.config.analysis.end_date,
+            )
+
+        return {
+            "profiles": profiles,
+            "posts": posts,
+            "metadata": self._build_metadata(usernames, len(posts)),
+        }
+
+    def fetch_all_iter(self) -> Dict[str, Any]:
+        """전체 데이터 스트리밍 수집 - posts가 리스트 대신 이터레이터
+
+        InstagramAnalyzer.analyze_stream과 함께 쓰면 다운로드와 분석이 겹쳐 진행됩니다.
+        포스트 수는 순회가 끝나야 알 수 있으므로 metadata에 total_posts가 없습니다.
+        """
+        usernames = [a.username for a in self.config.accounts]
+
+        with get_metrics().span("fetch.profiles"):
+            profiles = self.fetch_profiles(usernames)
+
+        posts = self.fetch_posts_iter(
             usernames=usernames,
             days=self.config.analysis.days,
             content_type=self.config.analysis.content_type,
@@ -239,17 +928,11 @@ class InstagramFetcher:
             start_date=self.config.analysis.start_date,
             end_date=self.config.analysis.end_date,
         )
-        
+
         return {
             "profiles": profiles,
             "posts": posts,
-            "metadata": {
-                "fetched_at": datetime.now().isoformat(),
-                "days": self.config.analysis.days,
-                "content_type": self.config.analysis.content_type,
-                "accounts": usernames,
-                "total_posts": len(posts),
-            }
+            "metadata": self._build_metadata(usernames),
         }
 
 
@@ -287,7 +970,11 @@ def validate_fetch_quality(posts: List[Dict[str, Any]], num_accounts: int) -> Di
     }
 
 
-def fetch_instagram_data(config: Optional[Config] = None) -> Dict[str, Any]:
+def fetch_instagram_data(
+    config: Optional[Config] = None,
+    checkpoint_dir: Optional[Path] = None,
+    raw_spill: Optional[RawItemSpill] = None,
+) -> Dict[str, Any]:
     """인스타그램 데이터 수집 (편의 함수)"""
-    fetcher = InstagramFetcher(config)
+    fetcher = InstagramFetcher(config, checkpoint_dir=checkpoint_dir, raw_spill=raw_spill)
     return fetcher.fetch_all()
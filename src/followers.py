@@ -0,0 +1,88 @@
+"""팔로워 기준 인게이지먼트 모듈
+
+fetch_all이 함께 수집하는 프로필(data["profiles"])의 followersCount로 포스트 인게이지먼트를 정규화합니다.
+팔로워가 많은 계정이 Top 바이럴/해시태그를 독차지하지 않도록, analysis.engagement_basis가
+"followers"이면 순위와 핫스코어를 정규화 인게이지먼트로 계산합니다.
+
+    정규화 인게이지먼트 = 인게이지먼트 × reference_followers / 팔로워 수
+                       (= 인게이지먼트율 × 기준 팔로워 수)
+
+순위는 인게이지먼트율(인게이지먼트 / 팔로워) 순위와 같고, 값은 "팔로워가 기준 수(기본 1만 명)인
+계정이었다면 얻었을 인게이지먼트"라서 핫스코어/등급 구간을 그대로 쓸 수 있습니다.
+
+- 누적기의 ×10 정수 합계가 합치는 순서와 무관하게 정확하도록, 포스트별 정규화 값도 ×10 정수로
+  반올림합니다 (파이썬/NumPy 경로가 같은 정수 연산).
+- 프로필이나 팔로워 수가 없는 계정은 기준 팔로워 수로 간주합니다 (절대 인게이지먼트 그대로).
+"""
+from typing import Any, Dict, Optional, Sequence
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class FollowerIndex:
+    """계정 → 팔로워 수 인덱스 (포스트당 딕셔너리 조회 1회)"""
+
+    def __init__(self, followers: Dict[str, int], reference: int):
+        # 소문자 계정명 → 팔로워 수 (1 이상만)
+        self.followers = followers
+        self.reference = reference
+        # 포스트의 ownerUsername 원문 → 팔로워 수 (대소문자 변환을 계정마다 한 번만)
+        self._by_owner: Dict[Any, Optional[int]] = {}
+
+    @classmethod
+    def from_profiles(cls, profiles: Optional[Dict[str, Any]], reference: int) -> "FollowerIndex":
+        """fetch_profiles 결과({소문자 계정명: 프로필}) → 인덱스"""
+        followers = {}
+        for username, profile in (profiles or {}).items():
+            count = (profile or {}).get("followersCount") or 0
+            if isinstance(count, (int, float)) and count > 0:
+                followers[str(username).lower()] = int(count)
+        return cls(followers, max(1, int(reference)))
+
+    def __len__(self) -> int:
+        return len(self.followers)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_by_owner"] = {}
+        return state
+
+    def followers_of(self, owner: Any) -> Optional[int]:
+        """포스트 계정(ownerUsername)의 팔로워 수 (프로필이 없으면 None)"""
+        try:
+            return self._by_owner[owner]
+        except KeyError:
+            count = self.followers.get(owner.lower()) if isinstance(owner, str) else None
+            self._by_owner[owner] = count
+            return count
+
+    def scale_x10(self, owner: Any, engagement_x10: int) -> int:
+        """인게이지먼트 × 10 정수 → 정규화 인게이지먼트 × 10 정수 (반올림)"""
+        followers = self.followers_of(owner) or self.reference
+        return (engagement_x10 * self.reference * 2 + followers) // (followers * 2)
+
+    def scale_x10_array(
+        self, owners: Sequence[Any], owner_ids: "np.ndarray", engagement_x10: "np.ndarray"
+    ) -> "np.ndarray":
+        """scale_x10의 벡터 버전 (owners: 계정 ID → 계정명, owner_ids: 포스트별 계정 ID)"""
+        followers = np.array(
+            [self.followers_of(owner) or self.reference for owner in owners], dtype=np.int64
+        )[owner_ids]
+        return (engagement_x10 * (self.reference * 2) + followers) // (followers * 2)
+
+    def rate(self, owner: Any, engagement: float) -> Optional[float]:
+        """인게이지먼트율 (%, 인게이지먼트 / 팔로워 × 100) - 프로필이 없으면 None"""
+        followers = self.followers_of(owner)
+        if not followers:
+            return None
+        return engagement / followers * 100
+
+    def missing_owners(self, owners: Optional[Sequence[Any]] = None) -> int:
+        """팔로워 수를 찾지 못한 계정 수 (owners가 없으면 지금까지 조회한 계정 기준)"""
+        if owners is None:
+            return sum(1 for count in self._by_owner.values() if count is None)
+        return sum(1 for owner in set(owners) if self.followers_of(owner) is None)
@@ -13,6 +13,7 @@ from googleapiclient.discovery import build
 from .config import get_config, Config
 from .analyzer import AnalysisResult
 from .credentials import get_token, save_token, get_google_oauth_config, is_cloud_environment
+from .metrics import get_metrics
 from .visualization.email_template import create_html_email
 from .visualization.email_charts import create_email_hashtag_chart, create_email_category_pie
 
@@ -139,6 +140,9 @@ class GmailSender:
         
         raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
         
+        metrics = get_metrics()
+        metrics.incr("api_calls", api="gmail", op="messages.send")
+        metrics.incr("email_bytes", len(raw), format="plain")
         result = service.users().messages().send(
             userId="me",
             body={"raw": raw},
@@ -172,16 +176,19 @@ class GmailSender:
         msg_alternative.attach(MIMEText(html_body, 'html', 'utf-8'))
 
         # 차트 이미지 첨부
+        metrics = get_metrics()
         try:
             # 해시태그 차트
-            hashtag_chart_data = create_email_hashtag_chart(result.top_hashtags)
+            with metrics.span("email.chart_render", chart="hashtag"):
+                hashtag_chart_data = create_email_hashtag_chart(result.top_hashtags)
             hashtag_img = MIMEImage(hashtag_chart_data, _subtype='png')
             hashtag_img.add_header('Content-ID', '<hashtag_chart>')
             hashtag_img.add_header('Content-Disposition', 'inline', filename='hashtag_chart.png')
             msg_root.attach(hashtag_img)
 
             # 카테고리 파이 차트
-            category_chart_data = create_email_category_pie(result.top_hashtags)
+            with metrics.span("email.chart_render", chart="category"):
+                category_chart_data = create_email_category_pie(result.top_hashtags)
             category_img = MIMEImage(category_chart_data, _subtype='png')
             category_img.add_header('Content-ID', '<category_chart>')
             category_img.add_header('Content-Disposition', 'inline', filename='category_chart.png')
@@ -215,25 +222,33 @@ class GmailSender:
         subject = f"📊 핫 키워드: {top_tag} | 인스타그램 트렌드 리포트 ({result.analysis_period.split('~')[1].strip()})"
         body = self.create_report_email(result, sheets_info)
         
+        metrics = get_metrics()
         results = []
         for recipient in recipients:
             try:
-                # HTML 이메일 시도
-                try:
-                    msg = self.create_html_report_message(result, sheets_info, recipient, subject)
-                    raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
-                    send_result = self._get_service().users().messages().send(
-                        userId="me", body={"raw": raw}
-                    ).execute()
-                except Exception as html_err:
-                    # HTML 실패 시 플레인 텍스트로 폴백
-                    print(f"  ⚠️ HTML 이메일 실패, 플레인 텍스트로 전환: {html_err}")
-                    send_result = self.send_email(recipient, subject, body)
+                # 수신자별 전송 스팬 (수신자 주소는 라벨로 남기지 않음)
+                with metrics.span("email.send"):
+                    # HTML 이메일 시도
+                    try:
+                        msg = self.create_html_report_message(result, sheets_info, recipient, subject)
+                        raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
+                        metrics.incr("api_calls", api="gmail", op="messages.send")
+                        metrics.incr("email_bytes", len(raw), format="html")
+                        send_result = self._get_service().users().messages().send(
+                            userId="me", body={"raw": raw}
+                        ).execute()
+                    except Exception as html_err:
+                        # HTML 실패 시 플레인 텍스트로 폴백
+                        print(f"  ⚠️ HTML 이메일 실패, 플레인 텍스트로 전환: {html_err}")
+                        metrics.incr("email_html_fallbacks")
+                        send_result = self.send_email(recipient, subject, body)
 
                 print(f"  ✅ 이메일 전송 완료: {recipient}")
+                metrics.incr("emails_sent")
                 results.append({"to": recipient, "success": True, "message_id": send_result.get("id")})
             except Exception as e:
                 print(f"  ❌ 이메일 전송 실패: {recipient} - {e}")
+                metrics.incr("emails_failed")
                 results.append({"to": recipient, "success": False, "error": str(e)})
 
         return results
@@ -0,0 +1,241 @@
+"""실행 메트릭/트레이싱 모듈
+
+파이프라인 단계와 세부 단계(액터 호출, 데이터셋 다운로드, 중복 제거, 해시태그 분석, 시트 작성,
+차트 렌더링, 이메일 전송)의 소요 시간을 스팬으로, 처리량(포스트 수, 바이트, API 호출, 캐시 적중)을
+카운터/게이지로 기록해 실행 디렉토리의 metrics.json과 (선택) Prometheus textfile로 내보냅니다.
+
+사용 예:
+    metrics = get_metrics()
+    with metrics.span("fetch.actor_call", actor=actor_id):
+        run = client.actor(actor_id).call(...)
+    metrics.incr("api_calls", api="apify", op="actor.call")
+
+- 스팬 이름은 점(.)으로 단계를 구분합니다 (fetch, fetch.actor_call, ...).
+  같은 실행 흐름(스레드/asyncio 태스크) 안에서 중첩된 스팬은 부모 스팬 이름을 trace에 남깁니다.
+- 이름 + 라벨별로 횟수/합계/최대 소요 시간을 집계하고, 개별 스팬은 max_trace_spans개까지 trace에 보관합니다.
+- 수집 청크 스레드에서 동시에 기록해도 안전합니다. 병렬 분석 워커 프로세스 내부는 기록하지 않습니다.
+- 포스트/해시태그마다 기록하지 않고 청크·단계 단위로만 기록하므로 분석 핫 루프에 비용이 없습니다.
+"""
+import contextvars
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .config import MetricsConfig
+
+
+# Prometheus 메트릭 이름 접두사
+PROMETHEUS_PREFIX = "instagram_report"
+
+_LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# 현재 실행 흐름의 열린 스팬 이름 (스레드/asyncio 태스크마다 분리)
+_current_span: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("metrics_span", default=None)
+
+
+def _key(name: str, labels: Optional[Dict[str, Any]]) -> _LabelKey:
+    return name, tuple(sorted((k, str(v)) for k, v in (labels or {}).items()))
+
+
+class Metrics:
+    """스팬/카운터/게이지 레지스트리 (스레드 안전)"""
+
+    def __init__(self, max_trace_spans: int = 10000):
+        self._lock = threading.Lock()
+        self.reset(max_trace_spans)
+
+    def reset(self, max_trace_spans: Optional[int] = None):
+        """기록 초기화 (실행 시작 시 호출)"""
+        with self._lock:
+            if max_trace_spans is not None:
+                self.max_trace_spans = max_trace_spans
+            self.started_at = datetime.now()
+            self._origin = time.perf_counter()
+            # (이름, 라벨) → [횟수, 합계 초, 최대 초, 오류 횟수]
+            self.spans: Dict[_LabelKey, List[float]] = {}
+            self.counters: Dict[_LabelKey, float] = {}
+            self.gauges: Dict[_LabelKey, float] = {}
+            self.trace: List[Dict[str, Any]] = []
+            self.dropped_spans = 0
+
+    @contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[None]:
+        """블록 소요 시간을 스팬으로 기록 (예외로 끝나면 오류로 표시)"""
+        parent = _current_span.get()
+        token = _current_span.set(name)
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            _current_span.reset(token)
+            self.record(name, time.perf_counter() - start, labels, parent=parent, start=start, error=error)
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        labels: Optional[Dict[str, Any]] = None,
+        parent: Optional[str] = None,
+        start: Optional[float] = None,
+        error: bool = False,
+    ):
+        """직접 잰 소요 시간을 스팬으로 기록 (제너레이터처럼 with로 감싸기 어려운 구간용)"""
+        key = _key(name, labels)
+        if start is None:
+            start = time.perf_counter() - seconds
+        with self._lock:
+            stat = self.spans.get(key)
+            if stat is None:
+                stat = self.spans[key] = [0, 0.0, 0.0, 0]
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], seconds)
+            stat[3] += error
+            if len(self.trace) < self.max_trace_spans:
+                event: Dict[str, Any] = {
+                    "name": name,
+                    "start": round(start - self._origin, 6),
+                    "seconds": round(seconds, 6),
+                }
+                if parent is not None:
+                    event["parent"] = parent
+                if labels:
+                    event["labels"] = dict(key[1])
+                if error:
+                    event["error"] = True
+                self.trace.append(event)
+            else:
+                self.dropped_spans += 1
+
+    def incr(self, name: str, value: float = 1, **labels: Any):
+        """카운터 증가"""
+        key = _key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: Any):
+        """게이지 설정 (마지막 값 유지)"""
+        key = _key(name, labels)
+        with self._lock:
+            self.gauges[key] = value
+
+    def span_seconds(self, name: str) -> float:
+        """스팬 소요 시간 합계 (모든 라벨 합계)"""
+        with self._lock:
+            return sum(stat[1] for (span, _), stat in self.spans.items() if span == name)
+
+    def snapshot(self, **info: Any) -> Dict[str, Any]:
+        """JSON으로 내보낼 기록 (info: run_id 등 실행 정보)"""
+        with self._lock:
+            return {
+                **info,
+                "started_at": self.started_at.isoformat(),
+                "elapsed_seconds": round(time.perf_counter() - self._origin, 6),
+                "spans": [
+                    {"name": name, "labels": dict(labels), "count": int(count), "total_seconds": round(total, 6),
+                     "max_seconds": round(peak, 6), "errors": int(errors)}
+                    for (name, labels), (count, total, peak, errors) in sorted(self.spans.items())
+                ],
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                "gauges": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.gauges.items())
+                ],
+                "trace": list(self.trace),
+                "dropped_spans": self.dropped_spans,
+            }
+
+    def write_json(self, path: Path, **info: Any) -> Path:
+        """metrics.json 기록"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(**info), f, ensure_ascii=False, indent=2)
+        return path
+
+    def write_prometheus(self, path: str) -> Path:
+        """node_exporter textfile collector 형식으로 기록 (임시 파일에 쓴 뒤 교체)
+
+        실행 단위 값이므로 모두 gauge로 내보냅니다 (다음 실행이 파일을 덮어씀).
+        """
+        path = Path(os.path.expanduser(path))
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def emit(metric: str, help_text: str, samples: List[Tuple[Dict[str, Any], float]]):
+            metric = f"{PROMETHEUS_PREFIX}_{_prometheus_name(metric)}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+            for sample_labels, value in samples:
+                lines.append(f"{metric}{_prometheus_labels(sample_labels)} {value}")
+
+        emit("run_start_timestamp_seconds", "실행 시작 시각 (unix time)",
+             [({}, self.started_at.timestamp())])
+        emit("run_elapsed_seconds", "실행 소요 시간", [({}, snapshot["elapsed_seconds"])])
+        spans = snapshot["spans"]
+        emit("span_seconds", "스팬 소요 시간 합계",
+             [({"span": s["name"], **s["labels"]}, s["total_seconds"]) for s in spans])
+        emit("span_max_seconds", "스팬 1회 최대 소요 시간",
+             [({"span": s["name"], **s["labels"]}, s["max_seconds"]) for s in spans])
+        emit("span_count", "스팬 실행 횟수",
+             [({"span": s["name"], **s["labels"]}, s["count"]) for s in spans])
+        emit("span_errors", "예외로 끝난 스팬 수",
+             [({"span": s["name"], **s["labels"]}, s["errors"]) for s in spans])
+        for kind in ("counters", "gauges"):
+            by_name: Dict[str, List[Tuple[Dict[str, Any], float]]] = {}
+            for entry in snapshot[kind]:
+                by_name.setdefault(entry["name"], []).append((entry["labels"], entry["value"]))
+            for name, samples in by_name.items():
+                emit(name, f"{name} ({'카운터' if kind == 'counters' else '게이지'})", samples)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+        return path
+
+    def export(self, cfg: MetricsConfig, run_dir: Path, run_id: str) -> List[Path]:
+        """설정에 따라 metrics.json (+ Prometheus textfile) 기록, 기록한 경로 목록 반환"""
+        if not cfg.enabled:
+            return []
+        paths = [self.write_json(Path(run_dir) / "metrics.json", run_id=run_id)]
+        if cfg.prometheus_textfile:
+            paths.append(self.write_prometheus(cfg.prometheus_textfile))
+        return paths
+
+
+def _prometheus_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _prometheus_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in sorted(labels.items()):
+        escaped = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        parts.append(f'{_prometheus_name(key)}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+# 프로세스 공용 레지스트리
+_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """메트릭 레지스트리 가져오기 (싱글톤)"""
+    return _metrics
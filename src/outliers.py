@@ -0,0 +1,122 @@
+"""계정별 아웃라이어 탐지 모듈
+
+계정마다 로그 인게이지먼트의 중앙값과 MAD(중앙값 절대편차)를 구해 로버스트 z-score를 계산하고,
+analysis.outlier_threshold를 넘는 포스트를 "평소보다 훨씬 잘 된" 아웃라이어로 표시합니다.
+팔로워 수가 크게 다른 계정들을 한 기준으로 비교하는 Top 바이럴과 달리 계정 자신의 평소 성과가 기준입니다.
+
+NumPy가 있으면 (계정, 값) 정렬 두 번과 bincount로 모든 계정의 중앙값/MAD를 한 번에 계산합니다.
+"""
+import math
+import statistics
+from typing import Any, Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# 기준 통계를 낼 수 있는 계정당 최소 포스트 수
+MIN_ACCOUNT_POSTS = 5
+# MAD → 표준편차 환산 계수 (정규분포 가정)
+MAD_SCALE = 1.4826
+# MAD가 0일 때(절반 이상이 같은 값) 평균 절대편차 → 표준편차 환산 계수
+MEAN_AD_SCALE = 1.2533
+
+
+def _group_medians(owner_ids: "np.ndarray", values: "np.ndarray", counts: "np.ndarray") -> "np.ndarray":
+    """계정별 중앙값 (counts: 계정별 포스트 수, 포스트가 없는 계정은 0)"""
+    order = np.lexsort((values, owner_ids))
+    sorted_values = values[order]
+    starts = np.cumsum(counts) - counts
+    has_posts = counts > 0
+    lo = np.where(has_posts, starts + (counts - 1) // 2, 0)
+    hi = np.where(has_posts, starts + counts // 2, 0)
+    if len(sorted_values) == 0:
+        return np.zeros(len(counts))
+    return np.where(has_posts, (sorted_values[lo] + sorted_values[hi]) / 2, 0.0)
+
+
+def robust_scores(owner_ids: "np.ndarray", engagement: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """포스트별 (로버스트 z-score, 계정 중앙값 인게이지먼트)
+
+    z = (log1p(인게이지먼트) - 계정 중앙값) / (1.4826 × 계정 MAD)
+    포스트가 MIN_ACCOUNT_POSTS 미만이거나 편차가 전혀 없는 계정의 포스트는 z = 0입니다.
+    """
+    owner_ids = np.asarray(owner_ids, dtype=np.int64)
+    values = np.log1p(np.maximum(np.asarray(engagement, dtype=np.float64), 0))
+    size = int(owner_ids.max()) + 1 if len(owner_ids) else 0
+    counts = np.bincount(owner_ids, minlength=size)
+
+    medians = _group_medians(owner_ids, values, counts)
+    deviations = np.abs(values - medians[owner_ids])
+    scale = MAD_SCALE * _group_medians(owner_ids, deviations, counts)
+    mean_ad = np.bincount(owner_ids, weights=deviations, minlength=size) / np.maximum(counts, 1)
+    scale = np.where(scale > 0, scale, MEAN_AD_SCALE * mean_ad)
+
+    usable = (counts >= MIN_ACCOUNT_POSTS) & (scale > 0)
+    post_scale = scale[owner_ids]
+    scores = np.where(
+        usable[owner_ids],
+        (values - medians[owner_ids]) / np.where(post_scale > 0, post_scale, 1.0),
+        0.0,
+    )
+    return scores, np.expm1(medians)[owner_ids]
+
+
+def robust_scores_python(owners: Sequence[str], engagement: Sequence[float]) -> Tuple[List[float], List[float]]:
+    """robust_scores의 순수 파이썬 버전 (numpy 미설치 환경)"""
+    values = [math.log1p(max(e, 0)) for e in engagement]
+    by_owner: Dict[str, List[float]] = {}
+    for owner, value in zip(owners, values):
+        by_owner.setdefault(owner, []).append(value)
+
+    stats: Dict[str, Tuple[float, float, bool]] = {}
+    for owner, group in by_owner.items():
+        median = statistics.median(group)
+        deviations = [abs(v - median) for v in group]
+        scale = MAD_SCALE * statistics.median(deviations)
+        if scale <= 0:
+            scale = MEAN_AD_SCALE * sum(deviations) / len(deviations)
+        stats[owner] = (median, scale, len(group) >= MIN_ACCOUNT_POSTS and scale > 0)
+
+    scores, medians = [], []
+    for owner, value in zip(owners, values):
+        median, scale, usable = stats[owner]
+        scores.append((value - median) / scale if usable else 0.0)
+        medians.append(math.expm1(median))
+    return scores, medians
+
+
+def select_outliers(
+    owners: Sequence[Any],
+    engagement: Sequence[float],
+    threshold: float,
+    limit: int,
+) -> List[Tuple[int, float, float]]:
+    """z-score가 threshold를 넘는 포스트 (인덱스, z-score, 계정 중앙값) - 점수 내림차순 최대 limit개
+
+    owners는 계정 이름 목록 또는 정수 계정 ID 배열(PostColumns.owner_ids)입니다.
+    동점은 먼저 나온 포스트가 우선합니다.
+    """
+    if limit <= 0 or len(engagement) == 0:
+        return []
+
+    if not HAS_NUMPY:
+        scores, medians = robust_scores_python(owners, engagement)
+        flagged = [i for i, score in enumerate(scores) if score > threshold]
+        flagged.sort(key=lambda i: scores[i], reverse=True)
+        return [(i, scores[i], medians[i]) for i in flagged[:limit]]
+
+    if isinstance(owners, np.ndarray) and owners.dtype.kind in "iu":
+        owner_ids = owners
+    else:
+        index: Dict[Any, int] = {}
+        owner_ids = np.fromiter(
+            (index.setdefault(owner, len(index)) for owner in owners), dtype=np.int64, count=len(owners)
+        )
+    scores, medians = robust_scores(owner_ids, np.asarray(engagement, dtype=np.float64))
+    flagged = np.nonzero(scores > threshold)[0]
+    flagged = flagged[np.argsort(-scores[flagged], kind="stable")][:limit]
+    return [(int(i), float(scores[i]), float(medians[i])) for i in flagged]
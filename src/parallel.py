@@ -0,0 +1,167 @@
+"""병렬 분석 모듈
+
+포스트 목록을 연속 구간으로 나눠 프로세스 풀에서 구간별 AnalysisAccumulator를 누적하고,
+부모 프로세스에서 구간 순서대로 merge합니다. 누적기는 순번 구간이 이어지게 합치면
+한 번에 누적한 것과 같으므로 결과는 직렬 분석과 비트 단위로 동일합니다.
+
+캡션은 워커에서 포스트당 한 번만 파싱하고, 해시태그 동시 출현 분석에 쓸 (태그 ID, 포스트 인덱스)
+출현 배열과 아웃라이어 탐지에 쓸 포스트별 (계정 ID, 인게이지먼트) 배열도 워커가 구간별로 만들어
+돌려줍니다. 부모는 ID만 다시 매겨 이어 붙이고, 계정별 중앙값/MAD와 동시 출현 행렬처럼 전체 포스트가
+필요한 계산만 합친 배열로 (NumPy 벡터 연산) 수행합니다.
+
+fork를 지원하는 플랫폼에서는 워커가 포스트 목록을 그대로 물려받아 구간 경계만 전달하고,
+그 밖의 플랫폼에서는 구간별 포스트를 직렬화해 전달합니다.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .analyzer import AnalysisAccumulator, InstagramAnalyzer
+from .config import Config
+from .cooccurrence import concat_incidence, incidence_from_records
+from .followers import FollowerIndex
+from .parsing import parse_post
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# 워커 1개가 맡을 최소 포스트 수 (이보다 적으면 프로세스 시작 비용이 더 큼)
+MIN_POSTS_PER_WORKER = 20_000
+
+# 워커 프로세스 상태 (_init_worker에서 설정)
+_worker_analyzer: Optional[InstagramAnalyzer] = None
+_worker_posts: Optional[List[Dict[str, Any]]] = None
+
+
+def _init_worker(
+    config: Config, posts: Optional[List[Dict[str, Any]]], followers: Optional[FollowerIndex] = None
+):
+    global _worker_analyzer, _worker_posts
+    _worker_analyzer = InstagramAnalyzer(config)
+    _worker_analyzer.followers = followers
+    _worker_posts = posts
+
+
+class ShardResult(NamedTuple):
+    """구간 1개의 분석 결과"""
+    acc: AnalysisAccumulator
+    incidence: Tuple[List[str], Any, Any]   # incidence_from_records 결과 (포스트 인덱스는 전체 기준)
+    owners: List[str]                       # 구간 계정 ID → 계정 (첫 등장 순서)
+    owner_ids: Any                          # 포스트별 구간 계정 ID
+    engagement: Any                         # 포스트별 인게이지먼트 (calc_engagement)
+
+
+class ParallelResult(NamedTuple):
+    """구간별 결과를 순서대로 합친 전체 결과"""
+    acc: AnalysisAccumulator
+    incidence: Tuple[List[str], Any, Any]   # (태그 ID → 태그, 출현별 태그 ID, 출현별 포스트 인덱스)
+    owner_ids: Any                          # 포스트별 계정 ID (전체 첫 등장 순서)
+    engagement: Any                         # 포스트별 인게이지먼트
+
+
+def analyze_shard(analyzer: InstagramAnalyzer, posts: Iterable[Dict[str, Any]], start: int) -> ShardResult:
+    """start번째부터 이어지는 포스트 구간 누적 + 동시 출현 입력 (캡션은 포스트당 1회 파싱)"""
+    acc = analyzer.accumulator(start)
+    calc_engagement = analyzer.calc_engagement
+    records = []
+    owner_index: Dict[str, int] = {}
+    owner_ids = []
+    engagement = []
+    for post in posts:
+        record = parse_post(post)
+        acc.add(post, record)
+        records.append(record)
+        owner = post.get("ownerUsername") or "N/A"
+        owner_id = owner_index.get(owner)
+        if owner_id is None:
+            owner_id = owner_index[owner] = len(owner_index)
+        owner_ids.append(owner_id)
+        engagement.append(calc_engagement(post))
+    incidence = incidence_from_records(records, analyzer.exclude_set, analyzer.canonicalizer.canonical, start)
+    if HAS_NUMPY:
+        # 프로세스 간 전달 크기를 줄이기 위해 배열로 변환
+        vocab, tag_ids, post_ids = incidence
+        incidence = (vocab, np.asarray(tag_ids, dtype=np.int32), np.asarray(post_ids, dtype=np.int64))
+        return ShardResult(
+            acc, incidence, list(owner_index),
+            np.asarray(owner_ids, dtype=np.int32), np.asarray(engagement, dtype=np.float64),
+        )
+    return ShardResult(acc, incidence, list(owner_index), owner_ids, engagement)
+
+
+def _analyze_range(start: int, end: int, posts: Optional[List[Dict[str, Any]]] = None) -> ShardResult:
+    """[start, end) 구간 분석 (posts가 없으면 fork로 물려받은 전체 목록 사용)"""
+    if posts is None:
+        source = _worker_posts
+        posts = (source[i] for i in range(start, end))
+    return analyze_shard(_worker_analyzer, posts, start)
+
+
+def _merge_shards(analyzer: InstagramAnalyzer, shards: Iterable[ShardResult]) -> ParallelResult:
+    """구간 결과를 순서대로 합침 (계정/태그 ID는 전체 첫 등장 순서로 다시 매김)"""
+    acc = analyzer.accumulator()
+    incidence_parts = []
+    owner_index: Dict[str, int] = {}
+    owner_ids: List[Any] = []
+    engagement: List[Any] = []
+    for shard in shards:
+        acc.merge(shard.acc)
+        incidence_parts.append(shard.incidence)
+        remap = [owner_index.setdefault(owner, len(owner_index)) for owner in shard.owners]
+        if HAS_NUMPY:
+            owner_ids.append(np.asarray(remap, dtype=np.int64)[shard.owner_ids])
+            engagement.append(shard.engagement)
+        else:
+            owner_ids.extend(remap[i] for i in shard.owner_ids)
+            engagement.extend(shard.engagement)
+    if HAS_NUMPY:
+        owner_ids = np.concatenate(owner_ids)
+        engagement = np.concatenate(engagement)
+    return ParallelResult(acc, concat_incidence(incidence_parts), owner_ids, engagement)
+
+
+def split_ranges(total: int, parts: int) -> List[Tuple[int, int]]:
+    """[0, total)을 크기가 고른 연속 구간 parts개로 분할"""
+    size, extra = divmod(total, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def accumulate_parallel(
+    analyzer: InstagramAnalyzer, posts: List[Dict[str, Any]], workers: int
+) -> ParallelResult:
+    """포스트를 workers개 프로세스로 나눠 누적한 뒤 순서대로 병합
+
+    포스트 수가 적어 워커당 MIN_POSTS_PER_WORKER에 못 미치면 워커 수를 줄이고,
+    1개가 되면 현재 프로세스에서 직렬로 누적합니다.
+    """
+    workers = max(1, min(workers, len(posts) // MIN_POSTS_PER_WORKER))
+    if workers == 1:
+        return _merge_shards(analyzer, [analyze_shard(analyzer, posts, 0)])
+
+    ranges = split_ranges(len(posts), workers)
+    print(f"  ⚙️ 병렬 분석: {workers}개 프로세스 × 약 {len(posts) // workers:,}개 포스트")
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+        initargs = (analyzer.config, posts, analyzer.followers)
+        jobs = [(start, end, None) for start, end in ranges]
+    else:
+        context = None
+        initargs = (analyzer.config, None, analyzer.followers)
+        jobs = [(start, end, posts[start:end]) for start, end in ranges]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_worker, initargs=initargs
+    ) as executor:
+        futures = [executor.submit(_analyze_range, *job) for job in jobs]
+        return _merge_shards(analyzer, (future.result() for future in futures))
@@ -0,0 +1,81 @@
+"""캡션 파싱 모듈
+
+포스트마다 캡션을 한 번만 스캔해 해시태그/멘션/소문자 캡션을 담은 레코드를 만들고,
+분석기의 모든 단계(해시태그 집계, 바이럴 주제 생성 등)가 이 레코드를 재사용합니다.
+"""
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .schema import PostRecord
+
+
+HASHTAG_RE = re.compile(r'#(\w+)')
+MENTION_RE = re.compile(r'@(\w(?:[\w.]*\w)?)')
+
+
+class CaptionRecord(NamedTuple):
+    """포스트 1개의 캡션 파싱 결과"""
+    hashtags: Tuple[str, ...]   # 소문자, 등장 순서 (제외 태그 포함)
+    mentions: Tuple[str, ...]   # 소문자, 등장 순서
+    caption_lower: str
+    has_caption: bool           # 공백이 아닌 캡션 여부
+
+
+_EMPTY_RECORD = CaptionRecord((), (), "", False)
+# 포스트마다 생성되므로 NamedTuple 생성자(키워드 처리) 대신 tuple.__new__로 직접 생성
+_new_record = tuple.__new__
+
+
+def parse_caption(caption: Optional[str]) -> CaptionRecord:
+    """캡션 → CaptionRecord (정규식은 미리 컴파일된 패턴으로 한 번씩만 실행)
+
+    해시태그는 "원문에서 추출 후 태그별 소문자화"와 같은 결과입니다. 소문자화가 글자 단위
+    1:1로 대응하면(길이 불변, 문맥 의존 변환인 Σ 없음) 소문자 캡션에서 바로 추출합니다.
+    """
+    if not caption:
+        return _EMPTY_RECORD
+    caption_lower = caption.lower()
+    if len(caption_lower) == len(caption) and "Σ" not in caption:
+        hashtags = tuple(HASHTAG_RE.findall(caption_lower))
+    else:
+        hashtags = tuple([tag.lower() for tag in HASHTAG_RE.findall(caption)])
+    mentions = tuple(MENTION_RE.findall(caption_lower)) if "@" in caption else ()
+    return _new_record(CaptionRecord, (hashtags, mentions, caption_lower, not caption.isspace()))
+
+
+def parse_post(post: Dict[str, Any]) -> CaptionRecord:
+    """포스트의 캡션 파싱"""
+    if type(post) is PostRecord:
+        return parse_caption(post.caption)
+    return parse_caption(post.get("caption"))
+
+
+def hashtags_in_head(record: CaptionRecord, caption: str, limit: int) -> List[str]:
+    """캡션 앞 limit자 안에 있는 해시태그 (경계에 걸린 태그는 잘린 그대로)
+
+    caption[:limit]를 다시 스캔한 결과와 같지만, 파싱된 태그의 위치만 찾아 판단합니다.
+    """
+    if len(caption) <= limit:
+        return list(record.hashtags)
+
+    lower = record.caption_lower
+    if len(lower) == len(caption):
+        result = []
+        pos = 0
+        for tag in record.hashtags:
+            start = lower.find("#" + tag, pos)
+            if start < 0:
+                break
+            if start + 1 >= limit:
+                return result
+            end = start + 1 + len(tag)
+            if end > limit:
+                result.append(tag[:limit - start - 1])
+                return result
+            result.append(tag)
+            pos = end
+        else:
+            return result
+
+    # 소문자 변환으로 길이가 바뀐 캡션 등 위치를 대응시킬 수 없는 경우
+    return [tag.lower() for tag in HASHTAG_RE.findall(caption[:limit])]
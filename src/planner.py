@@ -0,0 +1,185 @@
+"""resultsLimit 계획 모듈
+
+instagram-scraper의 resultsLimit은 날짜 필터보다 먼저 적용되므로, 요청 기간을 빠짐없이
+받으려면 "현재 ~ since_date" 사이 포스트를 모두 덮을 만큼 커야 합니다.
+고정 휴리스틱(days_ago * 5) 대신 이전 실행에서 관찰한 계정별 게시 빈도(포스트/일)를 기억해
+필요한 만큼만 요청하고, 예측한 기간 내 비율과 실제 비율을 함께 보고합니다.
+"""
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import Config
+
+
+# 비용 상한 (run 1회, 계정당)
+MAX_RESULTS_LIMIT = 500
+# 게시 빈도 기반 limit의 하한 (빈도 0인 계정도 최소한 확인)
+MIN_RESULTS_LIMIT = 5
+# 새 관찰값 반영 비율 (지수이동평균)
+RATE_SMOOTHING = 0.5
+
+
+def heuristic_limit(limit_per_account: int, days_ago: int) -> int:
+    """이력이 없는 계정용 기본 limit (과거 기간 요청 시 days_ago * 5, 최대 500)"""
+    if days_ago > 14:
+        return min(max(limit_per_account, days_ago * 5), MAX_RESULTS_LIMIT)
+    return limit_per_account
+
+
+@dataclass
+class LimitPlan:
+    """run 1회의 resultsLimit 계획"""
+    limit: int
+    source: str                                   # "history" | "heuristic" | "mixed"
+    predicted_in_window: Optional[float] = None   # 이력 없는 계정이 있으면 None
+    predicted_total: Optional[float] = None
+
+
+@dataclass
+class ChunkObservation:
+    """run 1회 동안 계정별 반환 아이템 관찰값"""
+    usernames: List[str]
+    since_date: datetime
+    until_date: datetime
+    plan: LimitPlan
+    counts: Dict[str, int] = field(default_factory=dict)
+    oldest: Dict[str, datetime] = field(default_factory=dict)
+    total_items: int = 0
+    in_range: int = 0
+
+    def add(self, post: Dict[str, Any], post_time: Optional[datetime], in_range: bool):
+        self.total_items += 1
+        if in_range:
+            self.in_range += 1
+        owner = (post.get("ownerUsername") or "").lower()
+        if not owner or post_time is None or post_time < self.since_date:
+            return
+        self.counts[owner] = self.counts.get(owner, 0) + 1
+        if owner not in self.oldest or post_time < self.oldest[owner]:
+            self.oldest[owner] = post_time
+
+
+class LimitPlanner:
+    """계정별 게시 빈도 이력 기반 resultsLimit 계산기
+
+    파일 구조: <store.dir>/posting_rates.json
+        {"<username>": {"rate": 포스트/일, "updated_at": ISO}, ...}
+    """
+
+    def __init__(self, path: str, margin: float):
+        self.path = Path(os.path.expanduser(path))
+        self.margin = margin
+        self._lock = threading.Lock()
+        self._rates: Dict[str, Dict[str, Any]] = self._load()
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["LimitPlanner"]:
+        """설정에서 planner 생성 (scraper.adaptive_limit이 꺼져 있으면 None)"""
+        if not config.scraper.adaptive_limit:
+            return None
+        path = os.path.join(config.store.dir, "posting_rates.json")
+        return cls(path, config.scraper.limit_margin)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._rates, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def rate(self, username: str) -> Optional[float]:
+        """저장된 게시 빈도 (포스트/일, 이력 없으면 None)"""
+        entry = self._rates.get(username.lower())
+        return entry["rate"] if entry else None
+
+    def plan(
+        self,
+        usernames: List[str],
+        limit_per_account: int,
+        since_date: datetime,
+        until_date: datetime,
+    ) -> LimitPlan:
+        """계정별 필요 limit을 계산하고, run 단위 limit은 그중 최댓값으로 결정"""
+        now = datetime.now()
+        span_days = max((now - since_date).total_seconds() / 86400, 1.0)
+        window_days = max((min(until_date, now) - since_date).total_seconds() / 86400, 0.0)
+        fallback = heuristic_limit(limit_per_account, (now - since_date).days)
+
+        limits = []
+        predicted_in_window = 0.0
+        predicted_total = 0.0
+        known = 0
+        for username in usernames:
+            rate = self.rate(username)
+            if rate is None:
+                limits.append(fallback)
+                continue
+            known += 1
+            needed = math.ceil(rate * span_days * self.margin)
+            limits.append(min(max(needed, MIN_RESULTS_LIMIT), MAX_RESULTS_LIMIT))
+            predicted_in_window += rate * window_days
+            predicted_total += rate * span_days
+
+        if known == 0:
+            return LimitPlan(limit=fallback, source="heuristic")
+        if known < len(usernames):
+            return LimitPlan(limit=max(limits), source="mixed")
+        return LimitPlan(
+            limit=max(limits),
+            source="history",
+            predicted_in_window=predicted_in_window,
+            predicted_total=predicted_total,
+        )
+
+    def observe(self, obs: ChunkObservation):
+        """run 결과로 계정별 게시 빈도 갱신 후 예측 대비 실제 비율 출력
+
+        limit에 걸려 잘린 계정은 가장 오래된 포스트 ~ 현재, 아니면 since_date ~ 현재를
+        관찰 구간으로 봅니다. 아이템이 하나도 없던 run(일시적 실패 가능)은 반영하지 않습니다.
+        """
+        if obs.total_items == 0:
+            return
+
+        now = datetime.now()
+        with self._lock:
+            for username in obs.usernames:
+                key = username.lower()
+                count = obs.counts.get(key, 0)
+                truncated = count >= obs.plan.limit
+                span_start = obs.oldest[key] if truncated and key in obs.oldest else obs.since_date
+                days = max((now - span_start).total_seconds() / 86400, 1.0)
+                observed = count / days
+
+                previous = self._rates.get(key)
+                if previous is not None:
+                    observed = RATE_SMOOTHING * observed + (1 - RATE_SMOOTHING) * previous["rate"]
+                self._rates[key] = {"rate": round(observed, 4), "updated_at": now.isoformat()}
+            self._save()
+
+        actual_ratio = obs.in_range / obs.total_items
+        if obs.plan.predicted_in_window is not None and obs.plan.predicted_total:
+            predicted_ratio = obs.plan.predicted_in_window / obs.plan.predicted_total
+            print(
+                f"    📐 resultsLimit {obs.plan.limit}: 기간 내 예측 {obs.plan.predicted_in_window:.0f}개 → "
+                f"실제 {obs.in_range}개, 기간 내 비율 예측 {predicted_ratio:.0%} / 실제 {actual_ratio:.0%}"
+            )
+        else:
+            print(
+                f"    📐 resultsLimit {obs.plan.limit}: 기간 내 비율 {actual_ratio:.0%} "
+                f"(게시 빈도 이력 저장, 다음 실행부터 예측)"
+            )
@@ -1,14 +1,19 @@
 """전체 파이프라인 오케스트레이션 모듈"""
 import json
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, Iterator, List
 
 from .config import get_config, Config
-from .fetcher import fetch_instagram_data
-from .analyzer import analyze_instagram_data
+from .checkpoint import ChunkCheckpoint
+from .fetcher import FetcherError, InstagramFetcher, RawItemSpill, fetch_instagram_data
+from .analyzer import InstagramAnalyzer, analyze_instagram_data
+from .rolling import analyze_rolling
+from .schema import post_to_json
 from .sheets import create_sheets_report
 from .mailer import send_report_email
+from .metrics import get_metrics
 
 
 class InstagramTrendReporter:
@@ -23,35 +28,116 @@ class InstagramTrendReporter:
         save_raw: bool = True,
         send_email: bool = True,
         recipients: Optional[List[str]] = None,
+        stream: bool = False,
+        resume: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """전체 파이프라인 실행"""
+        """전체 파이프라인 실행
+
+        stream=True면 수집과 분석을 겹쳐 실행합니다 (포스트를 메모리에 모으지 않음).
+        resume에 이전 실행 ID를 주면 그 실행 디렉토리의 청크 체크포인트를 이어서 수집합니다.
+        save_raw면 분석 필드(PostRecord)를 raw.json에, scraper.raw_items면 전체 필드 원본 아이템을
+        수집 중에 raw_items.jsonl로 바로 기록합니다 (원본은 메모리에 두지 않음).
+        단계별 소요 시간/카운터는 실패해도 실행 디렉토리의 metrics.json (+ metrics.prometheus_textfile)에 기록합니다.
+        """
         run_start = datetime.now()
-        run_id = run_start.strftime("%Y-%m-%d_%H%M%S")
-        run_dir = self.output_dir / run_id
+        if resume and self.config.store.incremental:
+            # 증분 수집은 청크 체크포인트를 쓰지 않으므로 재개할 것이 없음
+            raise ValueError("재개(resume)는 증분 수집(store.incremental)과 함께 사용할 수 없습니다.")
+        if resume:
+            run_id = resume
+            run_dir = self.output_dir / run_id
+            if not run_dir.exists():
+                raise ValueError(f"재개할 실행을 찾을 수 없습니다: {run_dir}")
+        else:
+            run_id = run_start.strftime("%Y-%m-%d_%H%M%S")
+            run_dir = self.output_dir / run_id
         
         print("=" * 50)
         print("🚀 인스타그램 트렌드 리포트 생성 시작")
         print("=" * 50)
-        print(f"실행 ID: {run_id}")
+        print(f"실행 ID: {run_id}" + (" (재개)" if resume else ""))
         print(f"분석 기간: 최근 {self.config.analysis.days}일")
         print(f"분석 계정: {len(self.config.accounts)}개")
         print()
+
+        metrics = get_metrics()
+        metrics.reset(self.config.metrics.max_trace_spans)
+        succeeded = False
+        try:
+            with metrics.span("run"):
+                summary = self._run_stages(run_id, run_dir, run_start, save_raw, send_email, recipients, stream)
+            succeeded = True
+            return summary
+        finally:
+            metrics.set_gauge("run_success", int(succeeded))
+            self._export_metrics(run_dir, run_id)
+
+    def _run_stages(
+        self,
+        run_id: str,
+        run_dir: Path,
+        run_start: datetime,
+        save_raw: bool,
+        send_email: bool,
+        recipients: Optional[List[str]],
+        stream: bool,
+    ) -> Dict[str, Any]:
+        """수집 → 분석 → Sheets → 이메일 단계 실행 (단계마다 메트릭 스팬 기록)"""
+        metrics = get_metrics()
+        raw_spill = None
+        if save_raw and self.config.scraper.raw_items:
+            raw_spill = RawItemSpill(run_dir / "raw_items.jsonl")
         
-        # 1. 데이터 수집
-        print("[1/4] 📥 인스타그램 데이터 수집")
-        data = fetch_instagram_data(self.config)
-        
-        if save_raw:
-            run_dir.mkdir(parents=True, exist_ok=True)
-            raw_path = run_dir / "raw.json"
-            with open(raw_path, "w", encoding="utf-8") as f:
-                json.dump(data["posts"], f, ensure_ascii=False, indent=2)
-            print(f"  → 원본 데이터 저장: {raw_path}")
-        print()
-        
-        # 2. 데이터 분석
-        print("[2/4] 🔍 데이터 분석")
-        result = analyze_instagram_data(data, self.config)
+        if stream:
+            # 1+2. 스트리밍 수집 + 분석
+            print("[1-2/4] 📥🔍 인스타그램 데이터 스트리밍 수집 + 분석")
+            with metrics.span("fetch_analyze"), raw_spill or nullcontext():
+                data = InstagramFetcher(self.config, raw_spill=raw_spill).fetch_all_iter()
+                if save_raw:
+                    run_dir.mkdir(parents=True, exist_ok=True)
+                    raw_path = run_dir / "raw.json"
+                    data["posts"] = _tee_json_array(data["posts"], raw_path)
+                result = InstagramAnalyzer(self.config).analyze_stream(data)
+            metrics.set_gauge("posts_collected", result.total_posts)
+            _record_rate("fetch_analyze", result.total_posts)
+            if save_raw:
+                _record_file_bytes(raw_path, "raw")
+                print(f"  → 원본 데이터 저장: {raw_path}")
+                _print_raw_spill(raw_spill)
+        else:
+            # 1. 데이터 수집
+            print("[1/4] 📥 인스타그램 데이터 수집")
+            checkpoint_dir = run_dir / "checkpoints"
+            try:
+                with metrics.span("fetch"), raw_spill or nullcontext():
+                    data = fetch_instagram_data(self.config, checkpoint_dir=checkpoint_dir, raw_spill=raw_spill)
+            except FetcherError:
+                # 증분 수집은 기간을 고정하지 않으므로 재개 안내 없음 (저장소 워터마크로 이어서 수집)
+                if ChunkCheckpoint(checkpoint_dir).resumable():
+                    print(f"  → 완료된 청크는 저장되었습니다. 재개: python main.py run --resume {run_id}")
+                raise
+            metrics.set_gauge("posts_collected", len(data["posts"]))
+            _record_rate("fetch", len(data["posts"]))
+
+            if save_raw:
+                run_dir.mkdir(parents=True, exist_ok=True)
+                raw_path = run_dir / "raw.json"
+                with metrics.span("save.raw"):
+                    with open(raw_path, "w", encoding="utf-8") as f:
+                        json.dump(data["posts"], f, ensure_ascii=False, indent=2, default=post_to_json)
+                _record_file_bytes(raw_path, "raw")
+                print(f"  → 원본 데이터 저장: {raw_path}")
+                _print_raw_spill(raw_spill)
+            print()
+
+            # 2. 데이터 분석
+            print("[2/4] 🔍 데이터 분석")
+            with metrics.span("analyze"):
+                if self.config.analysis.rolling:
+                    result = analyze_rolling(data, self.config)
+                else:
+                    result = analyze_instagram_data(data, self.config)
+            _record_rate("analyze", len(data["posts"]))
         
         if save_raw:
             analysis_path = run_dir / "analysis.json"
@@ -60,6 +146,7 @@ class InstagramTrendReporter:
                 "total_posts": result.total_posts,
                 "analysis_period": result.analysis_period,
                 "accounts": result.accounts,
+                "engagement_basis": result.engagement_basis,
                 "top_hashtags": [
                     {"tag": h.tag, "count": h.count, "avg_engagement": h.avg_engagement,
                      "hot_score": h.hot_score, "category": h.category, "grade": h.grade}
@@ -68,23 +155,40 @@ class InstagramTrendReporter:
                 "top_viral": [
                     {"rank": v.rank, "username": v.username, "topic": v.topic,
                      "likes": v.likes, "comments": v.comments, "views": v.views,
-                     "engagement": v.engagement, "url": v.url}
+                     "engagement": v.engagement, "engagement_rate": v.engagement_rate, "url": v.url}
                     for v in result.top_viral
                 ],
+                "outliers": [
+                    {"rank": o.rank, "username": o.username, "topic": o.topic,
+                     "engagement": o.engagement, "account_median": o.account_median,
+                     "multiple": o.multiple, "score": o.score, "url": o.url}
+                    for o in result.outliers
+                ],
+                "tag_pairs": [
+                    {"rank": p.rank, "tags": [p.tag_a, p.tag_b], "count": p.count, "similarity": p.similarity}
+                    for p in result.tag_pairs
+                ],
+                "tag_clusters": [
+                    {"number": c.number, "name": c.name, "tags": c.tags, "posts": c.posts}
+                    for c in result.tag_clusters
+                ],
                 "insights": [
                     {"number": i.number, "title": i.title, "description": i.description}
                     for i in result.insights
                 ],
                 "generated_at": result.generated_at,
             }
-            with open(analysis_path, "w", encoding="utf-8") as f:
-                json.dump(analysis_dict, f, ensure_ascii=False, indent=2)
+            with metrics.span("save.analysis"):
+                with open(analysis_path, "w", encoding="utf-8") as f:
+                    json.dump(analysis_dict, f, ensure_ascii=False, indent=2)
+            _record_file_bytes(analysis_path, "analysis")
             print(f"  → 분석 결과 저장: {analysis_path}")
         print()
         
         # 3. Google Sheets 리포트 생성
         print("[3/4] 📊 Google Sheets 리포트 생성")
-        sheets_info = create_sheets_report(result, self.config)
+        with metrics.span("sheets"):
+            sheets_info = create_sheets_report(result, self.config)
         print(f"  → 리포트 URL: {sheets_info['url']}")
         print()
         
@@ -92,7 +196,8 @@ class InstagramTrendReporter:
         email_results = []
         if send_email:
             print("[4/4] 📧 이메일 전송")
-            email_results = send_report_email(result, sheets_info, recipients, self.config)
+            with metrics.span("email"):
+                email_results = send_report_email(result, sheets_info, recipients, self.config)
         else:
             print("[4/4] 📧 이메일 전송 (스킵)")
         print()
@@ -119,14 +224,58 @@ class InstagramTrendReporter:
             "email_results": email_results,
         }
 
+    def _export_metrics(self, run_dir: Path, run_id: str):
+        """metrics.json (+ Prometheus textfile) 기록 - 기록 실패는 리포트 실행을 막지 않음"""
+        try:
+            paths = get_metrics().export(self.config.metrics, run_dir, run_id)
+        except OSError as e:
+            print(f"  ⚠️ 메트릭 기록 실패: {e}")
+            return
+        for path in paths:
+            print(f"📈 메트릭 저장: {path}")
+
+
+def _record_rate(stage: str, posts: int):
+    """단계 스팬 시간으로 초당 처리 포스트 수 게이지 기록"""
+    metrics = get_metrics()
+    seconds = metrics.span_seconds(stage)
+    if seconds > 0:
+        metrics.set_gauge("posts_per_sec", round(posts / seconds, 1), stage=stage)
+
+
+def _record_file_bytes(path: Path, kind: str):
+    """기록한 파일 크기를 bytes_written 카운터에 더함"""
+    get_metrics().incr("bytes_written", path.stat().st_size, file=kind)
+
+
+def _print_raw_spill(raw_spill: Optional[RawItemSpill]):
+    """전체 필드 원본 아이템 기록 결과 출력"""
+    if raw_spill is not None and raw_spill.count:
+        print(f"  → 전체 필드 원본 저장: {raw_spill.path} ({raw_spill.count}개, 중복 제거 전)")
+
+
+def _tee_json_array(posts: Iterable[Dict[str, Any]], path: Path) -> Iterator[Dict[str, Any]]:
+    """포스트를 그대로 흘려보내면서 JSON 배열 파일로 기록"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i, post in enumerate(posts):
+            f.write(",\n" if i else "\n")
+            f.write(json.dumps(post, ensure_ascii=False, indent=2, default=post_to_json))
+            yield post
+        f.write("\n]\n")
+
 
 def run_report(
     config_path: Optional[str] = None,
     save_raw: bool = True,
     send_email: bool = True,
     recipients: Optional[List[str]] = None,
+    stream: bool = False,
+    resume: Optional[str] = None,
 ) -> Dict[str, Any]:
     """리포트 생성 실행 (편의 함수)"""
     config = Config.load(config_path) if config_path else get_config()
     reporter = InstagramTrendReporter(config)
-    return reporter.run(save_raw=save_raw, send_email=send_email, recipients=recipients)
+    return reporter.run(
+        save_raw=save_raw, send_email=send_email, recipients=recipients, stream=stream, resume=resume
+    )
@@ -0,0 +1,248 @@
+"""롤링 윈도우 분석 모듈
+
+매일 갱신하는 N일 리포트에서 전체 포스트를 다시 분석하지 않도록, 날짜별 AnalysisAccumulator와
+윈도우 합계를 저장소에 보관합니다. 새로 본 포스트만 날짜별로 누적해 윈도우에 더하고,
+윈도우를 벗어난 날짜의 누적기는 윈도우에서 빼므로 갱신 비용이 하루치 데이터에 비례합니다.
+
+파일 구조: <store.dir>/rolling/<content_type>_<설정 해시>.json
+    {"version", "days": {날짜 인덱스: {"acc": 누적기 상태, "seen": [포스트 키, ...]}},
+     "window": 누적기 상태, "window_days": [날짜 인덱스, ...]}
+    (누적기 상태는 AnalysisAccumulator.to_state(), 파일이 깨졌거나 형식이 다르면 경고 후 새로 시작)
+
+- 날짜는 포스트 timestamp의 UTC 날짜이며, 시각이 없는 포스트는 롤링 분석에서 제외합니다.
+- 포스트는 url(없으면 id)로 한 번만 누적합니다. 이미 누적한 포스트의 좋아요/댓글 변화는 반영하지 않습니다.
+  팔로워 기준 분석(engagement_basis: followers)도 처음 누적할 때의 팔로워 수로 정규화합니다.
+- 지난 날짜를 빼야 하므로 analysis.hashtag_counting이 approx여도 누적기는 정확 집계(exact)로 만듭니다.
+- 같은 날짜 안에서는 처음 본 순서가 순번이 되므로, 결과는 윈도우 포스트를 (날짜, 처음 본 순서)로
+  한 번에 누적한 것과 같습니다.
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .analyzer import AnalysisAccumulator, AnalysisResult, InstagramAnalyzer
+from .config import Config
+from .metrics import get_metrics
+from .parsing import CaptionRecord, parse_post
+from .trends import day_index
+
+
+# 날짜별 순번 구간 크기 (날짜 d의 포스트 순번은 d × DAY_SEQ_SPAN부터)
+DAY_SEQ_SPAN = 10 ** 9
+# 저장 형식 버전 (누적기 구조가 바뀌면 올려서 이전 상태를 버림)
+STATE_VERSION = 4
+
+
+@dataclass
+class _DayState:
+    """날짜 1개의 누적기와 이미 누적한 포스트 키"""
+    acc: AnalysisAccumulator
+    seen: Set[str] = field(default_factory=set)
+
+
+class RollingWindow:
+    """날짜별 누적기 저장소 + 윈도우 합계"""
+
+    def __init__(self, path: Path, analyzer: InstagramAnalyzer, window_days: int):
+        self.path = path
+        self.analyzer = analyzer
+        self.window_days = window_days
+        self.days: Dict[int, _DayState] = {}
+        self.window: Optional[AnalysisAccumulator] = None
+        self.window_range: List[int] = []
+        # 마지막 update에서 새로 누적한 포스트와 캡션 파싱 결과 (아웃라이어/동시 출현 분석용)
+        self.added_posts: List[Dict[str, Any]] = []
+        self.added_records: List[CaptionRecord] = []
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Config, analyzer: Optional[InstagramAnalyzer] = None) -> "RollingWindow":
+        """설정에서 롤링 윈도우 생성
+
+        계정/콘텐츠 유형/윈도우 일수/제외 태그/별칭/Top N/인게이지먼트 기준이 같을 때만 상태를 재사용합니다.
+        """
+        analysis = config.analysis
+        fingerprint = json.dumps(
+            [
+                sorted(acc.username.lower() for acc in config.accounts),
+                analysis.days,
+                sorted(t.lower() for t in analysis.exclude_hashtags),
+                sorted(analysis.hashtag_aliases.items()),
+                analysis.top_hashtags,
+                analysis.top_viral,
+                analysis.engagement_basis,
+                analysis.reference_followers,
+            ],
+            separators=(",", ":"),
+        )
+        key = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+        path = Path(os.path.expanduser(config.store.dir)) / "rolling" / f"{analysis.content_type}_{key}.json"
+        return cls(path, analyzer or InstagramAnalyzer(config), analysis.days)
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") != STATE_VERSION:
+                print("  ⚠️ 롤링 윈도우 상태 형식이 달라 새로 시작합니다.")
+                return
+            days = {
+                int(day): _DayState(
+                    acc=AnalysisAccumulator.from_state(self.analyzer, day_state["acc"]),
+                    seen=set(day_state["seen"]),
+                )
+                for day, day_state in state["days"].items()
+            }
+            window = state["window"]
+            window = AnalysisAccumulator.from_state(self.analyzer, window) if window is not None else None
+            window_range = [int(day) for day in state["window_days"]]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            print("  ⚠️ 롤링 윈도우 상태를 읽지 못해 새로 시작합니다.")
+            return
+        self.days, self.window, self.window_range = days, window, window_range
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": STATE_VERSION,
+                "days": {
+                    str(day): {"acc": day_state.acc.to_state(), "seen": sorted(day_state.seen)}
+                    for day, day_state in self.days.items()
+                },
+                "window": self.window.to_state() if self.window is not None else None,
+                "window_days": self.window_range,
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def _day_state(self, day: int) -> _DayState:
+        state = self.days.get(day)
+        if state is None:
+            state = self.days[day] = _DayState(acc=self.analyzer.accumulator(day * DAY_SEQ_SPAN, exact=True))
+        return state
+
+    def update(
+        self, posts: List[Dict[str, Any]], end_day: int, records: Optional[List[CaptionRecord]] = None
+    ) -> AnalysisAccumulator:
+        """새 포스트를 날짜별로 누적하고 윈도우를 [end_day - N + 1, end_day]로 이동
+
+        records는 포스트별 캡션 파싱 결과입니다 (없으면 새 포스트만 누적할 때 파싱).
+        새로 누적한 포스트와 파싱 결과는 added_posts / added_records에 남깁니다.
+
+        - 윈도우에 남아 있는 날짜: 새 포스트 누적분(delta)만 윈도우에 더함
+        - 새로 들어온 날짜: 그 날짜의 누적기를 윈도우에 더함
+        - 벗어난 날짜: 그 날짜의 누적기를 윈도우에서 빼고 저장소에서도 삭제
+        """
+        start_day = end_day - self.window_days + 1
+
+        # 1. 처음 보는 포스트만 날짜별 delta 누적기에 누적
+        deltas: Dict[int, AnalysisAccumulator] = {}
+        self.added_posts, self.added_records = [], []
+        skipped = 0
+        for i, post in enumerate(posts):
+            day = day_index(post.get("timestamp"))
+            if day is None:
+                skipped += 1
+                continue
+            if day < start_day:
+                continue
+            key = post.get("url") or post.get("id")
+            state = self._day_state(day)
+            if key is not None:
+                if key in state.seen:
+                    continue
+                state.seen.add(key)
+            delta = deltas.get(day)
+            if delta is None:
+                delta = deltas[day] = self.analyzer.accumulator(state.acc.end_seq, exact=True)
+            record = records[i] if records is not None else parse_post(post)
+            delta.add(post, record)
+            self.added_posts.append(post)
+            self.added_records.append(record)
+        for day, delta in deltas.items():
+            self.days[day].acc.merge(delta)
+
+        # 2. 윈도우 이동
+        new_range = [day for day in sorted(self.days) if start_day <= day <= end_day]
+        previous = set(self.window_range)
+        current = set(new_range)
+        if self.window is None or not previous & current:
+            # 첫 실행이거나 이전 윈도우와 겹치지 않으면 날짜별 누적기로 다시 구성
+            self.window = self.analyzer.accumulator(start_day * DAY_SEQ_SPAN, exact=True)
+            for day in new_range:
+                self.window.merge(self.days[day].acc)
+            entered, expired = new_range, []
+        else:
+            entered = [day for day in new_range if day not in previous]
+            expired = [day for day in self.window_range if day not in current]
+            for day, delta in deltas.items():
+                if day in previous and day in current:
+                    self.window.merge(delta)
+            for day in entered:
+                self.window.merge(self.days[day].acc)
+            for i, day in enumerate(expired):
+                remaining = [self.days[d].acc for d in expired[i + 1:] + new_range]
+                self.window.subtract(self.days[day].acc, remaining)
+        self.window_range = new_range
+
+        # 3. 윈도우 이전 날짜 정리 후 저장
+        for day in [day for day in self.days if day < start_day]:
+            del self.days[day]
+        self._save()
+
+        new_posts = sum(delta.total_posts for delta in deltas.values())
+        print(
+            f"  🪟 롤링 윈도우 {self.window_days}일: 새 포스트 {new_posts}개 누적 "
+            f"({len(deltas)}일 갱신, {len(entered)}일 추가, {len(expired)}일 제외) → "
+            f"윈도우 포스트 {self.window.total_posts}개"
+        )
+        if skipped:
+            print(f"     시각 정보가 없는 포스트 {skipped}개는 롤링 분석에서 제외했습니다.")
+        return self.window
+
+
+def rolling_end_day(config: Config) -> int:
+    """윈도우 마지막 날짜 (analysis.end_date가 있으면 그 날짜, 없으면 오늘 UTC 날짜)"""
+    if config.analysis.end_date:
+        return date.fromisoformat(config.analysis.end_date).toordinal()
+    return datetime.now(timezone.utc).date().toordinal()
+
+
+def analyze_rolling(data: Dict[str, Any], config: Config) -> AnalysisResult:
+    """롤링 윈도우 분석 - 새 포스트만 누적하고 윈도우 합계로 AnalysisResult 생성"""
+    analyzer = InstagramAnalyzer(config)
+    posts = data.get("posts", [])
+    metadata = data.get("metadata", {})
+    print(f"분석 시작: 롤링 윈도우 모드 (수집 {len(posts)}개 포스트)")
+    analyzer.use_profiles(data.get("profiles"))
+    analyzer._print_follower_basis(post.get("ownerUsername") for post in posts)
+    if config.analysis.hashtag_counting == "approx":
+        # 지난 날짜를 빼려면 태그별 정확한 값이 필요 (날짜별 누적기는 하루치라 메모리 부담이 작음)
+        print("  ℹ️ 롤링 윈도우는 해시태그를 정확 집계(exact)로 누적합니다.")
+
+    metrics = get_metrics()
+    metrics.incr("posts_analyzed", len(posts))
+    with metrics.span("analyze.rolling_update"):
+        # 캡션은 처음 보는 포스트만 파싱 (이미 누적한 포스트는 날짜 확인 후 건너뜀)
+        rolling = RollingWindow.from_config(config, analyzer)
+        window = rolling.update(posts, rolling_end_day(config))
+    if window.total_posts == 0:
+        return analyzer._empty_result(metadata)
+
+    with metrics.span("analyze.hashtags"):
+        hashtags, viral = window.finalize()
+    print(f"  → Top {len(hashtags)} 해시태그 추출")
+    print(f"  → Top {len(viral)} 바이럴 콘텐츠 추출")
+    # 아웃라이어/해시태그 동시 출현은 이번 실행에서 새로 누적한 포스트 기준 (갱신 비용을 하루치로 유지)
+    with metrics.span("analyze.outliers"):
+        outliers = analyzer.find_outliers(rolling.added_posts)
+    with metrics.span("analyze.cooccurrence"):
+        tag_pairs, tag_clusters = analyzer.find_tag_cooccurrence(rolling.added_posts, records=rolling.added_records)
+    return analyzer._build_result(window.total_posts, metadata, hashtags, viral, outliers, tag_pairs, tag_clusters)
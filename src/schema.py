@@ -0,0 +1,115 @@
+"""수집 데이터 필드 스키마 모듈
+
+분석 파이프라인이 실제로 읽는 포스트 필드를 선언합니다.
+Apify 데이터셋 다운로드 시 이 목록만 요청해 (필드 프로젝션) 댓글/태그된 사용자/
+자식 포스트/이미지 URL 같은 큰 중첩 필드의 전송·디코딩·메모리 비용을 없앱니다.
+새 필드를 읽는 코드를 추가할 때는 이 목록과 PostRecord에도 함께 추가해야 합니다.
+
+수집 단계에서 Apify 아이템은 바로 PostRecord(이 필드만 슬롯으로 보관)로 바뀌어 분석까지 전달되고,
+원본 아이템은 scraper.raw_items + 원본 저장일 때만 디스크(raw_items.jsonl)로 흘려보냅니다.
+"""
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# apify/instagram-scraper 아이템 중 파이프라인이 사용하는 필드
+POST_FIELDS: Tuple[str, ...] = (
+    "id",              # 중복 제거 (url 없을 때)
+    "url",             # 중복 제거, 바이럴 콘텐츠 링크
+    "ownerUsername",   # 바이럴 콘텐츠 계정, 증분 저장소 계정 분류
+    "timestamp",       # 기간 필터, 증분 워터마크
+    "caption",         # 해시태그 추출, 바이럴 주제
+    "likesCount",      # 인게이지먼트
+    "commentsCount",   # 인게이지먼트
+    "videoPlayCount",  # 인게이지먼트, 조회수
+)
+_FIELD_SET = frozenset(POST_FIELDS)
+
+
+def post_fields(raw: bool = False) -> Optional[List[str]]:
+    """데이터셋 다운로드 시 요청할 포스트 필드 (raw=True면 None = 전체 필드)"""
+    if raw:
+        return None
+    return list(POST_FIELDS)
+
+
+class PostRecord:
+    """분석용 포스트 (POST_FIELDS만 슬롯으로 보관)
+
+    키 해시 테이블이 있는 딕셔너리 대신 고정 슬롯이라 포스트당 컨테이너가 작고,
+    반복되는 계정명은 intern해 포스트끼리 같은 문자열을 공유합니다.
+    분석/저장 코드가 쓰는 딕셔너리 읽기 API(get, [], in)를 지원하며, 값이 None인 필드는 없는 키로 취급합니다
+    (to_dict도 None 필드를 뺌). 분석 핫 루프는 type(post) is PostRecord면 속성으로 바로 읽습니다.
+    """
+
+    __slots__ = POST_FIELDS
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        url: Optional[str] = None,
+        ownerUsername: Optional[str] = None,
+        timestamp: Optional[str] = None,
+        caption: Optional[str] = None,
+        likesCount: Optional[int] = None,
+        commentsCount: Optional[int] = None,
+        videoPlayCount: Optional[int] = None,
+    ):
+        self.id = id
+        self.url = url
+        self.ownerUsername = ownerUsername
+        self.timestamp = timestamp
+        self.caption = caption
+        self.likesCount = likesCount
+        self.commentsCount = commentsCount
+        self.videoPlayCount = videoPlayCount
+
+    @classmethod
+    def from_item(cls, item: Any) -> "PostRecord":
+        """Apify 아이템/저장된 포스트 딕셔너리 → PostRecord (이미 PostRecord면 그대로)"""
+        if type(item) is cls:
+            return item
+        get = item.get
+        owner = get("ownerUsername")
+        return cls(
+            get("id"),
+            get("url"),
+            sys.intern(owner) if type(owner) is str else owner,
+            get("timestamp"),
+            get("caption"),
+            get("likesCount"),
+            get("commentsCount"),
+            get("videoPlayCount"),
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None) if key in _FIELD_SET else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __repr__(self) -> str:
+        return f"PostRecord({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """값이 있는 필드만 담은 딕셔너리 (JSON 저장용)"""
+        result = {}
+        for name in POST_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
+        return result
+
+
+def post_to_json(obj: Any) -> Dict[str, Any]:
+    """json.dump(default=...)용 변환 - PostRecord → 딕셔너리"""
+    if isinstance(obj, PostRecord):
+        return obj.to_dict()
+    raise TypeError(f"{type(obj).__name__} 객체는 JSON으로 저장할 수 없습니다.")
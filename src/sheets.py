@@ -10,6 +10,7 @@ from googleapiclient.discovery import build
 from .config import get_config, Config
 from .analyzer import AnalysisResult
 from .credentials import get_token, save_token, get_google_oauth_config, is_cloud_environment
+from .metrics import get_metrics
 from .visualization.colors import (
     SHEETS_HEADER_BG, SHEETS_HEADER_FG, SHEETS_BORDER_COLOR,
     SHEETS_GRADE_BG, SHEETS_GRADIENT, SHEETS_TAB_COLORS, CATEGORY_COLORS
@@ -38,9 +39,9 @@ class SheetsReporter:
         ["평균인게이지먼트", "Avg Engagement", "해당 해시태그가 포함된 포스트들의 평균 인게이지먼트", "4개 포스트의 인게이지먼트 합계 ÷ 4"],
         ["해시태그", "Hashtag", "#으로 시작하는 키워드. 콘텐츠 검색/분류에 사용", "#패션, #OOTD, #일상"],
         ["릴스", "Reels", "인스타그램의 짧은 동영상 콘텐츠 (최대 90초)", "15~60초 세로 동영상"],
-        ["아웃라이어", "Outlier", "평균보다 훨씬 높은 성과를 낸 콘텐츠", "평균 조회수 1만인데 100만 달성"],
+        ["아웃라이어", "Outlier", "계정 평소 성과(중앙값)보다 훨씬 높은 성과를 낸 콘텐츠 (로버스트 z-score가 임계값 초과)", "평균 조회수 1만인데 100만 달성"],
         ["바이럴", "Viral", "콘텐츠가 빠르게 확산되는 현상", "단기간 조회수 급상승"],
-        ["등급", "Grade", "핫스코어 기준 분류: Hot(50+) / Rising(25~50) / Stable(25미만)", "🔥 Hot = 현재 가장 핫한 키워드"],
+        ["등급", "Grade", "Hot(핫스코어 50+) / Rising(직전 구간 대비 +50% 이상 상승) / Stable(그 외)", "🔥 Hot = 현재 가장 핫한 키워드"],
     ]
     
     def __init__(self, config: Optional[Config] = None):
@@ -115,11 +116,14 @@ class SheetsReporter:
             "role": "reader",
         }
         
-        drive_service.permissions().create(
-            fileId=spreadsheet_id,
-            body=permission,
-            fields="id",
-        ).execute()
+        metrics = get_metrics()
+        metrics.incr("api_calls", api="drive", op="permissions.create")
+        with metrics.span("sheets.permission"):
+            drive_service.permissions().create(
+                fileId=spreadsheet_id,
+                body=permission,
+                fields="id",
+            ).execute()
         
         print("  → 공개 권한 설정 완료 (링크가 있는 모든 사용자 > 뷰어)")
     
@@ -136,13 +140,17 @@ class SheetsReporter:
             "sheets": [
                 {"properties": {"title": hashtag_tab_name}},
                 {"properties": {"title": viral_tab_name}},
+                {"properties": {"title": "아웃라이어"}},
                 {"properties": {"title": "인사이트"}},
                 {"properties": {"title": "부록_용어설명"}},
                 {"properties": {"title": "리포트정보"}},
             ]
         }
         
-        result = service.spreadsheets().create(body=spreadsheet).execute()
+        metrics = get_metrics()
+        metrics.incr("api_calls", api="sheets", op="spreadsheets.create")
+        with metrics.span("sheets.create"):
+            result = service.spreadsheets().create(body=spreadsheet).execute()
         spreadsheet_id = result["spreadsheetId"]
 
         # Store sheet IDs for batchUpdate operations
@@ -159,12 +167,16 @@ class SheetsReporter:
         """값 쓰기"""
         service = self._get_service()
         body = {"values": values}
-        service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=range_name,
-            valueInputOption="USER_ENTERED",
-            body=body,
-        ).execute()
+        metrics = get_metrics()
+        metrics.incr("api_calls", api="sheets", op="values.update")
+        metrics.incr("sheets_rows_written", len(values))
+        with metrics.span("sheets.write", sheet=range_name.split("!")[0]):
+            service.spreadsheets().values().update(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+                valueInputOption="USER_ENTERED",
+                body=body,
+            ).execute()
 
     def _build_formatting_requests(self, result: AnalysisResult) -> list:
         """Build batchUpdate requests for formatting, conditional formatting, and charts"""
@@ -174,6 +186,7 @@ class SheetsReporter:
         tab_color_map = {
             self._hashtag_tab: SHEETS_TAB_COLORS["hashtag"],
             self._viral_tab: SHEETS_TAB_COLORS["viral"],
+            "아웃라이어": SHEETS_TAB_COLORS["outlier"],
             "인사이트": SHEETS_TAB_COLORS["insight"],
             "부록_용어설명": SHEETS_TAB_COLORS["glossary"],
             "리포트정보": SHEETS_TAB_COLORS["info"],
@@ -183,6 +196,7 @@ class SheetsReporter:
         row_counts = {
             self._hashtag_tab: len(result.top_hashtags) + 1,
             self._viral_tab: len(result.top_viral) + 1,
+            "아웃라이어": len(result.outliers) + 1,
             "인사이트": len(result.insights) + 1,
             "부록_용어설명": len(self.GLOSSARY),
             "리포트정보": 11,
@@ -191,7 +205,8 @@ class SheetsReporter:
         # Column counts for each sheet
         col_counts = {
             self._hashtag_tab: 8,
-            self._viral_tab: 8,
+            self._viral_tab: 9,
+            "아웃라이어": 10,
             "인사이트": 4,
             "부록_용어설명": 4,
             "리포트정보": 2,
@@ -631,7 +646,10 @@ class SheetsReporter:
         spreadsheet_id = self.create_spreadsheet(title, self._hashtag_tab, self._viral_tab)
         
         # 1. Hashtag sheet (dynamic name based on data count)
-        hashtag_data = [["순위", "키워드", "카테고리", "빈도", "평균인게이지먼트", "핫스코어", "등급", "등급근거"]]
+        per_follower = result.engagement_basis == "followers"
+        reference = self.config.analysis.reference_followers
+        avg_header = f"평균인게이지먼트(팔로워 {reference:,}명 기준)" if per_follower else "평균인게이지먼트"
+        hashtag_data = [["순위", "키워드", "카테고리", "빈도", avg_header, "핫스코어", "등급", "등급근거"]]
         for i, h in enumerate(result.top_hashtags, 1):
             hashtag_data.append([
                 i, h.tag, h.category, h.count, h.avg_engagement, h.hot_score, h.grade, h.grade_reason
@@ -640,19 +658,40 @@ class SheetsReporter:
         print(f"  → {self._hashtag_tab} 시트 작성 완료 ({len(result.top_hashtags)}개)")
         
         # 2. Viral content sheet (dynamic name based on data count)
-        viral_data = [["순위", "계정", "주제", "좋아요", "댓글", "조회수", "인게이지먼트", "URL"]]
+        viral_data = [["순위", "계정", "주제", "좋아요", "댓글", "조회수", "인게이지먼트", "인게이지먼트율", "URL"]]
         for v in result.top_viral:
             viral_data.append([
                 v.rank, v.username, v.topic, v.likes, v.comments, v.views, v.engagement,
+                f"{v.engagement_rate:.2f}%" if v.engagement_rate is not None else "-",
                 f'=HYPERLINK("{v.url}", "View Post")'
             ])
         self.write_values(spreadsheet_id, f"{self._viral_tab}!A1", viral_data)
         print(f"  → {self._viral_tab} 시트 작성 완료 ({len(result.top_viral)}개)")
+
+        # 2-1. 아웃라이어 (계정 평소 성과 대비)
+        outlier_data = [["순위", "계정", "주제", "좋아요", "댓글", "조회수", "인게이지먼트", "계정 중앙값", "배수", "URL"]]
+        for o in result.outliers:
+            outlier_data.append([
+                o.rank, o.username, o.topic, o.likes, o.comments, o.views, o.engagement,
+                o.account_median, f"{o.multiple}x", f'=HYPERLINK("{o.url}", "View Post")'
+            ])
+        self.write_values(spreadsheet_id, "아웃라이어!A1", outlier_data)
+        print(f"  → 아웃라이어 시트 작성 완료 ({len(result.outliers)}개)")
         
         # 3. 인사이트
         insight_data = [["번호", "인사이트 제목", "상세 설명", "관련 키워드"]]
         for ins in result.insights:
             insight_data.append([ins.number, ins.title, ins.description, ins.keywords])
+        if result.tag_pairs:
+            insight_data.append(["", "", "", ""])
+            insight_data.append(["🔗 함께 쓰인 해시태그", "해시태그 조합", "함께 나온 포스트", "유사도(Jaccard)"])
+            for pair in result.tag_pairs:
+                insight_data.append([pair.rank, f"{pair.tag_a} + {pair.tag_b}", f"{pair.count}개", pair.similarity])
+        if result.tag_clusters:
+            insight_data.append(["", "", "", ""])
+            insight_data.append(["🧩 해시태그 클러스터", "대표 태그", "포함 태그", "출현 합계"])
+            for cluster in result.tag_clusters:
+                insight_data.append([cluster.number, cluster.name, ", ".join(cluster.tags), f"{cluster.posts}회"])
         self.write_values(spreadsheet_id, "인사이트!A1", insight_data)
         print(f"  → 인사이트 시트 작성 완료 ({len(result.insights)}개)")
         
@@ -673,6 +712,8 @@ class SheetsReporter:
             ["", ""],
             ["핫스코어 공식", "빈도 × (평균인게이지먼트 ^ 0.3)"],
             ["인게이지먼트 공식", "좋아요 + (댓글 × 3) + (조회수 × 0.1)"],
+            ["순위 기준", f"팔로워 수로 정규화한 인게이지먼트 (인게이지먼트 × {reference:,} ÷ 팔로워)"
+                          if per_follower else "인게이지먼트"],
         ]
         self.write_values(spreadsheet_id, "리포트정보!A1", report_info)
         print("  → 리포트정보 시트 작성 완료")
@@ -690,10 +731,14 @@ class SheetsReporter:
         # 7. Apply all formatting in single batchUpdate
         requests = self._build_formatting_requests(result)
         if requests:
-            self._get_service().spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={"requests": requests}
-            ).execute()
+            metrics = get_metrics()
+            metrics.incr("api_calls", api="sheets", op="batchUpdate")
+            metrics.incr("sheets_format_requests", len(requests))
+            with metrics.span("sheets.format"):
+                self._get_service().spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body={"requests": requests}
+                ).execute()
             print("  → 서식 및 차트 적용 완료")
 
         # 공개 권한 설정
@@ -0,0 +1,149 @@
+"""근사 해시태그 집계 모듈 (Space-Saving)
+
+태그마다 항목을 두는 정확 집계 대신, 카운터 capacity개만 유지하는 Space-Saving 요약으로
+빈도 상위 태그(heavy hitter)를 찾습니다. 메모리는 고유 태그 수와 무관하게 고정됩니다.
+
+Space-Saving:
+    - 요약에 있는 태그는 카운터를 1 올립니다.
+    - 없는 태그는 빈 카운터가 있으면 새로 만들고, 가득 찼으면 카운트가 가장 작은(min) 태그를
+      내보낸 자리를 이어받습니다 (카운트 = min + 1, 오차 = min).
+    - 태그 출현 수가 N이면 min ≤ N / capacity 이므로, 실제 빈도가 N / capacity를 넘는 태그는
+      반드시 요약에 남고 모든 카운트의 과대 추정 오차는 N / capacity 이하입니다 (ε = 1 / capacity).
+
+카운트가 같은 태그끼리 묶은 버킷(카운트 → 태그 집합)으로 min 태그를 O(1)에 찾습니다.
+분석에는 "자리를 이어받은 뒤 실제로 센 값"(카운트 - 오차)과 그 구간의 인게이지먼트 합계 × 10,
+날짜별 집계를 사용하므로 보고하는 값은 실제 값의 하한입니다.
+"""
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# 카운터 수 하한 = Top N 해시태그 × 이 값 (ε가 커도 Top N 후보가 서로 밀어내지 않도록)
+MIN_CAPACITY_FACTOR = 10
+
+
+class SpaceSaving:
+    """Space-Saving 해시태그 요약
+
+    entries: 태그 → [카운트(상한), 오차, 인게이지먼트 합계 × 10, 첫 등장 순번, {날짜: [출현 수, 인게이지먼트 × 10]}]
+    (인게이지먼트/첫 등장/날짜는 요약에 들어온 뒤의 값)
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Space-Saving 카운터 수는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        self.entries: Dict[str, List] = {}
+        # 카운트 → 태그 집합 (dict를 삽입 순서 집합으로 사용)
+        self.buckets: Dict[int, Dict[str, None]] = {}
+        self.min_count = 0
+        self.total = 0          # 센 태그 출현 수 N
+        self.evictions = 0
+
+    @classmethod
+    def for_epsilon(cls, epsilon: float, minimum: int = 0) -> "SpaceSaving":
+        """빈도 오차 ≤ ε × N을 보장하는 카운터 수 (⌈1 / ε⌉, 최소 minimum개)"""
+        return cls(max(math.ceil(1 / epsilon), minimum, 1))
+
+    @property
+    def error_bound(self) -> int:
+        """현재 빈도 과대 추정 오차 상한 (요약이 가득 찼을 때의 min 카운트)"""
+        return self.min_count if len(self.entries) >= self.capacity else 0
+
+    @property
+    def max_error(self) -> int:
+        """추적 중인 태그 빈도 오차의 최댓값 (보고 빈도는 실제보다 최대 이만큼 적음)"""
+        return max((entry[1] for entry in self.entries.values()), default=0)
+
+    def add(self, tag: str, engagement_x10: int, day: Optional[int], seq: int):
+        """태그 출현 1회 누적"""
+        self.total += 1
+        entry = self.entries.get(tag)
+        if entry is None:
+            if len(self.entries) < self.capacity:
+                entry = self.entries[tag] = [1, 0, 0, seq, {}]
+                self.min_count = 1
+            else:
+                # min 태그 자리를 이어받음
+                low = self.min_count
+                bucket = self.buckets[low]
+                victim = next(iter(bucket))
+                del bucket[victim]
+                del self.entries[victim]
+                if not bucket:
+                    del self.buckets[low]
+                    self.min_count = low + 1
+                entry = self.entries[tag] = [low + 1, low, 0, seq, {}]
+                self.evictions += 1
+            self.buckets.setdefault(entry[0], {})[tag] = None
+        else:
+            count = entry[0]
+            bucket = self.buckets[count]
+            del bucket[tag]
+            if not bucket:
+                del self.buckets[count]
+                if count == self.min_count:
+                    self.min_count = count + 1
+            entry[0] = count + 1
+            self.buckets.setdefault(count + 1, {})[tag] = None
+
+        entry[2] += engagement_x10
+        if day is not None:
+            days = entry[4]
+            cell = days.get(day)
+            if cell is None:
+                days[day] = [1, engagement_x10]
+            else:
+                cell[0] += 1
+                cell[1] += engagement_x10
+
+    def merge(self, other: "SpaceSaving"):
+        """다른 요약을 합침 (겹치지 않는 포스트의 요약끼리, 오차 상한은 두 요약의 합)
+
+        한쪽에 없는 태그는 그 요약의 min 카운트(가득 찼을 때)를 카운트/오차에 더한 뒤
+        카운트 상위 capacity개만 남깁니다 (Agarwal et al., Mergeable Summaries).
+        """
+        floor_a, floor_b = self.error_bound, other.error_bound
+        merged: Dict[str, List] = {}
+        for tag, (count, error, engagement_x10, first_seq, days) in self.entries.items():
+            merged[tag] = [count + floor_b, error + floor_b, engagement_x10, first_seq, dict(days)]
+        for tag, (count, error, engagement_x10, first_seq, days) in other.entries.items():
+            entry = merged.get(tag)
+            if entry is None:
+                merged[tag] = [count + floor_a, error + floor_a, engagement_x10, first_seq,
+                               {day: list(cell) for day, cell in days.items()}]
+                continue
+            # self 쪽에서 미리 더한 floor_b를 other의 실제 값으로 교체
+            entry[0] += count - floor_b
+            entry[1] += error - floor_b
+            entry[2] += engagement_x10
+            entry[3] = min(entry[3], first_seq)
+            for day, (day_count, day_x10) in days.items():
+                cell = entry[4].get(day)
+                if cell is None:
+                    entry[4][day] = [day_count, day_x10]
+                else:
+                    entry[4][day] = [cell[0] + day_count, cell[1] + day_x10]
+
+        if len(merged) > self.capacity:
+            kept = sorted(merged.items(), key=lambda item: (-item[1][0], item[1][3]))[:self.capacity]
+            merged = dict(kept)
+        self.entries = merged
+        self.total += other.total
+        self.evictions += other.evictions
+        self.buckets = {}
+        for tag, entry in merged.items():
+            self.buckets.setdefault(entry[0], {})[tag] = None
+        self.min_count = min(self.buckets) if self.buckets else 0
+
+    def items(self) -> Iterator[Tuple[str, int, int, int]]:
+        """(태그, 실제로 센 출현 수, 인게이지먼트 합계 × 10, 첫 등장 순번) - 첫 등장 순서"""
+        ranked = sorted(self.entries.items(), key=lambda item: item[1][3])
+        for tag, (count, error, engagement_x10, first_seq, _) in ranked:
+            if count > error:
+                yield tag, count - error, engagement_x10, first_seq
+
+    def day_cell(self, tag: str, day: int) -> Optional[List[int]]:
+        """(태그, 날짜)의 [출현 수, 인게이지먼트 합계 × 10] (요약에 들어온 뒤 값)"""
+        entry = self.entries.get(tag)
+        return entry[4].get(day) if entry is not None else None
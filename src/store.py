@@ -0,0 +1,135 @@
+"""증분 수집용 계정별 포스트 저장소 모듈
+
+계정별로 지금까지 수집한 포스트와 워터마크(가장 최신 포스트 시각)를 디스크에 보관합니다.
+다음 실행에서는 워터마크 이후 포스트만 Apify에 요청하고, 저장된 이력과 합쳐 분석합니다.
+"""
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import StoreConfig
+from .schema import PostRecord, post_to_json
+
+
+def parse_post_time(post: Dict[str, Any]) -> Optional[datetime]:
+    """포스트 timestamp → naive datetime (파싱 불가 시 None)"""
+    timestamp = post.get("timestamp")
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).replace(tzinfo=None)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+class PostStore:
+    """계정별 포스트 이력 + 워터마크 저장소
+
+    파일 구조: <dir>/<content_type>/<username>.json
+        {"covered_since": ISO, "watermark": ISO, "posts": [...]} (포스트는 PostRecord 필드)
+
+    covered_since ~ watermark 구간은 빠짐없이 수집된 것으로 간주합니다.
+    """
+
+    def __init__(self, store_dir: str, retention_days: int):
+        self.store_dir = Path(os.path.expanduser(store_dir))
+        self.retention_days = retention_days
+
+    @classmethod
+    def from_config(cls, store_cfg: StoreConfig) -> Optional["PostStore"]:
+        """설정에서 저장소 생성 (증분 모드가 아니면 None)"""
+        if not store_cfg.incremental:
+            return None
+        return cls(store_cfg.dir, store_cfg.retention_days)
+
+    def _path(self, username: str, content_type: str) -> Path:
+        return self.store_dir / content_type / f"{username.lower()}.json"
+
+    def _load(self, username: str, content_type: str) -> Dict[str, Any]:
+        path = self._path(username, content_type)
+        if not path.exists():
+            return {"covered_since": None, "watermark": None, "posts": []}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save(self, username: str, content_type: str, entry: Dict[str, Any]):
+        path = self._path(username, content_type)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, default=post_to_json)
+        os.replace(tmp_path, path)
+
+    def fetch_from(self, username: str, content_type: str, since_date: datetime) -> datetime:
+        """이 계정에 대해 Apify에 요청해야 할 시작 시각
+
+        저장된 이력이 since_date부터 빈틈없이 있으면 워터마크 당일 0시부터, 아니면 since_date부터.
+        (onlyPostsNewerThan이 일 단위라 같은 날 워터마크를 가진 계정은 한 run으로 묶입니다)
+        """
+        entry = self._load(username, content_type)
+        if not entry["watermark"] or not entry["covered_since"]:
+            return since_date
+        covered_since = datetime.fromisoformat(entry["covered_since"])
+        watermark = datetime.fromisoformat(entry["watermark"])
+        if covered_since <= since_date <= watermark:
+            watermark_day = watermark.replace(hour=0, minute=0, second=0, microsecond=0)
+            return max(since_date, watermark_day)
+        return since_date
+
+    def merge(
+        self,
+        username: str,
+        content_type: str,
+        posts: List[Dict[str, Any]],
+        fetched_from: datetime,
+    ) -> int:
+        """새로 수집한 포스트를 이력에 병합하고 워터마크 갱신. 새로 추가된 개수 반환"""
+        entry = self._load(username, content_type)
+        by_url = {p.get("url", p.get("id")): p for p in entry["posts"]}
+        before = len(by_url)
+        for post in posts:
+            by_url[post.get("url", post.get("id"))] = post
+
+        # 보관 기간 지난 포스트 정리
+        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        merged = [p for p in by_url.values() if (parse_post_time(p) or datetime.now()) >= cutoff]
+        merged.sort(key=lambda p: parse_post_time(p) or datetime.min, reverse=True)
+
+        # 커버리지: 이전 구간과 이어지면 확장, 끊기면 새 구간으로 교체
+        prev_since = entry["covered_since"] and datetime.fromisoformat(entry["covered_since"])
+        prev_watermark = entry["watermark"] and datetime.fromisoformat(entry["watermark"])
+        if prev_since and prev_watermark and fetched_from <= prev_watermark:
+            covered_since = min(prev_since, fetched_from)
+        else:
+            covered_since = fetched_from
+        covered_since = max(covered_since, cutoff)
+
+        timestamps = [t for t in (parse_post_time(p) for p in merged) if t]
+        watermark = max(timestamps) if timestamps else prev_watermark or fetched_from
+        if prev_watermark:
+            watermark = max(watermark, prev_watermark)
+
+        self._save(username, content_type, {
+            "covered_since": covered_since.isoformat(),
+            "watermark": watermark.isoformat(),
+            "posts": merged,
+        })
+        return len(by_url) - before
+
+    def posts_between(
+        self,
+        usernames: List[str],
+        content_type: str,
+        since_date: datetime,
+        until_date: datetime,
+    ) -> List[PostRecord]:
+        """저장된 이력에서 기간 내 포스트 조회 (계정 순서 유지)"""
+        posts = []
+        for username in usernames:
+            for post in self._load(username, content_type)["posts"]:
+                post_time = parse_post_time(post)
+                if post_time is None or since_date <= post_time <= until_date:
+                    posts.append(PostRecord.from_item(post))
+        return posts
@@ -0,0 +1,109 @@
+"""해시태그 추세(모멘텀) 모듈
+
+해시태그 출현 수와 인게이지먼트를 (태그, 날짜) 단위로 집계한 뒤, 최근 구간과 직전 구간의
+구간 핫스코어를 비교해 성장 속도(velocity)와 가속도(acceleration)를 계산합니다.
+"📈 Rising" 등급은 고정 핫스코어 구간이 아니라 이 성장 속도로 판정합니다.
+
+구간 구성 (날짜는 포스트 timestamp의 UTC 날짜):
+    수집 기간 양 끝 날짜는 하루 중 일부만 포함될 수 있어 제외하고, 마지막 온전한 날짜부터
+    window일씩 거슬러 올라가며 [최근 | 직전 | 그 이전] 구간을 만듭니다.
+    직전 구간까지 없으면 추세를 계산하지 않고(등급은 기존 핫스코어 구간), 그 이전 구간이
+    없으면 가속도만 생략합니다.
+"""
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Sequence
+
+
+# 직전 구간 대비 성장률이 이 이상이면 Rising (+50%)
+RISING_VELOCITY = 0.5
+# 직전 구간 대비 성장률이 이 이하이면 하락세 (-50%)
+FALLING_VELOCITY = -0.5
+# 성장률 상한 (직전 구간에 없던 신규 태그도 이 값)
+MAX_VELOCITY = 10.0
+# Rising 판정에 필요한 최근 구간 최소 출현 수 (단발 태그 제외)
+MIN_RECENT_COUNT = 2
+
+
+@lru_cache(maxsize=4096)
+def _date_ordinal(day: str) -> int:
+    return date.fromisoformat(day).toordinal()
+
+
+def day_index(timestamp: Optional[str]) -> Optional[int]:
+    """ISO timestamp → 날짜 인덱스 (date.toordinal, 파싱 불가 시 None)"""
+    if not timestamp or not isinstance(timestamp, str):
+        return None
+    try:
+        return _date_ordinal(timestamp[:10])
+    except ValueError:
+        return None
+
+
+@dataclass
+class TagTrend:
+    """태그 1개의 구간 추세"""
+    velocity: float                 # 직전 구간 대비 구간 핫스코어 성장률 (0.5 = +50%)
+    acceleration: Optional[float]   # 성장률 변화 (최근 성장률 - 직전 성장률), 구간 부족 시 None
+    recent_count: int               # 최근 구간 출현 수
+    previous_count: int             # 직전 구간 출현 수
+
+
+@dataclass
+class TrendWindows:
+    """(태그, 날짜) 집계를 나눌 구간 경계
+
+    구간 k(0 = 최근, 1 = 직전, 2 = 그 이전)는 [end_day - (k+1)*window + 1, end_day - k*window] 날짜입니다.
+    """
+    end_day: int
+    window: int
+    count: int          # 2 (가속도 없음) 또는 3
+
+    @classmethod
+    def from_span(cls, min_day: Optional[int], max_day: Optional[int], window_days: int = 0) -> Optional["TrendWindows"]:
+        """관찰한 날짜 범위로 구간 구성 (window_days가 0이면 온전한 날짜 수 ÷ 3, 직전 구간이 없으면 None)"""
+        if min_day is None or max_day is None:
+            return None
+        first, last = min_day + 1, max_day - 1
+        full_days = last - first + 1
+        window = window_days if window_days > 0 else max(1, full_days // 3)
+        if full_days < window * 2:
+            return None
+        return cls(end_day=last, window=window, count=3 if full_days >= window * 3 else 2)
+
+    def window_of(self, day: int) -> int:
+        """날짜가 속한 구간 번호 (구간 밖이면 -1)"""
+        if day > self.end_day:
+            return -1
+        k = (self.end_day - day) // self.window
+        return k if k < self.count else -1
+
+    def days(self, k: int) -> range:
+        """구간 k의 날짜 범위"""
+        return range(self.end_day - (k + 1) * self.window + 1, self.end_day - k * self.window + 1)
+
+
+def _window_heat(count: int, engagement_x10: int) -> float:
+    """구간 핫스코어 = 출현 수 × 평균 인게이지먼트^0.3 (분석기 핫스코어와 같은 식)"""
+    avg_eng = engagement_x10 / 10 / count if count > 0 else 0
+    return count * (avg_eng ** 0.3) if avg_eng > 0 else 0
+
+
+def _growth(current: float, previous: float) -> float:
+    if previous > 0:
+        return min((current - previous) / previous, MAX_VELOCITY)
+    return MAX_VELOCITY if current > 0 else 0.0
+
+
+def tag_trend(counts: Sequence[int], engagement_x10: Sequence[int]) -> TagTrend:
+    """구간별 [최근, 직전, (그 이전)] 출현 수·인게이지먼트 합계 × 10 → TagTrend"""
+    heats = [_window_heat(c, e) for c, e in zip(counts, engagement_x10)]
+    velocity = _growth(heats[0], heats[1])
+    acceleration = velocity - _growth(heats[1], heats[2]) if len(heats) > 2 else None
+    return TagTrend(
+        velocity=velocity,
+        acceleration=acceleration,
+        recent_count=int(counts[0]),
+        previous_count=int(counts[1]),
+    )
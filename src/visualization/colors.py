@@ -48,6 +48,7 @@ SHEETS_GRADIENT = {
 SHEETS_TAB_COLORS = {
     "hashtag": {"red": 0.88, "green": 0.19, "blue": 0.42},   # 핑크
     "viral": {"red": 0.97, "green": 0.47, "blue": 0.22},     # 오렌지
+    "outlier": {"red": 0.99, "green": 0.11, "blue": 0.11},   # 빨강
     "insight": {"red": 0.99, "green": 0.69, "blue": 0.27},   # 노랑
     "glossary": {"red": 0.51, "green": 0.23, "blue": 0.71},  # 보라
     "info": {"red": 0.25, "green": 0.36, "blue": 0.90},      # 파랑